@@ -10,7 +10,7 @@ import subprocess  # nosec B404
 import sys
 import tempfile
 import time
-from typing import Any
+from typing import Any, Callable
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -35,6 +35,22 @@ WORKLOADS = (
 )
 
 
+# Inputs that drove collector regexes into quadratic backtracking, keyed by family. Each generator returns
+# (repo-relative path, text) for size *n*. They go straight to the extractors, bypassing the minified-line
+# cap, so single-line receiver runs stress the scanners at full length.
+ADVERSARIAL_INPUTS: dict[str, Callable[[int], tuple[str, str]]] = {
+    "innerhtml_without_semicolon": lambda n: ("public/app.js", "x.innerHTML = a\n" * n),
+    "innerhtml_receiver_run": lambda n: ("public/app.js", "a" * n + ".innerHTML" * 50 + " = 1"),
+    "unclosed_css_block": lambda n: ("public/app.css", ".app {\n" * n),
+    "unclosed_insert_template": lambda n: ("server/db.js", "db.run(`INSERT x\n" * n),
+    "route_receiver_run": lambda n: ("server/routes.js", "a" * n + ".post"),
+    "disabled_receiver_run": lambda n: ("public/app.js", "a." * n + "disabled = x"),
+    "unclosed_test_blocks": lambda n: ("tests/app.test.js", "it('a', () => {\n" * n),
+    "async_headers": lambda n: ("server/app.js", "async " * n),
+    "unclosed_http_exception": lambda n: ("app/api.py", "raise HTTPException(\n" * n),
+}
+
+
 @dataclass(frozen=True)
 class Sample:
     wall_ms: float
@@ -174,6 +190,44 @@ def _summarize(workload: Workload, samples: list[Sample]) -> dict[str, Any]:
     }
 
 
+def _scan_adversarial(relative_path: str, text: str) -> None:
+    from ai_risk_manager.collectors.anchored_scan import AnchorScanner
+    from ai_risk_manager.collectors.parse_cache import ParsedSource
+    from ai_risk_manager.collectors.plugins.express_artifacts import _extract_file_payload
+    from ai_risk_manager.pipeline.pr_change_signals import _ADDED_4XX_BRANCH_SCAN
+
+    if relative_path.endswith(".py"):
+        AnchorScanner(text).search(_ADDED_4XX_BRANCH_SCAN)
+        return
+    root = Path("/adversarial")
+    _extract_file_payload(root / relative_path, root, ParsedSource(text=text, lines=text.splitlines()))
+
+
+def _best_scan_ms(generate: Callable[[int], tuple[str, str]], size: int, repetitions: int) -> float:
+    relative_path, text = generate(size)
+    timings: list[float] = []
+    for _ in range(repetitions):
+        started = time.perf_counter()
+        _scan_adversarial(relative_path, text)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def measure_adversarial(base_size: int, scale: int, repetitions: int) -> dict[str, Any]:
+    """Time every adversarial family at *base_size* and *scale* times that; linear scans grow by about *scale*."""
+
+    results: dict[str, Any] = {}
+    for name, generate in ADVERSARIAL_INPUTS.items():
+        small_ms = _best_scan_ms(generate, base_size, repetitions)
+        large_ms = _best_scan_ms(generate, base_size * scale, repetitions)
+        results[name] = {
+            "sizes": [base_size, base_size * scale],
+            "best_ms": [round(small_ms, 3), round(large_ms, 3)],
+            "growth_ratio": round(large_ms / max(small_ms, 0.001), 2),
+        }
+    return results
+
+
 def evaluate_budgets(report: dict[str, Any], budgets: dict[str, Any]) -> list[str]:
     errors: list[str] = []
     for workload_name, limits in budgets["workloads"].items():
@@ -189,6 +243,22 @@ def evaluate_budgets(report: dict[str, Any], budgets: dict[str, Any]) -> list[st
             )
         if memory > limits["peak_rss_mb"]:
             errors.append(f"{workload_name} peak RSS {memory:.2f}MB exceeds {limits['peak_rss_mb']:.2f}MB")
+    adversarial = budgets.get("adversarial")
+    if adversarial is not None:
+        results = report.get("adversarial", {})
+        for name in ADVERSARIAL_INPUTS:
+            metrics = results.get(name)
+            if metrics is None:
+                errors.append(f"missing adversarial result: {name}")
+                continue
+            # Sub-floor timings are too noisy for a ratio to mean anything.
+            if metrics["best_ms"][-1] <= adversarial["noise_floor_ms"]:
+                continue
+            if metrics["growth_ratio"] > adversarial["max_growth_ratio"]:
+                errors.append(
+                    f"adversarial {name} grew {metrics['growth_ratio']:.2f}x for a "
+                    f"{adversarial['scale']}x larger input (limit {adversarial['max_growth_ratio']:.2f}x)"
+                )
     return errors
 
 
@@ -213,11 +283,14 @@ def _run_suite(repetitions: int, budgets_path: Path, output_path: Path | None, e
             ]
             results[workload.name] = _summarize(workload, samples)
 
-    report = {
+    report: dict[str, Any] = {
         "schema_version": "1.0",
         "measurement": "cold Python process, deterministic full analysis, complete JSON and Markdown artifacts",
         "workloads": results,
     }
+    adversarial = budgets.get("adversarial")
+    if adversarial is not None:
+        report["adversarial"] = measure_adversarial(adversarial["base_size"], adversarial["scale"], repetitions)
     rendered = json.dumps(report, indent=2, sort_keys=True) + "\n"
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
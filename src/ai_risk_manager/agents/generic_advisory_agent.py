@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import cast
 
 from ai_risk_manager.agents.llm_runtime import LLMRuntimeError, call_llm_json
+from ai_risk_manager.collectors.snapshot import RepoSnapshot
 from ai_risk_manager.schemas.types import Confidence, Finding, FindingsReport, Severity
 
 _MAX_CONTEXT_FILES = 24
@@ -69,12 +70,13 @@ def _generic_llm_max_retries() -> int:
     return value if value >= 0 else 0
 
 
-def _iter_context_files(repo_path: Path) -> list[Path]:
+def _iter_context_files(repo_path: Path, snapshot: RepoSnapshot | None = None) -> list[Path]:
     files: list[Path] = []
-    for path in sorted(repo_path.rglob("*")):
+    candidates = snapshot.files if snapshot is not None and snapshot.repo_path == repo_path else sorted(repo_path.rglob("*"))
+    for path in candidates:
         if any(part in _EXCLUDED_DIRS for part in path.parts):
             continue
-        if not path.is_file():
+        if snapshot is None and not path.is_file():
             continue
         if path.suffix.lower() not in _ALLOWED_SUFFIXES and path.name not in _ALLOWED_FILENAMES:
             continue
@@ -93,9 +95,9 @@ def _read_snippet(path: Path) -> str:
     return "\n".join(f"{idx}: {line}" for idx, line in enumerate(snippet_lines, start=1)).strip()
 
 
-def _repo_context(repo_path: Path) -> dict[str, object]:
+def _repo_context(repo_path: Path, snapshot: RepoSnapshot | None = None) -> dict[str, object]:
     items: list[dict[str, str]] = []
-    for path in _iter_context_files(repo_path):
+    for path in _iter_context_files(repo_path, snapshot):
         snippet = _read_snippet(path)
         if not snippet:
             continue
@@ -165,11 +167,12 @@ def generate_generic_advisory_findings(
     *,
     provider: str,
     generated_without_llm: bool,
+    snapshot: RepoSnapshot | None = None,
 ) -> tuple[FindingsReport, list[str]]:
     if generated_without_llm or provider == "none":
         return FindingsReport(findings=[], generated_without_llm=True), ["Generic advisory AI stage skipped (no LLM backend)."]
 
-    context = _repo_context(repo_path)
+    context = _repo_context(repo_path, snapshot)
     if not context["files"]:
         return FindingsReport(findings=[], generated_without_llm=True), ["Generic advisory AI stage skipped (no readable repo context)."]
 
@@ -18,6 +18,19 @@ def write_text_atomic(path: Path, text: str) -> None:
         temporary_path.unlink(missing_ok=True)
 
 
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace a binary artifact atomically without exposing a partial target file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temporary_path.open("xb") as file_handle:
+            file_handle.write(data)
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
 def write_text_new_atomic(path: Path, text: str) -> None:
     """Create a text artifact atomically and fail if the target already exists."""
 
@@ -31,4 +44,4 @@ def write_text_new_atomic(path: Path, text: str) -> None:
         temporary_path.unlink(missing_ok=True)
 
 
-__all__ = ["write_text_atomic", "write_text_new_atomic"]
+__all__ = ["write_bytes_atomic", "write_text_atomic", "write_text_new_atomic"]
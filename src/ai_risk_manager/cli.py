@@ -76,6 +76,32 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Return exit code 3 if finding severity at or above threshold exists",
     )
     analyze.add_argument("--suppress-file", default=None, help="Path to .airiskignore suppression file")
+    analyze.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse per-file collector output for unchanged files across runs (for example .riskmap/cache).",
+    )
+    analyze.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Collector worker processes (0 = one per CPU). Defaults to AIRISK_JOBS or 1.",
+    )
+    analyze.add_argument(
+        "--multi-stack",
+        action="store_true",
+        help="Collect every detected stack (for example a FastAPI backend and an Express BFF) in one run.",
+    )
+    analyze.add_argument(
+        "--l0-depth",
+        type=int,
+        choices=[0, 1, 2],
+        default=2,
+        help=(
+            "Universal (L0) collection depth for unknown stacks: 0 = paths and manifests only, "
+            "1 = also byte-prefiltered JS test scans, 2 = also parse candidate Python tests."
+        ),
+    )
     analyze.add_argument(
         "--sample",
         action="store_true",
@@ -326,6 +352,7 @@ def _run_analyze(args: argparse.Namespace) -> int:
     output_dir = Path(args.output_dir).resolve()
     baseline_graph = Path(args.baseline_graph).resolve() if args.baseline_graph else None
     suppress_file = Path(args.suppress_file).resolve() if args.suppress_file else None
+    cache_dir = Path(args.cache_dir).resolve() if args.cache_dir else None
 
     ctx = build_run_context(
         repo_path=repo_path,
@@ -344,6 +371,10 @@ def _run_analyze(args: argparse.Namespace) -> int:
         ci_mode=normalize_cli_choice(args.ci_mode),
         support_level=args.support_level,
         risk_policy=args.risk_policy,
+        cache_dir=cache_dir,
+        jobs=args.jobs,
+        multi_stack=args.multi_stack,
+        l0_depth=args.l0_depth,
     )
 
     result, exit_code, notes = run_pipeline(ctx)
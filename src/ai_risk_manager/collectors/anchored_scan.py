@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+import re
+
+# ``re.IGNORECASE`` also folds these non-ASCII characters onto ASCII letters, so anchor lookups fold them too.
+_CASE_FOLD: dict[int, int | str] = {
+    **{code: code + 32 for code in range(ord("A"), ord("Z") + 1)},
+    0x130: "i",
+    0x131: "i",
+    0x17F: "s",
+    0x212A: "k",
+}
+
+
+@dataclass(frozen=True)
+class AnchoredPattern:
+    """A regex plus the literal anchors that locate its matches.
+
+    Every match must start at an occurrence of one of ``anchors``, or inside the run of ``lead`` characters
+    that immediately precedes one (an identifier receiver such as ``router`` in ``router.post(``). Each of
+    ``required`` must occur somewhere in the text for any match to exist. Anchors and required literals are
+    lowercase when the pattern ignores case. Without anchors the pattern is scanned end to end once its
+    required literals are present.
+
+    ``head`` is a prefix of ``pattern`` that bounds retries after a failed attempt. For ``lead`` patterns, a
+    start where ``head`` matches but ``pattern`` fails ends that receiver run, because later starts only
+    shorten the receiver. With ``lazy_tail`` (``pattern`` continues after ``head`` with a lazy any-character
+    span, as in ``db.run(`INSERT ...`` or a test callback body) the failure also ends the scan: the span could
+    have absorbed any match starting after the head, so none exists. Without a head, a file of unterminated
+    spans costs one scan to the end of the text per anchor.
+    """
+
+    pattern: re.Pattern[str]
+    anchors: tuple[str, ...] = ()
+    lead: frozenset[str] = frozenset()
+    required: tuple[str, ...] = ()
+    head: re.Pattern[str] | None = None
+    lazy_tail: bool = True
+
+    @property
+    def ignore_case(self) -> bool:
+        return bool(self.pattern.flags & re.IGNORECASE)
+
+
+class AnchorScanner:
+    """Run many anchored patterns over one text without scanning it end to end once per pattern.
+
+    Anchor positions come from ``str.find`` over the text (or its case-folded copy) and are cached, so
+    patterns sharing an anchor share the lookup. A pattern whose anchors or required literals are absent
+    costs a few ``find`` calls. Otherwise the regex is only tried at candidate starts next to anchors.
+    Results are identical to ``pattern.finditer(text)``.
+    """
+
+    __slots__ = ("_folded", "_positions", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._folded: str | None = None
+        self._positions: dict[tuple[str, bool], list[int]] = {}
+
+    def _haystack(self, ignore_case: bool) -> str:
+        if not ignore_case:
+            return self.text
+        if self._folded is None:
+            text = self.text
+            self._folded = text.lower() if text.isascii() else text.translate(_CASE_FOLD)
+        return self._folded
+
+    def positions(self, literal: str, *, ignore_case: bool = False) -> list[int]:
+        """Return every (possibly overlapping) start offset of *literal*."""
+
+        key = (literal, ignore_case)
+        cached = self._positions.get(key)
+        if cached is not None:
+            return cached
+        find = self._haystack(ignore_case).find
+        found: list[int] = []
+        position = find(literal)
+        while position != -1:
+            found.append(position)
+            position = find(literal, position + 1)
+        self._positions[key] = found
+        return found
+
+    def contains(self, literal: str, *, ignore_case: bool = False) -> bool:
+        key = (literal, ignore_case)
+        if key in self._positions:
+            return bool(self._positions[key])
+        return literal in self._haystack(ignore_case)
+
+    def finditer(self, anchored: AnchoredPattern) -> Iterator[re.Match[str]]:
+        """Yield the matches ``anchored.pattern.finditer(text)`` would, trying the regex only near anchors."""
+
+        ignore_case = anchored.ignore_case
+        if not all(self.contains(literal, ignore_case=ignore_case) for literal in anchored.required):
+            return
+        text = self.text
+        if not anchored.anchors:
+            yield from anchored.pattern.finditer(text)
+            return
+
+        windows = self._windows(anchored, ignore_case)
+        match_at = anchored.pattern.match
+        head_at = anchored.head.match if anchored.head is not None else None
+        next_start = 0
+        dead_from = len(text) + 1
+        for low, high in windows:
+            for start in range(max(low, next_start), high + 1):
+                if start >= dead_from:
+                    return
+                match = match_at(text, start)
+                if match is not None:
+                    yield match
+                    # Like ``finditer``, resume after the match, or one past an empty match.
+                    next_start = match.end() if match.end() > start else start + 1
+                    break
+                if head_at is not None and (head := head_at(text, start)) is not None:
+                    if anchored.lazy_tail:
+                        dead_from = min(dead_from, head.end())
+                    if anchored.lead:
+                        next_start = max(next_start, high + 1)
+                        break
+            else:
+                next_start = max(next_start, high + 1)
+
+    def search(self, anchored: AnchoredPattern) -> re.Match[str] | None:
+        return next(self.finditer(anchored), None)
+
+    def _windows(self, anchored: AnchoredPattern, ignore_case: bool) -> list[tuple[int, int]]:
+        positions = sorted(
+            {position for anchor in anchored.anchors for position in self.positions(anchor, ignore_case=ignore_case)}
+        )
+        lead = anchored.lead
+        if not lead:
+            return [(position, position) for position in positions]
+        haystack = self._haystack(ignore_case)
+        windows: list[tuple[int, int]] = []
+        previous, previous_low = -1, -1
+        for position in positions:
+            low = position
+            while low > 0 and haystack[low - 1] in lead:
+                low -= 1
+                if low == previous:
+                    # The run reaches the previous anchor, so it continues back exactly as that anchor's did.
+                    low = previous_low
+                    break
+            windows.append((low, position))
+            previous, previous_low = position, low
+        return windows
+
+
+__all__ = ["AnchorScanner", "AnchoredPattern"]
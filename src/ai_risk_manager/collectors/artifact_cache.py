@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from ai_risk_manager import __version__
+from ai_risk_manager.artifact_io import write_bytes_atomic
+
+ARTIFACT_CACHE_FORMAT_VERSION = 1
+ARTIFACT_CACHE_FILENAME = f"artifacts-v{ARTIFACT_CACHE_FORMAT_VERSION}.json.gz"
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Field codecs: ``None`` stores rows as plain tuples, a dataclass type stores rows positionally.
+RowCodec = type | None
+FilePayload = dict[str, list[Any]]
+
+
+class ArtifactCacheFormatError(ValueError):
+    """Raised when a persisted cache index or entry does not match the expected layout."""
+
+
+@dataclass
+class _CacheEntry:
+    payload: dict[str, list[list[Any]]]
+    size: int
+    last_used: int
+
+
+def _max_bytes_from_env() -> int:
+    raw = os.getenv("AIRISK_CACHE_MAX_BYTES", str(DEFAULT_ARTIFACT_CACHE_MAX_BYTES))
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+    return value if value >= 0 else DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+
+
+def _encoded_size(payload: Mapping[str, object]) -> int:
+    return len(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+
+
+def _encode_payload(payload: FilePayload, codecs: Mapping[str, RowCodec]) -> dict[str, list[list[Any]]]:
+    encoded: dict[str, list[list[Any]]] = {}
+    for name, rows in payload.items():
+        if name not in codecs:
+            raise ArtifactCacheFormatError(f"No cache codec registered for field {name!r}.")
+        if not rows:
+            continue
+        codec = codecs[name]
+        if codec is None:
+            encoded[name] = [list(row) for row in rows]
+        else:
+            names = [item.name for item in fields(codec)]
+            encoded[name] = [[getattr(row, item) for item in names] for row in rows]
+    return encoded
+
+
+def _decode_payload(raw: object, codecs: Mapping[str, RowCodec]) -> FilePayload:
+    if not isinstance(raw, dict):
+        raise ArtifactCacheFormatError("Cache entry payload must be an object.")
+    decoded: FilePayload = {}
+    for name, rows in raw.items():
+        if name not in codecs or not isinstance(rows, list):
+            raise ArtifactCacheFormatError(f"Unexpected cache field {name!r}.")
+        codec = codecs[name]
+        decoded_rows = decoded.setdefault(name, [])
+        for row in rows:
+            if not isinstance(row, list):
+                raise ArtifactCacheFormatError(f"Cache rows for {name!r} must be arrays.")
+            try:
+                decoded_rows.append(tuple(row) if codec is None else codec(*row))
+            except TypeError as exc:
+                raise ArtifactCacheFormatError(f"Cache row for {name!r} does not match its codec.") from exc
+    return decoded
+
+
+def artifact_cache_key(
+    *,
+    namespace: str,
+    collector_version: str,
+    relative_path: str,
+    blob_id: str,
+    context: str = "",
+) -> str:
+    """Build the cache key for one file's collector output.
+
+    The key covers the analyzer release, the collector's own version, the repository-relative path
+    (extractors classify files by path), the file content hash, and any cross-file *context* digest.
+    """
+
+    material = "\0".join(
+        [str(ARTIFACT_CACHE_FORMAT_VERSION), __version__, namespace, collector_version, relative_path, blob_id, context]
+    )
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+
+def context_digest(value: object) -> str:
+    """Return a stable digest for JSON-compatible cross-file context such as route maps."""
+
+    return hashlib.sha1(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ArtifactCache:
+    """Per-file collector output persisted between runs in a single compressed, versioned index.
+
+    Loading never fails: a missing, truncated, or incompatible index starts an empty cache and records
+    ``load_error``. Saving evicts least-recently-used entries until the index fits ``max_bytes``. Lookups
+    and stores are serialized, so collectors running concurrently can share one cache.
+    """
+
+    path: Path
+    max_bytes: int = DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+    generation: int = 1
+    hits: int = 0
+    misses: int = 0
+    load_error: str | None = None
+    _entries: dict[str, _CacheEntry] = field(default_factory=dict, repr=False)
+    _dirty: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @classmethod
+    def load(cls, cache_dir: Path, *, max_bytes: int | None = None) -> ArtifactCache:
+        cache = cls(
+            path=cache_dir / ARTIFACT_CACHE_FILENAME,
+            max_bytes=_max_bytes_from_env() if max_bytes is None else max_bytes,
+        )
+        if not cache.path.is_file():
+            return cache
+        try:
+            document = json.loads(gzip.decompress(cache.path.read_bytes()).decode("utf-8"))
+            cache._read_document(document)
+        except (OSError, EOFError, UnicodeDecodeError, ValueError, TypeError, KeyError) as exc:
+            cache._entries.clear()
+            cache.generation = 1
+            cache.load_error = f"{type(exc).__name__}: {exc}"
+            cache._dirty = True
+        return cache
+
+    def _read_document(self, document: object) -> None:
+        if not isinstance(document, dict) or document.get("format_version") != ARTIFACT_CACHE_FORMAT_VERSION:
+            raise ArtifactCacheFormatError("Unsupported artifact cache format version.")
+        generation = document["generation"]
+        entries = document["entries"]
+        if not isinstance(generation, int) or not isinstance(entries, dict):
+            raise ArtifactCacheFormatError("Malformed artifact cache index.")
+        for key, raw_entry in entries.items():
+            last_used, payload = raw_entry
+            if not isinstance(last_used, int) or not isinstance(payload, dict):
+                raise ArtifactCacheFormatError(f"Malformed artifact cache entry {key!r}.")
+            self._entries[key] = _CacheEntry(payload=payload, size=_encoded_size(payload), last_used=last_used)
+        self.generation = generation + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str, codecs: Mapping[str, RowCodec]) -> FilePayload | None:
+        with self._lock:
+            return self._lookup(key, codecs)
+
+    def _lookup(self, key: str, codecs: Mapping[str, RowCodec]) -> FilePayload | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            payload = _decode_payload(entry.payload, codecs)
+        except ArtifactCacheFormatError:
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        if entry.last_used != self.generation:
+            entry.last_used = self.generation
+            self._dirty = True
+        self.hits += 1
+        return payload
+
+    def store(self, key: str, payload: FilePayload, codecs: Mapping[str, RowCodec]) -> None:
+        encoded = _encode_payload(payload, codecs)
+        entry = _CacheEntry(payload=encoded, size=_encoded_size(encoded), last_used=self.generation)
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def _evict(self) -> None:
+        total = sum(entry.size for entry in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self._entries, key=lambda item: (self._entries[item].last_used, item)):
+            total -= self._entries.pop(key).size
+            if total <= self.max_bytes:
+                break
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self._evict()
+        document = {
+            "format_version": ARTIFACT_CACHE_FORMAT_VERSION,
+            "generation": self.generation,
+            "entries": {key: [entry.last_used, entry.payload] for key, entry in sorted(self._entries.items())},
+        }
+        data = json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        write_bytes_atomic(self.path, gzip.compress(data, mtime=0))
+        self._dirty = False
+
+
+def cached_file_payload(
+    cache: ArtifactCache | None,
+    *,
+    namespace: str,
+    collector_version: str,
+    relative_path: str,
+    blob_id: str,
+    codecs: Mapping[str, RowCodec],
+    compute: Callable[[], FilePayload],
+    context: str = "",
+) -> FilePayload:
+    """Return one file's collector output from *cache*, computing and storing it on a miss."""
+
+    if cache is None or not blob_id:
+        return compute()
+    key = artifact_cache_key(
+        namespace=namespace,
+        collector_version=collector_version,
+        relative_path=relative_path,
+        blob_id=blob_id,
+        context=context,
+    )
+    cached = cache.lookup(key, codecs)
+    if cached is not None:
+        return cached
+    payload = compute()
+    cache.store(key, payload, codecs)
+    return payload
+
+
+__all__ = [
+    "ARTIFACT_CACHE_FILENAME",
+    "ARTIFACT_CACHE_FORMAT_VERSION",
+    "ArtifactCache",
+    "ArtifactCacheFormatError",
+    "FilePayload",
+    "RowCodec",
+    "artifact_cache_key",
+    "cached_file_payload",
+    "context_digest",
+]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import re
+
+_SETTINGS_FILENAMES = (".riskmap.yml", ".riskmap.yaml")
+_TRUE_VALUES = {"true", "yes", "on", "1"}
+
+
+def _glob_to_regex(pattern: str) -> str | None:
+    """Translate one gitignore-style glob into a regex over repository-relative POSIX paths."""
+
+    pattern = pattern.strip()
+    if not pattern or pattern.startswith(("#", "!")):
+        return None
+    directory_only = pattern.endswith("/")
+    body = pattern.strip("/")
+    if not body:
+        return None
+    # As in .gitignore, a slash at the start or in the middle anchors the pattern to the repository root.
+    anchored = pattern.startswith("/") or "/" in body
+
+    parts: list[str] = []
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if body.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if body.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and (end := body.find("]", index + 1)) > index + 1:
+            inner = body[index + 1 : end]
+            if inner.startswith("!"):
+                inner = "^" + inner[1:]
+            parts.append(f"[{inner.replace(chr(92), chr(92) * 2)}]")
+            index = end + 1
+            continue
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    # A matched directory excludes everything beneath it; ``dir/`` patterns match directories only.
+    suffix = "/.*" if directory_only else "(?:/.*)?"
+    return f"{prefix}{''.join(parts)}{suffix}"
+
+
+def compile_exclude_globs(patterns: tuple[str, ...] | list[str]) -> re.Pattern[str] | None:
+    """Compile gitignore-style globs into one matcher, or ``None`` when there is nothing to match."""
+
+    regexes = [regex for pattern in patterns if (regex := _glob_to_regex(pattern)) is not None]
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
+@dataclass(frozen=True)
+class ExclusionRules:
+    """Repository-owned discovery exclusions read from ``.riskmap.yml``.
+
+    ``patterns`` are gitignore-style globs (``**/generated/**``, ``*.min.js``, ``openapi_client/``) matched
+    against repository-relative paths. ``skip_generated`` (off unless ``exclude_generated: true``) skips files whose
+    header carries a generator marker or whose lines are minified-length.
+    """
+
+    patterns: tuple[str, ...] = ()
+    skip_generated: bool = False
+    _matcher: re.Pattern[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_matcher", compile_exclude_globs(self.patterns))
+
+    def excludes(self, relative_path: str) -> bool:
+        """Return whether a repository-relative POSIX file or directory path is excluded."""
+
+        return self._matcher is not None and self._matcher.fullmatch(relative_path) is not None
+
+
+def _clean_value(value: str) -> str:
+    return value.strip().strip('"').strip("'").strip()
+
+
+def _parse_values(raw_value: str) -> list[str]:
+    raw_value = raw_value.strip()
+    if raw_value.startswith("[") and raw_value.endswith("]"):
+        return [cleaned for part in raw_value[1:-1].split(",") if (cleaned := _clean_value(part))]
+    return [cleaned] if (cleaned := _clean_value(raw_value)) else []
+
+
+def _strip_comment(line: str) -> str:
+    # Comments start at `` #`` outside quotes; globs themselves never contain that sequence.
+    quote: str | None = None
+    for index, char in enumerate(line):
+        if char in "\"'" and quote in (None, char):
+            quote = None if quote == char else char
+        elif char == "#" and quote is None and (index == 0 or line[index - 1].isspace()):
+            return line[:index].rstrip()
+    return line.rstrip()
+
+
+def parse_exclusion_settings(text: str) -> ExclusionRules:
+    """Read the top-level ``exclude`` list and ``exclude_generated`` flag from ``.riskmap.yml`` text."""
+
+    patterns: list[str] = []
+    skip_generated = False
+    in_exclude = False
+    for raw_line in text.splitlines():
+        line = _strip_comment(raw_line)
+        if not line.strip():
+            continue
+        if not line[0].isspace():
+            key, _, raw_value = line.partition(":")
+            key = key.strip()
+            in_exclude = key == "exclude"
+            if in_exclude:
+                patterns.extend(_parse_values(raw_value))
+            elif key == "exclude_generated":
+                skip_generated = _clean_value(raw_value).lower() in _TRUE_VALUES
+            continue
+        content = line.strip()
+        if in_exclude and content.startswith("- "):
+            patterns.extend(_parse_values(content[2:]))
+    return ExclusionRules(patterns=tuple(patterns), skip_generated=skip_generated)
+
+
+def load_exclusion_rules(repo_path: Path) -> ExclusionRules:
+    """Load exclusions from the analyzed root's ``.riskmap.yml``; missing or unreadable files exclude nothing."""
+
+    for filename in _SETTINGS_FILENAMES:
+        path = repo_path / filename
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        return parse_exclusion_settings(text)
+    return ExclusionRules()
+
+
+__all__ = ["ExclusionRules", "compile_exclude_globs", "load_exclusion_rules", "parse_exclusion_settings"]
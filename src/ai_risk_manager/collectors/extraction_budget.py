@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import os
+import signal
+import threading
+from types import FrameType
+
+DEFAULT_FILE_CPU_BUDGET = 20.0
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside per-file extraction when the file exhausts its CPU budget."""
+
+
+def file_cpu_budget() -> float:
+    """Return the per-file extraction CPU budget in seconds from ``AIRISK_FILE_CPU_BUDGET``; ``0`` disables it."""
+
+    raw = os.getenv("AIRISK_FILE_CPU_BUDGET", str(DEFAULT_FILE_CPU_BUDGET))
+    try:
+        value = float(raw)
+    except ValueError:
+        return DEFAULT_FILE_CPU_BUDGET
+    return value if value >= 0 else DEFAULT_FILE_CPU_BUDGET
+
+
+def _raise_timeout(signum: int, frame: FrameType | None) -> None:
+    raise ExtractionTimeout
+
+
+@contextmanager
+def cpu_budget(seconds: float) -> Iterator[None]:
+    """Raise ``ExtractionTimeout`` in the block once it has used *seconds* of process CPU time.
+
+    ``re`` checks for signals while matching, so a runaway pattern is interrupted mid-scan. The budget is a
+    no-op when *seconds* is ``0``, on platforms without ``setitimer``, and off the main thread, where signal
+    handlers cannot be installed; worker processes always extract on their main thread.
+    """
+
+    if (
+        seconds <= 0
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+    previous = signal.signal(signal.SIGPROF, _raise_timeout)
+    signal.setitimer(signal.ITIMER_PROF, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+
+__all__ = ["DEFAULT_FILE_CPU_BUDGET", "ExtractionTimeout", "cpu_budget", "file_cpu_budget"]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_WORKFLOW_SUFFIXES = {".yml", ".yaml"}
+_TEST_NAME_SUFFIXES = ("_test.py", ".test.js", ".spec.js", ".test.ts", ".spec.ts", ".test.tsx", ".spec.tsx")
+_TEST_DIR_NAMES = {"__tests__", "tests", "test"}
+
+
+def is_test_path(path: Path) -> bool:
+    """Return whether *path* looks like a Python or JS/TS test file by name or test directory."""
+
+    lowered_name = path.name.lower()
+    return (
+        lowered_name.startswith("test_")
+        or lowered_name.endswith(_TEST_NAME_SUFFIXES)
+        or any(part.lower() in _TEST_DIR_NAMES for part in path.parts)
+    )
+
+
+def is_python_test_path(path: Path) -> bool:
+    """Return whether a ``.py`` *path* is a pytest-style test module (``test_*.py`` or ``*_test.py``)."""
+
+    return path.name.startswith("test_") or path.name.endswith("_test.py")
+
+
+def is_workflow_path(path: Path) -> bool:
+    return path.suffix.lower() in _WORKFLOW_SUFFIXES and ".github" in path.parts and "workflows" in path.parts
+
+
+def is_requirements_path(path: Path) -> bool:
+    return path.suffix == ".txt" and (path.name.startswith("requirements") or path.name.startswith("constraints"))
+
+
+@dataclass
+class FileCatalog:
+    """Discovered files bucketed once by suffix, filename, and role, with O(1) membership checks.
+
+    Every bucket preserves discovery order, so collectors that iterate a bucket see the same order
+    as a filtered scan over all files.
+    """
+
+    files: list[Path] = field(default_factory=list)
+    by_suffix: dict[str, list[Path]] = field(default_factory=dict)
+    by_name: dict[str, list[Path]] = field(default_factory=dict)
+    test_files: list[Path] = field(default_factory=list)
+    python_test_files: list[Path] = field(default_factory=list)
+    workflow_files: list[Path] = field(default_factory=list)
+    requirements_files: list[Path] = field(default_factory=list)
+    _order: dict[Path, int] = field(default_factory=dict, repr=False)
+    _test_set: set[Path] = field(default_factory=set, repr=False)
+    _python_test_set: set[Path] = field(default_factory=set, repr=False)
+
+    def add(self, path: Path) -> None:
+        if path in self._order:
+            return
+        self._order[path] = len(self.files)
+        self.files.append(path)
+        suffix = path.suffix.lower()
+        self.by_suffix.setdefault(suffix, []).append(path)
+        self.by_name.setdefault(path.name, []).append(path)
+        if is_test_path(path):
+            self.test_files.append(path)
+            self._test_set.add(path)
+        if suffix == ".py" and is_python_test_path(path):
+            self.python_test_files.append(path)
+            self._python_test_set.add(path)
+        if is_workflow_path(path):
+            self.workflow_files.append(path)
+        if is_requirements_path(path):
+            self.requirements_files.append(path)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._order
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def _in_discovery_order(self, groups: list[list[Path]]) -> list[Path]:
+        if len(groups) == 1:
+            return list(groups[0])
+        return sorted((path for group in groups for path in group), key=self._order.__getitem__)
+
+    def with_suffix(self, *suffixes: str) -> list[Path]:
+        """Return files whose lowercased suffix matches, preserving discovery order."""
+
+        return self._in_discovery_order([self.by_suffix.get(suffix, []) for suffix in {item.lower() for item in suffixes}])
+
+    def named(self, *names: str) -> list[Path]:
+        """Return files whose exact filename matches, preserving discovery order."""
+
+        return self._in_discovery_order([self.by_name.get(name, []) for name in set(names)])
+
+    def is_test_file(self, path: Path) -> bool:
+        return path in self._test_set
+
+    def is_python_test_file(self, path: Path) -> bool:
+        return path in self._python_test_set
+
+
+__all__ = [
+    "FileCatalog",
+    "is_python_test_path",
+    "is_requirements_path",
+    "is_test_path",
+    "is_workflow_path",
+]
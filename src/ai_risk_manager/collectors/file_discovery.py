@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import os
 from pathlib import Path
+import re
+import stat
 import subprocess  # nosec B404
 
+from ai_risk_manager.collectors.exclusions import ExclusionRules, load_exclusion_rules
+
+_REGULAR_FILE_MODES = {"100644", "100755"}
+_GITLINK_MODE = "160000"
 
 _EXCLUDED_DIR_NAMES = {
     ".git",
@@ -35,13 +42,25 @@ _EXCLUDED_DIR_NAMES = {
 }
 
 
-def _is_virtualenv_dir(name: str) -> bool:
-    lowered = name.lower()
-    return lowered == ".venv" or lowered.startswith(".venv-") or lowered.startswith("venv-")
+@dataclass(frozen=True)
+class FileStat:
+    """Discovery metadata: git index object ID for clean tracked files, otherwise size and modification time."""
+
+    size: int | None = None
+    mtime_ns: int | None = None
+    blob_id: str = ""
+
 
+# Built-in directory names plus virtualenv variants (``.venv``, ``.venv-*``, ``venv-*``), compiled once.
+_EXCLUDED_DIR_PATTERN = "|".join(
+    [*(re.escape(name) for name in sorted(_EXCLUDED_DIR_NAMES)), r"\.venv(?:-[^/]*)?", r"venv-[^/]*"]
+)
+_EXCLUDED_DIR_NAME_RE = re.compile(f"(?:{_EXCLUDED_DIR_PATTERN})", re.IGNORECASE)
+_EXCLUDED_DIR_COMPONENT_RE = re.compile(f"(?:^|/)(?:{_EXCLUDED_DIR_PATTERN})/", re.IGNORECASE)
 
-def _is_excluded_relative_path(path: Path) -> bool:
-    return any(part.lower() in _EXCLUDED_DIR_NAMES or _is_virtualenv_dir(part) for part in path.parts[:-1])
+
+def _is_excluded_relative_path(relative_path: str, rules: ExclusionRules) -> bool:
+    return _EXCLUDED_DIR_COMPONENT_RE.search(relative_path) is not None or rules.excludes(relative_path)
 
 
 def _is_within_repo(path: Path, repo_root: Path) -> bool:
@@ -52,10 +71,56 @@ def _is_within_repo(path: Path, repo_root: Path) -> bool:
     return True
 
 
-def _git_visible_paths(repo_root: Path) -> list[Path] | None:
+def _regular_file_stat(path: Path) -> os.stat_result | None:
+    try:
+        result = path.stat()
+    except OSError:
+        return None
+    return result if stat.S_ISREG(result.st_mode) else None
+
+
+def _stat_visible_file(candidate: Path, repo_root: Path) -> FileStat | None:
+    file_stat = _regular_file_stat(candidate)
+    if file_stat is None or not _is_within_repo(candidate, repo_root):
+        return None
+    return FileStat(size=file_stat.st_size, mtime_ns=file_stat.st_mtime_ns)
+
+
+def _parse_ls_files_record(record: bytes) -> tuple[str, str, str, str] | None:
+    """Split one ``git ls-files -t -s`` record into (tag, mode, object ID, path); untracked rows have no mode."""
+
+    tag, _, rest = record.partition(b" ")
+    if tag == b"?":
+        return "?", "", "", os.fsdecode(rest)
+    meta, tab, raw_path = rest.partition(b"\t")
+    fields = meta.split(b" ")
+    if not tab or len(fields) != 3:
+        return None
+    mode, object_id, stage = (field.decode("ascii", "replace") for field in fields)
+    if stage != "0":
+        # Unmerged entries carry conflict-stage blobs, not the working-tree content.
+        tag = b"M"
+    return tag.decode("ascii", "replace"), mode, object_id, os.fsdecode(raw_path)
+
+
+def _git_visible_paths(repo_root: Path, rules: ExclusionRules) -> list[tuple[Path, FileStat]] | None:
+    # One pass lists indexed blobs with their object IDs (H), working-tree changes (C, R), and untracked files (?).
+    # Paths stay relative to ``repo_root``; porcelain ``git status`` would report them from the repository top level.
     try:
         proc = subprocess.run(  # nosec B603
-            ["git", "-C", str(repo_root), "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            [
+                "git",
+                "-C",
+                str(repo_root),
+                "ls-files",
+                "-z",
+                "-t",
+                "-s",
+                "--cached",
+                "--modified",
+                "--others",
+                "--exclude-standard",
+            ],
             capture_output=True,
             check=False,
             timeout=20,
@@ -65,42 +130,80 @@ def _git_visible_paths(repo_root: Path) -> list[Path] | None:
     if proc.returncode != 0:
         return None
 
-    paths: list[Path] = []
-    for raw_path in proc.stdout.split(b"\0"):
-        if not raw_path:
+    indexed: dict[Path, tuple[str, str]] = {}
+    needs_stat: dict[Path, None] = {}
+    for record in proc.stdout.split(b"\0"):
+        if not record:
             continue
-        relative_path = Path(os.fsdecode(raw_path))
-        if relative_path.is_absolute() or _is_excluded_relative_path(relative_path):
+        parsed = _parse_ls_files_record(record)
+        if parsed is None:
             continue
+        tag, mode, object_id, relative_name = parsed
+        if relative_name.startswith("/") or _is_excluded_relative_path(relative_name, rules):
+            continue
+        relative_path = Path(relative_name)
+        if tag == "H" and mode in _REGULAR_FILE_MODES:
+            indexed.setdefault(relative_path, (mode, object_id))
+        elif mode != _GITLINK_MODE:
+            needs_stat[relative_path] = None
+
+    entries: dict[Path, FileStat] = {}
+    for relative_path, (_, object_id) in indexed.items():
+        if relative_path not in needs_stat:
+            # Clean tracked file: the index object ID already identifies its content, so skip the filesystem.
+            entries[repo_root / relative_path] = FileStat(blob_id=object_id)
+    for relative_path in needs_stat:
         candidate = repo_root / relative_path
-        if candidate.is_file() and _is_within_repo(candidate, repo_root):
-            paths.append(candidate)
-    return sorted(set(paths), key=lambda path: path.as_posix())
+        file_stat = _stat_visible_file(candidate, repo_root)
+        if file_stat is not None:
+            entries[candidate] = file_stat
+    return sorted(entries.items(), key=lambda entry: entry[0].as_posix())
 
 
-def _walk_visible_paths(repo_root: Path) -> list[Path]:
-    paths: list[Path] = []
+def _walk_visible_paths(repo_root: Path, rules: ExclusionRules) -> list[tuple[Path, FileStat]]:
+    entries: list[tuple[Path, FileStat]] = []
     for root, dirs, filenames in os.walk(repo_root):
+        root_path = Path(root)
+        prefix = root_path.relative_to(repo_root).as_posix()
+        prefix = "" if prefix == "." else f"{prefix}/"
         dirs[:] = sorted(
             name
             for name in dirs
-            if name.lower() not in _EXCLUDED_DIR_NAMES and not _is_virtualenv_dir(name)
+            if _EXCLUDED_DIR_NAME_RE.fullmatch(name) is None and not rules.excludes(f"{prefix}{name}")
         )
-        root_path = Path(root)
         for filename in sorted(filenames):
+            if rules.excludes(f"{prefix}{filename}"):
+                continue
             candidate = root_path / filename
-            if candidate.is_file() and _is_within_repo(candidate, repo_root):
-                paths.append(candidate)
-    return paths
+            file_stat = _stat_visible_file(candidate, repo_root)
+            if file_stat is not None:
+                entries.append((candidate, file_stat))
+    return entries
+
+
+def iter_project_file_stats(
+    repo_path: Path,
+    *,
+    exclusions: ExclusionRules | None = None,
+) -> list[tuple[Path, FileStat]]:
+    """Return repository-owned files with the metadata captured while discovering them.
+
+    Inside a git work tree, clean tracked files carry their index object ID and are not touched on disk;
+    modified, untracked, and non-git files are stat-ed and carry size and modification time instead.
+    *exclusions* defaults to the globs in the analyzed root's ``.riskmap.yml``.
+    """
+
+    repo_root = repo_path.resolve()
+    rules = load_exclusion_rules(repo_root) if exclusions is None else exclusions
+    git_entries = _git_visible_paths(repo_root, rules)
+    visible_entries = git_entries if git_entries is not None else _walk_visible_paths(repo_root, rules)
+    return [(repo_path / path.relative_to(repo_root), file_stat) for path, file_stat in visible_entries]
 
 
 def iter_project_files(repo_path: Path) -> list[Path]:
     """Return repository-owned files while excluding ignored, generated, and vendored trees."""
 
-    repo_root = repo_path.resolve()
-    git_paths = _git_visible_paths(repo_root)
-    visible_paths = git_paths if git_paths is not None else _walk_visible_paths(repo_root)
-    return [repo_path / path.relative_to(repo_root) for path in visible_paths]
+    return [path for path, _ in iter_project_file_stats(repo_path)]
 
 
-__all__ = ["iter_project_files"]
+__all__ = ["FileStat", "iter_project_file_stats", "iter_project_files"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Start offsets of every ``\\n``-terminated line in one text, for O(log n) offset-to-line lookups."""
+
+    __slots__ = ("_starts",)
+
+    def __init__(self, text: str) -> None:
+        starts = array("I", [0])
+        find = text.find
+        position = find("\n")
+        while position != -1:
+            starts.append(position + 1)
+            position = find("\n", position + 1)
+        self._starts = starts
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line containing character *offset* (same as counting preceding newlines)."""
+
+        return bisect_right(self._starts, offset)
+
+
+__all__ = ["LineIndex"]
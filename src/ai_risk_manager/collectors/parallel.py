@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+import math
+import os
+from pathlib import Path
+
+from ai_risk_manager.collectors.artifact_cache import FilePayload, RowCodec, artifact_cache_key
+from ai_risk_manager.collectors.extraction_budget import ExtractionTimeout, cpu_budget, file_cpu_budget
+from ai_risk_manager.collectors.parse_cache import ParsedSource, load_source
+from ai_risk_manager.collectors.snapshot import RepoSnapshot
+
+# Below this many uncached files, process start-up costs more than it saves.
+_MIN_PARALLEL_TASKS = 16
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class FileTask:
+    """Picklable description of one file for per-file extraction in the current or a worker process."""
+
+    path: str
+    relative_path: str
+    mtime_ns: int | None
+    size: int | None
+    blob_id: str
+    is_test: bool = False
+    context: str = ""
+
+    def load(self) -> ParsedSource:
+        return load_source(Path(self.path), mtime_ns=self.mtime_ns, size=self.size, blob_id=self.blob_id)
+
+
+def resolve_jobs(requested: int | None = None) -> int:
+    """Resolve the collector worker count from *requested* or ``AIRISK_JOBS``; ``0`` means one per CPU."""
+
+    if requested is None:
+        raw = os.getenv("AIRISK_JOBS", "1").strip()
+        try:
+            requested = int(raw)
+        except ValueError:
+            return 1
+    if requested == 0:
+        return os.cpu_count() or 1
+    return max(1, requested)
+
+
+def file_task(snapshot: RepoSnapshot, path: Path, *, is_test: bool = False, context: str = "") -> FileTask | None:
+    """Describe *path* for extraction, or return ``None`` when it is empty or unreadable.
+
+    A clean tracked file is described by its git index object ID without being read, so an artifact-cache
+    hit costs no I/O; ``collect_file_payloads`` reads it only on a miss. Other files are read here to hash them.
+    """
+
+    file_stat = snapshot.stat(path)
+    blob_id = file_stat.blob_id if file_stat is not None else ""
+    if not blob_id:
+        source = snapshot.source(path)
+        if not source.text:
+            return None
+        blob_id = source.blob_id
+    return FileTask(
+        path=str(path),
+        relative_path=snapshot.relative(path),
+        mtime_ns=file_stat.mtime_ns if file_stat is not None else None,
+        size=file_stat.size if file_stat is not None else None,
+        blob_id=blob_id,
+        is_test=is_test,
+        context=context,
+    )
+
+
+@contextmanager
+def shared_process_pool(snapshot: RepoSnapshot) -> Iterator[None]:
+    """Route every collector's per-file work through one process pool for the duration of the block.
+
+    Collectors running concurrently then share ``snapshot.jobs`` workers instead of each starting a pool.
+    Those collectors run on threads, where ``cpu_budget`` cannot install its signal handler, so every batch
+    goes to the pool, however small. With ``jobs <= 1``, or when a pool cannot be started, collectors keep
+    extracting serially.
+    """
+
+    if snapshot.jobs <= 1 or snapshot.process_pool is not None:
+        yield
+        return
+    try:
+        executor = ProcessPoolExecutor(max_workers=snapshot.jobs)
+    except (OSError, NotImplementedError):
+        yield
+        return
+    snapshot.process_pool = executor
+    try:
+        yield
+    finally:
+        snapshot.process_pool = None
+        executor.shutdown()
+
+
+def _budgeted(worker: Callable[[FileTask], FilePayload], seconds: float, task: FileTask) -> FilePayload | None:
+    """Run *worker* on *task* within a CPU budget of *seconds*; ``None`` means the budget ran out."""
+
+    try:
+        with cpu_budget(seconds):
+            return worker(task)
+    except ExtractionTimeout:
+        return None
+
+
+def _run_tasks(
+    worker: Callable[[FileTask], FilePayload | None],
+    tasks: list[FileTask],
+    jobs: int,
+    pool: Executor | None = None,
+) -> list[FilePayload | None]:
+    if not tasks:
+        return []
+    # A shared pool is already running, so small batches cost no start-up and keep the CPU budget.
+    if jobs <= 1 or (pool is None and len(tasks) < _MIN_PARALLEL_TASKS):
+        return [worker(task) for task in tasks]
+    workers = min(jobs, len(tasks))
+    chunksize = max(1, math.ceil(len(tasks) / (workers * _CHUNKS_PER_WORKER)))
+    try:
+        if pool is not None:
+            return list(pool.map(worker, tasks, chunksize=chunksize))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(worker, tasks, chunksize=chunksize))
+    except (BrokenProcessPool, OSError, NotImplementedError):
+        # Sandboxes without working process pools still get correct, serial results.
+        return [worker(task) for task in tasks]
+
+
+def collect_file_payloads(
+    snapshot: RepoSnapshot,
+    tasks: Sequence[FileTask],
+    *,
+    worker: Callable[[FileTask], FilePayload],
+    namespace: str,
+    collector_version: str,
+    codecs: Mapping[str, RowCodec],
+) -> list[FilePayload]:
+    """Return per-file payloads in *tasks* order, reusing cached entries and fanning misses out to workers.
+
+    *worker* must be a picklable module-level callable (use ``functools.partial`` for shared context)
+    whose output depends only on the task, so serial and parallel runs produce identical results. A file whose
+    extraction exceeds ``AIRISK_FILE_CPU_BUDGET`` contributes an empty payload, is recorded in
+    ``snapshot.skipped`` with reason ``timeout``, and is not cached. Files are read only on a cache miss; one
+    that turns out empty, unreadable, or skipped as generated contributes an empty payload.
+    """
+
+    cache = snapshot.artifact_cache
+    payloads: list[FilePayload | None] = [None] * len(tasks)
+    keys: list[str | None] = [None] * len(tasks)
+    pending: list[int] = []
+    for index, task in enumerate(tasks):
+        if cache is not None and task.blob_id:
+            key = artifact_cache_key(
+                namespace=namespace,
+                collector_version=collector_version,
+                relative_path=task.relative_path,
+                blob_id=task.blob_id,
+                # Runs that skip generated files must never reuse rows extracted from one.
+                context=f"{task.context}|skip_generated" if snapshot.skip_generated else task.context,
+            )
+            keys[index] = key
+            payloads[index] = cache.lookup(key, codecs)
+        if payloads[index] is None and snapshot.source(Path(task.path)).text:
+            pending.append(index)
+
+    budgeted = partial(_budgeted, worker, file_cpu_budget())
+    computed = _run_tasks(budgeted, [tasks[index] for index in pending], snapshot.jobs, snapshot.process_pool)
+    for index, payload in zip(pending, computed):
+        if payload is None:
+            snapshot.skipped[Path(tasks[index].path)] = "timeout"
+            continue
+        payloads[index] = payload
+        cache_key = keys[index]
+        if cache is not None and cache_key is not None:
+            cache.store(cache_key, payload, codecs)
+    return [payload if payload is not None else {} for payload in payloads]
+
+
+__all__ = ["FileTask", "collect_file_payloads", "file_task", "resolve_jobs", "shared_process_pool"]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import ast
+import codecs
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import hashlib
+import mmap
+import os
+from pathlib import Path
+import re
+import threading
+
+from ai_risk_manager.collectors.line_index import LineIndex
+
+_DEFAULT_MAX_ENTRIES = 4096
+# A snapshot's reservation never raises the bound past this, however large the repository.
+_MAX_RESERVED_ENTRIES = 16384
+DEFAULT_MAX_FILE_BYTES = 4 * 1024 * 1024
+_SNIFF_BYTES = 8192
+# Byte scans below this size read into memory; larger files are memory-mapped instead.
+_MMAP_MIN_BYTES = 256 * 1024
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+_GENERATED_HEADER_LINES = 5
+_GENERATED_COMMENT_RE = re.compile(r"^\s*(?:#|//|/\*|\*|<!--|--|\"\"\"|\'\'\')")
+# Exact generator markers only (the ``@generated`` tag and Go's ``Code generated ... DO NOT EDIT.`` line), so
+# hand-written files that merely ask readers not to edit them keep their content.
+_GENERATED_MARKER_RE = re.compile(r"@generated\b|\bCode generated .* DO NOT EDIT\b")
+_MINIFIED_LINE_LENGTH = 5000
+_CACHE_LOCK = threading.Lock()
+
+# (absolute path, mtime_ns, size) for stat-ed files, (absolute path, git object ID) for clean tracked files.
+CacheKey = tuple[str, int, int] | tuple[str, str]
+
+
+@dataclass
+class ParsedSource:
+    """Decoded source shared by every stage that reads the same unchanged file."""
+
+    text: str
+    lines: list[str]
+    blob_id: str = ""
+    skip_reason: str = ""
+    generated: str = ""
+    _tree: ast.Module | None = field(default=None, repr=False)
+    _tree_parsed: bool = field(default=False, repr=False)
+    _line_index: LineIndex | None = field(default=None, repr=False)
+
+    @property
+    def tree(self) -> ast.Module | None:
+        """Return the parsed Python module, or ``None`` when the source is empty or has a syntax error.
+
+        The tree is shared across callers and must not be mutated.
+        """
+
+        if not self._tree_parsed:
+            self._tree = _parse_module(self.text)
+            self._tree_parsed = True
+        return self._tree
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Return the offset-to-line index of ``text``, built on first use and released with the source."""
+
+        if self._line_index is None:
+            self._line_index = LineIndex(self.text)
+        return self._line_index
+
+    def without_content(self, reason: str) -> ParsedSource:
+        """Return an empty stand-in that keeps the content hash and records why the content was dropped."""
+
+        return ParsedSource(text="", lines=[], blob_id=self.blob_id, skip_reason=reason, _tree_parsed=True)
+
+
+_EMPTY_SOURCE = ParsedSource(text="", lines=[], skip_reason="unreadable", _tree_parsed=True)
+_CACHE: OrderedDict[CacheKey, ParsedSource] = OrderedDict()
+_reserved_entries = 0
+
+
+def _max_entries() -> int:
+    """Return ``AIRISK_PARSE_CACHE_MAX_ENTRIES`` when set, else the default raised to the reserved file count.
+
+    The reservation is capped at ``_MAX_RESERVED_ENTRIES``.
+    """
+
+    raw = os.getenv("AIRISK_PARSE_CACHE_MAX_ENTRIES")
+    if raw is not None:
+        try:
+            value = int(raw)
+        except ValueError:
+            value = -1
+        if value >= 0:
+            return value
+    return max(_DEFAULT_MAX_ENTRIES, min(_reserved_entries, _MAX_RESERVED_ENTRIES))
+
+
+def reserve_parse_cache(entries: int) -> None:
+    """Size the cache to hold *entries* files, so a run's repeated passes over its files do not evict each other.
+
+    Each ``RepoSnapshot`` reserves its own file count when it is built, up to ``_MAX_RESERVED_ENTRIES``;
+    an explicit ``AIRISK_PARSE_CACHE_MAX_ENTRIES`` still takes precedence. ``clear_parse_cache`` drops the
+    reservation with the entries.
+    """
+
+    global _reserved_entries
+    with _CACHE_LOCK:
+        _reserved_entries = max(0, entries)
+
+
+def max_file_bytes() -> int:
+    """Return the per-file size cap from ``AIRISK_MAX_FILE_BYTES``; ``0`` disables the cap."""
+
+    raw = os.getenv("AIRISK_MAX_FILE_BYTES", str(DEFAULT_MAX_FILE_BYTES))
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MAX_FILE_BYTES
+    return value if value >= 0 else DEFAULT_MAX_FILE_BYTES
+
+
+def _exceeds_cap(size: int) -> bool:
+    limit = max_file_bytes()
+    return bool(limit) and size > limit
+
+
+def _looks_binary(head: bytes) -> bool:
+    return b"\0" in head and not head.startswith(_UTF16_BOMS)
+
+
+def _parse_module(text: str) -> ast.Module | None:
+    if not text:
+        return None
+    try:
+        return ast.parse(text)
+    except SyntaxError:
+        return None
+
+
+def git_blob_id(data: bytes) -> str:
+    """Return the git object ID (``git hash-object``) for file content *data*."""
+
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _decode_text(data: bytes) -> str:
+    # Mirror Path.read_text(): strict UTF-8 with universal newline translation. Byte-order marks select
+    # UTF-16 and are otherwise dropped so they never leak into the first token.
+    encoding = "utf-16" if data.startswith(_UTF16_BOMS) else "utf-8-sig"
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _generated_reason(lines: list[str]) -> str:
+    for line in lines[:_GENERATED_HEADER_LINES]:
+        if _GENERATED_COMMENT_RE.match(line) and _GENERATED_MARKER_RE.search(line):
+            return "generated"
+    if any(len(line) > _MINIFIED_LINE_LENGTH for line in lines):
+        return "minified"
+    return ""
+
+
+def _skipped_source(reason: str, blob_id: str = "") -> ParsedSource:
+    return ParsedSource(text="", lines=[], blob_id=blob_id, skip_reason=reason, _tree_parsed=True)
+
+
+def _read_source(path: Path, *, blob_id: str) -> ParsedSource | None:
+    """Read and decode *path*, or describe why it was skipped; ``None`` means it could not be opened."""
+
+    try:
+        with path.open("rb") as handle:
+            if _exceeds_cap(os.fstat(handle.fileno()).st_size):
+                return _skipped_source("too_large", blob_id)
+            head = handle.read(_SNIFF_BYTES)
+            if _looks_binary(head):
+                return _skipped_source("binary", blob_id)
+            data = head + handle.read()
+    except OSError:
+        return None
+    content_id = blob_id or git_blob_id(data)
+    try:
+        text = _decode_text(data)
+    except UnicodeDecodeError:
+        return _skipped_source("undecodable", content_id)
+    lines = text.splitlines()
+    return ParsedSource(text=text, lines=lines, blob_id=content_id, generated=_generated_reason(lines))
+
+
+def _cache_key(path: Path, *, mtime_ns: int | None, size: int | None, blob_id: str) -> CacheKey | None:
+    if blob_id and mtime_ns is None and size is None:
+        return (str(path.absolute()), blob_id)
+    if mtime_ns is None or size is None:
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return None
+        mtime_ns, size = file_stat.st_mtime_ns, file_stat.st_size
+    return (str(path.absolute()), mtime_ns, size)
+
+
+def load_source(
+    path: Path,
+    *,
+    mtime_ns: int | None = None,
+    size: int | None = None,
+    blob_id: str = "",
+) -> ParsedSource:
+    """Return UTF-8 text and lines for *path*, decoding each unchanged file once per process.
+
+    Entries are keyed by absolute path, modification time, and size, so an edited file is re-read.
+    When only *blob_id* is given (a clean file's git index object ID), it keys the entry instead and is
+    reused as the source's ``blob_id`` without hashing the content again.
+    Files over ``AIRISK_MAX_FILE_BYTES``, binary files (NUL bytes in the first block), and files that are
+    unreadable or not UTF-8/UTF-16 yield an empty source whose ``skip_reason`` says why. Readable files
+    flagged by a generated-code header or minified-length lines keep their content and set ``generated``.
+    """
+
+    key = _cache_key(path, mtime_ns=mtime_ns, size=size, blob_id=blob_id)
+    if key is None:
+        return _EMPTY_SOURCE
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            _CACHE.move_to_end(key)
+            return cached
+    source = _read_source(path, blob_id=blob_id if len(key) == 2 else "")
+    if source is None:
+        return _EMPTY_SOURCE
+    max_entries = _max_entries()
+    if max_entries == 0:
+        return source
+    with _CACHE_LOCK:
+        source = _CACHE.setdefault(key, source)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > max_entries:
+            _CACHE.popitem(last=False)
+    return source
+
+
+@contextmanager
+def open_source_bytes(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield raw content of *path* for ``bytes`` regex scanning without decoding it into a string.
+
+    Large files are memory-mapped, so scanning them does not copy the file onto the Python heap, and
+    nothing is added to the parse cache. Oversized, binary, UTF-16, empty, or unreadable files yield ``b""``.
+    """
+
+    try:
+        handle = path.open("rb")
+    except OSError:
+        yield b""
+        return
+    with handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0 or _exceeds_cap(size):
+            yield b""
+            return
+        if size < _MMAP_MIN_BYTES:
+            data = handle.read()
+            yield b"" if b"\0" in data[:_SNIFF_BYTES] else data
+            return
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield b""
+            return
+        with mapped:
+            yield b"" if b"\0" in mapped[:_SNIFF_BYTES] else mapped
+
+
+def clear_parse_cache() -> None:
+    """Drop every cached source and the file-count reservation; ``run_pipeline`` calls this when a run ends."""
+
+    global _reserved_entries
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _reserved_entries = 0
+
+
+__all__ = [
+    "DEFAULT_MAX_FILE_BYTES",
+    "ParsedSource",
+    "clear_parse_cache",
+    "git_blob_id",
+    "load_source",
+    "max_file_bytes",
+    "open_source_bytes",
+    "reserve_parse_cache",
+]
@@ -6,6 +6,7 @@ from ai_risk_manager.collectors.plugins.base import (
     ExternalCallArtifact,
     StackId,
     StackProbeResult,
+    merge_artifact_bundles,
 )
 from ai_risk_manager.collectors.plugins.contract import (
     PLUGIN_CONTRACT_VERSION,
@@ -42,4 +43,5 @@ __all__ = [
     "get_plugin_for_stack",
     "list_plugins",
     "list_registered_stacks",
+    "merge_artifact_bundles",
 ]
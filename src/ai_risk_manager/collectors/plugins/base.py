@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+import mmap
 from pathlib import Path
-from typing import Literal, Protocol
+from typing import TYPE_CHECKING, Literal, Protocol, runtime_checkable
 
 from ai_risk_manager.schemas.types import Confidence, IngressFamily, IngressOperation, PreflightResult
 
+if TYPE_CHECKING:
+    from ai_risk_manager.collectors.snapshot import RepoSnapshot
+
 StackId = Literal["fastapi_pytest", "django_drf", "express_node", "unknown"]
 DetectionConfidence = Confidence  # backward-compatible alias
 
@@ -112,16 +116,85 @@ class ArtifactBundle:
     # (file, issue_type, owner_name, line, snippet, details)
 
 
+# Collected again by every stack that reads the repository, rather than extracted from the stack's own files.
+_REPOSITORY_LEVEL_FIELDS = frozenset(
+    {"all_files", "python_files", "test_files", "dependency_specs", "workflow_automation_issues"}
+)
+
+
+def merge_artifact_bundles(*bundles: ArtifactBundle) -> ArtifactBundle:
+    """Concatenate collector bundles field by field.
+
+    Repository-level rows (the file lists, dependency specs, and workflow issues) are produced again by every
+    collector, so a row an earlier bundle already contributed is dropped; a multi-stack run must not count
+    them twice. Every other field is concatenated unchanged, repeated rows included.
+    """
+
+    merged = ArtifactBundle()
+    for bundle_field in fields(ArtifactBundle):
+        rows: list[object] = getattr(merged, bundle_field.name)
+        if bundle_field.name not in _REPOSITORY_LEVEL_FIELDS:
+            for bundle in bundles:
+                rows.extend(getattr(bundle, bundle_field.name))
+            continue
+        seen: set[str] = set()
+        for bundle in bundles:
+            bundle_rows = getattr(bundle, bundle_field.name)
+            # Rows can carry ``details`` dicts, so identity is the deterministic repr rather than a hash.
+            keys = [repr(row) for row in bundle_rows]
+            rows.extend(row for row, key in zip(bundle_rows, keys) if key not in seen)
+            seen.update(keys)
+    return merged
+
+
 class CollectorPlugin(Protocol):
     @property
     def stack_id(self) -> StackId:
         ...
 
-    def probe(self, repo_path: Path) -> StackProbeResult | None:
+    def probe(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackProbeResult | None:
+        ...
+
+    def preflight(
+        self,
+        repo_path: Path,
+        probe_data: object | None = None,
+        *,
+        snapshot: RepoSnapshot | None = None,
+    ) -> PreflightResult:
+        ...
+
+    def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+        ...
+
+
+@runtime_checkable
+class ProbeObserver(Protocol):
+    """Per-file probe state fed by the shared detection pass (see ``run_probe_pass``).
+
+    The pass opens each candidate file once and hands its raw bytes to every observer that still accepts
+    it; observers that need an AST parse it through the snapshot, so each file is parsed at most once.
+    """
+
+    suffixes: tuple[str, ...]
+
+    @property
+    def saturated(self) -> bool:
         ...
 
-    def preflight(self, repo_path: Path, probe_data: object | None = None) -> PreflightResult:
+    def accepts(self, path: Path) -> bool:
+        ...
+
+    def observe(self, path: Path, content: bytes | mmap.mmap) -> None:
+        ...
+
+
+@runtime_checkable
+class ObservingProbePlugin(Protocol):
+    """Optional plugin extension that lets ``detect_stack`` probe every plugin in one shared file pass."""
+
+    def probe_observer(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ProbeObserver:
         ...
 
-    def collect(self, repo_path: Path) -> ArtifactBundle:
+    def probe_from_observer(self, observer: ProbeObserver) -> StackProbeResult | None:
         ...
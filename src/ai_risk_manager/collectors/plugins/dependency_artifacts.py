@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 import json
 from pathlib import Path
 import re
 import tomllib
 
+from ai_risk_manager.collectors.artifact_cache import RowCodec, cached_file_payload
+from ai_risk_manager.collectors.file_catalog import is_requirements_path
+from ai_risk_manager.collectors.parse_cache import ParsedSource, load_source
+from ai_risk_manager.collectors.snapshot import RepoSnapshot
+
 DependencySpecRow = tuple[str, str, str, int | None, str | None, str]
 
+_ARTIFACT_CACHE_VERSION = "1"
+_ARTIFACT_CACHE_NAMESPACE = "dependency-specs"
+_ARTIFACT_CACHE_CODECS: dict[str, RowCodec] = {"dependency_specs": None}
+
 _DEPENDENCY_LINE_RE = re.compile(r"^\s*([A-Za-z0-9_.-]+(?:\[[^\]]+\])?)\s*(.*)$")
 _DEV_SCOPE_MARKERS = ("dev", "test", "lint", "docs", "qa", "type", "ci")
 _SEMVER_EXACT_RE = re.compile(r"^v?\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
 _NPM_DIRECT_REFERENCE_PREFIXES = ("git+", "git://", "github:", "http://", "https://", "file:", "link:", "workspace:")
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"')
 
 
 def _clean_dependency_name(name: str) -> str:
@@ -47,14 +58,23 @@ def _dependency_policy_violation(raw_spec: str) -> str | None:
     return "unpinned_version"
 
 
-def _line_of_text_match(lines: list[str], target: str) -> int | None:
+def _line_of_text_match(source: ParsedSource, target: str) -> int | None:
+    """Return the first line containing *target*, using the source's line index instead of a line scan."""
+
     needle = target.strip()
-    if not needle:
+    if not needle or "\n" in needle or "\r" in needle:
         return None
-    for idx, line in enumerate(lines, start=1):
-        if needle in line:
-            return idx
-    return None
+    offset = source.text.find(needle)
+    return source.line_index.line_of(offset) if offset != -1 else None
+
+
+def _first_string_offsets(text: str) -> dict[str, int]:
+    """Map each JSON string literal, quotes included, to its first offset in one pass over *text*."""
+
+    offsets: dict[str, int] = {}
+    for match in _JSON_STRING_RE.finditer(text):
+        offsets.setdefault(match.group(), match.start())
+    return offsets
 
 
 def _parse_dependency_entry(raw_entry: str) -> tuple[str, str] | None:
@@ -87,14 +107,8 @@ def _optional_group_scope(group: str) -> str:
     return "runtime"
 
 
-def _extract_pyproject_dependencies(repo_path: Path) -> list[DependencySpecRow]:
-    path = repo_path / "pyproject.toml"
-    if not path.is_file():
-        return []
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError:
-        return []
+def _extract_pyproject_dependencies(relative: str, source: ParsedSource) -> list[DependencySpecRow]:
+    text = source.text
     try:
         payload = tomllib.loads(text)
     except tomllib.TOMLDecodeError:
@@ -107,7 +121,6 @@ def _extract_pyproject_dependencies(repo_path: Path) -> list[DependencySpecRow]:
     if not isinstance(rows, list):
         return []
 
-    lines = text.splitlines()
     result: list[DependencySpecRow] = []
     for row in rows:
         if not isinstance(row, str):
@@ -118,10 +131,10 @@ def _extract_pyproject_dependencies(repo_path: Path) -> list[DependencySpecRow]:
         dep_name, spec = parsed
         result.append(
             (
-                str(path.relative_to(repo_path)),
+                relative,
                 dep_name,
                 spec,
-                _line_of_text_match(lines, row),
+                _line_of_text_match(source, row),
                 _dependency_policy_violation(spec),
                 "runtime",
             )
@@ -142,10 +155,10 @@ def _extract_pyproject_dependencies(repo_path: Path) -> list[DependencySpecRow]:
                 dep_name, spec = parsed
                 result.append(
                     (
-                        str(path.relative_to(repo_path)),
+                        relative,
                         dep_name,
                         spec,
-                        _line_of_text_match(lines, row),
+                        _line_of_text_match(source, row),
                         _dependency_policy_violation(spec),
                         scope,
                     )
@@ -169,53 +182,37 @@ def _requirements_scope(path: Path) -> str:
     return "runtime"
 
 
-def _extract_requirements_dependencies(repo_path: Path, all_files: list[Path]) -> list[DependencySpecRow]:
-    candidates = [
-        path
-        for path in all_files
-        if path.suffix == ".txt" and (path.name.startswith("requirements") or path.name.startswith("constraints"))
-    ]
+def _extract_requirements_dependencies(relative: str, source: ParsedSource) -> list[DependencySpecRow]:
+    scope = _requirements_scope(Path(relative))
     result: list[DependencySpecRow] = []
-    for path in candidates:
-        scope = _requirements_scope(path)
-        try:
-            lines = path.read_text(encoding="utf-8").splitlines()
-        except (OSError, UnicodeDecodeError):
+    for idx, line in enumerate(source.lines, start=1):
+        parsed = _parse_requirements_line(line)
+        if parsed is None:
             continue
-        for idx, line in enumerate(lines, start=1):
-            parsed = _parse_requirements_line(line)
-            if parsed is None:
-                continue
-            dep_name, spec = parsed
-            result.append(
-                (
-                    str(path.relative_to(repo_path)),
-                    dep_name,
-                    spec,
-                    idx,
-                    _dependency_policy_violation(spec),
-                    scope,
-                )
+        dep_name, spec = parsed
+        result.append(
+            (
+                relative,
+                dep_name,
+                spec,
+                idx,
+                _dependency_policy_violation(spec),
+                scope,
             )
+        )
     return result
 
 
-def _extract_package_json_dependencies(repo_path: Path) -> list[DependencySpecRow]:
-    path = repo_path / "package.json"
-    if not path.is_file():
-        return []
-
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError:
-        return []
-
+def _extract_package_json_dependencies(relative: str, source: ParsedSource) -> list[DependencySpecRow]:
+    text = source.text
     try:
         payload = json.loads(text)
     except json.JSONDecodeError:
         return []
+    if not isinstance(payload, dict):
+        return []
 
-    lines = text.splitlines()
+    string_offsets: dict[str, int] | None = None
     result: list[DependencySpecRow] = []
     for field_name, scope in (("dependencies", "runtime"), ("devDependencies", "development")):
         field = payload.get(field_name)
@@ -224,13 +221,16 @@ def _extract_package_json_dependencies(repo_path: Path) -> list[DependencySpecRo
         for raw_name, raw_spec in field.items():
             if not isinstance(raw_name, str) or not isinstance(raw_spec, str):
                 continue
+            if string_offsets is None:
+                string_offsets = _first_string_offsets(text)
+            offset = string_offsets.get(f'"{raw_name}"')
             dep_name = _clean_dependency_name(raw_name)
             result.append(
                 (
-                    str(path.relative_to(repo_path)),
+                    relative,
                     dep_name,
                     raw_spec,
-                    _line_of_text_match(lines, f'"{raw_name}"'),
+                    source.line_index.line_of(offset) if offset is not None else None,
                     _dependency_policy_violation(raw_spec),
                     scope,
                 )
@@ -238,8 +238,50 @@ def _extract_package_json_dependencies(repo_path: Path) -> list[DependencySpecRo
     return result
 
 
-def extract_dependency_specs(repo_path: Path, all_files: list[Path]) -> list[DependencySpecRow]:
-    rows = _extract_pyproject_dependencies(repo_path)
-    rows.extend(_extract_requirements_dependencies(repo_path, all_files))
-    rows.extend(_extract_package_json_dependencies(repo_path))
+def _manifest_dependencies(
+    repo_path: Path,
+    path: Path,
+    extract: Callable[[str, ParsedSource], list[DependencySpecRow]],
+    snapshot: RepoSnapshot | None,
+) -> list[DependencySpecRow]:
+    """Read one manifest through the shared reader and extract its rows, cached by content hash when enabled."""
+
+    if not path.is_file():
+        return []
+    file_stat = snapshot.stat(path) if snapshot is not None else None
+    if file_stat is None:
+        source = load_source(path)
+    else:
+        source = load_source(path, mtime_ns=file_stat.mtime_ns, size=file_stat.size, blob_id=file_stat.blob_id)
+    if not source.text:
+        return []
+    relative = str(path.relative_to(repo_path))
+    payload = cached_file_payload(
+        snapshot.artifact_cache if snapshot is not None else None,
+        namespace=_ARTIFACT_CACHE_NAMESPACE,
+        collector_version=_ARTIFACT_CACHE_VERSION,
+        relative_path=relative,
+        blob_id=source.blob_id,
+        codecs=_ARTIFACT_CACHE_CODECS,
+        compute=lambda: {"dependency_specs": extract(relative, source)},
+    )
+    return list(payload.get("dependency_specs", []))
+
+
+def extract_dependency_specs(
+    repo_path: Path, files: list[Path], *, snapshot: RepoSnapshot | None = None
+) -> list[DependencySpecRow]:
+    """Extract pinned dependency specs; pass ``FileCatalog.requirements_files`` as *files* to skip the filter scan.
+
+    Manifests are read through the shared source reader, so ``AIRISK_MAX_FILE_BYTES`` bounds the memory one
+    manifest can take. With a *snapshot* that carries an artifact cache, each manifest's rows are cached by
+    its content hash, so unchanged manifests are not parsed again.
+    """
+
+    rows = _manifest_dependencies(repo_path, repo_path / "pyproject.toml", _extract_pyproject_dependencies, snapshot)
+    for path in files:
+        if is_requirements_path(path):
+            rows.extend(_manifest_dependencies(repo_path, path, _extract_requirements_dependencies, snapshot))
+    package_json = repo_path / "package.json"
+    rows.extend(_manifest_dependencies(repo_path, package_json, _extract_package_json_dependencies, snapshot))
     return rows
@@ -3,9 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Literal, cast
 
-from ai_risk_manager.collectors.plugins.base import ArtifactBundle, StackProbeResult
-from ai_risk_manager.collectors.plugins.django_artifacts import DjangoSignals, collect_django_artifacts, scan_django_signals
+from ai_risk_manager.collectors.plugins.base import ArtifactBundle, ProbeObserver, StackProbeResult
+from ai_risk_manager.collectors.plugins.django_artifacts import (
+    DjangoProbeObserver,
+    DjangoSignals,
+    collect_django_artifacts,
+    scan_django_signals,
+)
 from ai_risk_manager.collectors.plugins.sdk import CapabilitySignalPluginMixin
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 from ai_risk_manager.schemas.types import Confidence, PreflightResult
 
 
@@ -19,6 +25,8 @@ def _probe_reasons(signals: DjangoSignals) -> list[str]:
         reasons.append("Detected Django urlpatterns.")
     if signals.has_pytest:
         reasons.append("Detected pytest patterns.")
+    if signals.declared_in:
+        reasons.append(f"Django is declared as a dependency in {signals.declared_in}.")
     return reasons
 
 
@@ -62,8 +70,18 @@ class DjangoCollectorPlugin(CapabilitySignalPluginMixin):
         "ui_ergonomics",
     }
 
-    def probe(self, repo_path: Path) -> StackProbeResult | None:
-        signals = scan_django_signals(repo_path)
+    def probe(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackProbeResult | None:
+        return self._probe_from_signals(scan_django_signals(repo_path, snapshot=snapshot))
+
+    def probe_observer(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> DjangoProbeObserver:
+        return DjangoProbeObserver(resolve_snapshot(repo_path, snapshot))
+
+    def probe_from_observer(self, observer: ProbeObserver) -> StackProbeResult | None:
+        if not isinstance(observer, DjangoProbeObserver):
+            raise TypeError(f"expected DjangoProbeObserver, got {type(observer).__name__}")
+        return self._probe_from_signals(observer.signals())
+
+    def _probe_from_signals(self, signals: DjangoSignals) -> StackProbeResult | None:
         if not (signals.has_django_import or signals.has_drf_import or signals.has_urlpatterns):
             return None
 
@@ -79,12 +97,18 @@ class DjangoCollectorPlugin(CapabilitySignalPluginMixin):
             probe_data=signals,
         )
 
-    def preflight(self, repo_path: Path, probe_data: object | None = None) -> PreflightResult:
-        signals = probe_data if isinstance(probe_data, DjangoSignals) else scan_django_signals(repo_path)
+    def preflight(
+        self,
+        repo_path: Path,
+        probe_data: object | None = None,
+        *,
+        snapshot: RepoSnapshot | None = None,
+    ) -> PreflightResult:
+        signals = probe_data if isinstance(probe_data, DjangoSignals) else scan_django_signals(repo_path, snapshot=snapshot)
         return _preflight_from_signals(signals)
 
-    def collect(self, repo_path: Path) -> ArtifactBundle:
-        return collect_django_artifacts(repo_path)
+    def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+        return collect_django_artifacts(repo_path, snapshot=snapshot)
 
 
 __all__ = ["DjangoCollectorPlugin", "DjangoSignals", "scan_django_signals"]
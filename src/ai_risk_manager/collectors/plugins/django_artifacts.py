@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import ast
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from functools import partial
+import mmap
 from pathlib import Path
 import re
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.artifact_cache import FilePayload, RowCodec, context_digest
+from ai_risk_manager.collectors.parallel import FileTask, collect_file_payloads, file_task
+from ai_risk_manager.collectors.parse_cache import ParsedSource
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle
 from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
 from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
@@ -19,6 +24,9 @@ from ai_risk_manager.collectors.plugins.python_write_contract_artifacts import (
     extract_python_write_contract_issues,
 )
 from ai_risk_manager.collectors.plugins.workflow_automation_artifacts import collect_workflow_automation_issues
+from ai_risk_manager.collectors.probe_prefilter import manifest_declaring, needle_pattern, run_probe_pass
+from ai_risk_manager.collectors.python_ast_index import PythonModuleIndex
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 
 WRITE_METHODS = ("post", "put", "patch", "delete")
 ROUTE_METHODS = WRITE_METHODS + ("get",)
@@ -36,6 +44,7 @@ class DjangoSignals:
     has_drf_import: bool
     has_urlpatterns: bool
     has_pytest: bool
+    declared_in: str = ""
 
 
 @dataclass
@@ -55,19 +64,30 @@ class ViewsetAction:
     snippet: str
 
 
-def _read_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return ""
-
-
-def _iter_files(repo_path: Path) -> list[Path]:
-    return iter_project_files(repo_path)
-
-
-def _iter_python_files(repo_path: Path) -> list[Path]:
-    return [p for p in _iter_files(repo_path) if p.suffix == ".py"]
+_ARTIFACT_CACHE_VERSION = "2"
+# Route-independent facts: cached by file content alone.
+_FILE_FACTS_NAMESPACE = "django"
+_FILE_FACTS_CODECS: dict[str, RowCodec] = {
+    "url_routes": None,
+    "url_route_names": None,
+    "url_router_prefixes": None,
+    "router_registrations": RouterRegistration,
+    "viewset_classes": None,
+    "viewset_actions": None,
+    "route_view_names": None,
+    "test_cases": None,
+    "lossy_decode_issues": None,
+    "uniqueness_default_issues": None,
+    "session_lifecycle_issues": None,
+}
+# Route-dependent rows: cached by file content plus a digest of the route context that file depends on.
+_ROUTED_NAMESPACE = "django-routed"
+_ROUTED_CODECS: dict[str, RowCodec] = {
+    "write_endpoints": None,
+    "test_http_calls": None,
+    "generated_test_issues": None,
+    "write_contract_issues": None,
+}
 
 
 def _line_snippet(source_lines: list[str], line: int, *, window: int = 3) -> str:
@@ -183,14 +203,6 @@ def _combine_paths(prefix: str, route: str) -> str | None:
     return _normalize_http_path(f"{left}/{right.lstrip('/')}")
 
 
-def _is_test_file(path: Path) -> bool:
-    return (
-        (("tests" in path.parts) and path.name != "conftest.py" and (path.name.startswith("test_") or path.name.endswith("_test.py")))
-        or path.name.startswith("test_")
-        or path.name.endswith("_test.py")
-    )
-
-
 def _extract_test_cases(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, int, str]]:
     cases: list[tuple[str, int, str]] = []
     for node in ast.walk(tree):
@@ -463,6 +475,20 @@ def _extract_class_endpoints(
     return endpoints
 
 
+def _route_view_names(tree: ast.AST) -> list[tuple[str]]:
+    """Return the functions and classes whose endpoints depend on ``route_map``, sorted and de-duplicated."""
+
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            methods = {method for decorator in node.decorator_list for method in _extract_api_view_methods(decorator)}
+            if any(method.lower() in WRITE_METHODS for method in methods):
+                names.add(node.name)
+        elif isinstance(node, ast.ClassDef) and _is_api_view_class(node):
+            names.add(node.name)
+    return [(name,) for name in sorted(names)]
+
+
 def _is_viewset_class(node: ast.ClassDef) -> bool:
     for base in node.bases:
         base_name = _call_name(base)
@@ -600,26 +626,17 @@ def _derive_route_name(path_suffix: str, basename: str) -> str | None:
 
 
 def _extract_viewset_endpoints(
-    parsed: list[tuple[Path, ast.Module, str, list[str]]],
+    registrations: list[RouterRegistration],
+    viewset_index: dict[str, tuple[str, list[ViewsetAction]]],
     router_prefixes: dict[str, list[str]],
 ) -> tuple[list[tuple[str, str, str, str, int, str]], dict[str, str]]:
-    registrations: list[RouterRegistration] = []
-    class_index: dict[str, tuple[str, ast.ClassDef, list[str]]] = {}
-
-    for _, tree, relative, source_lines in parsed:
-        registrations.extend(_extract_router_registrations(tree))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and _is_viewset_class(node):
-                class_index[node.name] = (relative, node, source_lines)
-
     endpoints: list[tuple[str, str, str, str, int, str]] = []
     route_name_map: dict[str, str] = {}
     for registration in registrations:
-        class_meta = class_index.get(registration.view_ref)
+        class_meta = viewset_index.get(registration.view_ref)
         if class_meta is None:
             continue
-        relative, class_node, source_lines = class_meta
-        actions = _extract_viewset_actions(class_node, source_lines)
+        relative, actions = class_meta
         if not actions:
             continue
 
@@ -652,140 +669,345 @@ def _extract_viewset_endpoints(
     return endpoints, route_name_map
 
 
-def scan_django_signals(repo_path: Path) -> DjangoSignals:
-    has_django_import = False
-    has_drf_import = False
-    has_urlpatterns = False
-    has_pytest = False
-    for path in _iter_python_files(repo_path):
-        text = _read_text(path)
-        if not text:
-            continue
-        try:
-            tree = ast.parse(text)
-        except SyntaxError:
-            continue
-
-        if path.name == "urls.py":
+@dataclass
+class DjangoRouteIndex:
+    """The repository's resolved URL configuration, merged from per-file routing facts.
+
+    Each file contributes ``path()`` routes, route names, and router includes (``urls.py`` only), router
+    registrations, and viewset actions. Files are merged in discovery order, so later ``name=`` entries win
+    as they would in Django. ``route_context`` is a file's dependency edge into the index: a non-test file's
+    routed rows depend only on the routes of the views it defines and on its viewset owners, so editing one
+    ``urls.py`` or view module re-extracts only the files whose routes actually moved.
+    """
+
+    route_map: dict[str, list[str]] = field(default_factory=dict)
+    route_name_map: dict[str, str] = field(default_factory=dict)
+    router_prefixes: dict[str, list[str]] = field(default_factory=dict)
+    registrations: list[RouterRegistration] = field(default_factory=list)
+    viewset_index: dict[str, tuple[str, list[ViewsetAction]]] = field(default_factory=dict)
+    viewset_endpoints: list[tuple[str, str, str, str, int, str]] = field(default_factory=list)
+    viewset_owners: dict[str, set[str]] = field(default_factory=dict)
+    _route_names_digest: str | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_file_facts(cls, contributions: Iterable[tuple[str, FilePayload]]) -> DjangoRouteIndex:
+        """Merge ``(relative path, file facts)`` pairs in discovery order and resolve viewset routes."""
+
+        index = cls()
+        for relative, facts in contributions:
+            index._add(relative, facts)
+        index._resolve_viewsets()
+        return index
+
+    def _add(self, relative: str, facts: FilePayload) -> None:
+        for view_ref, route_path in facts.get("url_routes", []):
+            self.route_map.setdefault(view_ref, []).append(route_path)
+        for route_name, route_path in facts.get("url_route_names", []):
+            self.route_name_map[route_name] = route_path
+        for router_var, prefix in facts.get("url_router_prefixes", []):
+            self.router_prefixes.setdefault(router_var, []).append(prefix)
+        self.registrations.extend(facts.get("router_registrations", []))
+        class_actions: list[list[ViewsetAction]] = [[] for _ in facts.get("viewset_classes", [])]
+        for class_ordinal, *action in facts.get("viewset_actions", []):
+            class_actions[class_ordinal].append(ViewsetAction(*action))
+        for (class_name,), actions in zip(facts.get("viewset_classes", []), class_actions):
+            self.viewset_index[class_name] = (relative, actions)
+
+    def _resolve_viewsets(self) -> None:
+        self.viewset_endpoints, viewset_route_names = _extract_viewset_endpoints(
+            self.registrations, self.viewset_index, self.router_prefixes
+        )
+        self.route_name_map.update(viewset_route_names)
+        for file_ref, endpoint_name, *_ in self.viewset_endpoints:
+            self.viewset_owners.setdefault(file_ref, set()).add(endpoint_name)
+
+    def route_context(self, relative: str, view_names: Iterable[str], *, is_test: bool) -> str:
+        """Digest the slice of the index that *relative*'s routed rows are extracted from."""
+
+        own = context_digest(
+            {
+                "routes": {name: self.route_map[name] for name in view_names if name in self.route_map},
+                "owners": sorted(self.viewset_owners.get(relative, set())),
+            }
+        )
+        if not is_test:
+            return own
+        # Test route resolution may ``reverse()`` any route name in the repository.
+        if self._route_names_digest is None:
+            self._route_names_digest = context_digest(self.route_name_map)
+        return f"{own}:{self._route_names_digest}"
+
+
+class DjangoProbeObserver:
+    """Django probe state: a manifest check up front, then a byte prefilter and AST checks per observed file.
+
+    A file is parsed only when its raw bytes contain a needle for a signal that is still missing.
+    """
+
+    suffixes: tuple[str, ...] = (".py",)
+
+    def __init__(self, snapshot: RepoSnapshot) -> None:
+        self._snapshot = snapshot
+        self.declared_in = manifest_declaring(snapshot, "django", ecosystem="python")
+        self.has_django_import = False
+        self.has_drf_import = False
+        self.has_urlpatterns = False
+        self.has_pytest = False
+
+    @property
+    def saturated(self) -> bool:
+        return self.has_django_import and self.has_drf_import and self.has_urlpatterns and self.has_pytest
+
+    def accepts(self, path: Path) -> bool:
+        return not self.saturated and path.suffix.lower() == ".py"
+
+    def observe(self, path: Path, content: bytes | mmap.mmap) -> None:
+        check_urlpatterns = not self.has_urlpatterns and path.name == "urls.py"
+        needles = [
+            needle
+            for needle, wanted in (
+                (b"django", not self.has_django_import),
+                (b"rest_framework", not self.has_drf_import),
+                (b"pytest", not self.has_pytest),
+                (b"test_", not self.has_pytest),
+                (b"urlpatterns", check_urlpatterns),
+            )
+            if wanted
+        ]
+        if not needles or (content and needle_pattern(*needles).search(content) is None):
+            return
+        tree = self._snapshot.parse_python(path)
+        if tree is None:
+            return
+
+        if check_urlpatterns:
             route_map, _, router_prefixes = _extract_urlpatterns_data(tree)
             if route_map or router_prefixes:
-                has_urlpatterns = True
+                self.has_urlpatterns = True
 
         for node in ast.walk(tree):
-            if not has_django_import and isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                if module.startswith("django"):
-                    has_django_import = True
-                if module.startswith("rest_framework"):
-                    has_drf_import = True
-                if module.startswith("pytest"):
-                    has_pytest = True
-            if not has_django_import and isinstance(node, ast.Import):
-                has_django_import = any(alias.name.startswith("django") for alias in node.names)
-                has_drf_import = has_drf_import or any(alias.name.startswith("rest_framework") for alias in node.names)
-                has_pytest = has_pytest or any(alias.name.startswith("pytest") for alias in node.names)
-            if not has_pytest and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
-                has_pytest = True
-
-    return DjangoSignals(
-        has_django_import=has_django_import,
-        has_drf_import=has_drf_import,
-        has_urlpatterns=has_urlpatterns,
-        has_pytest=has_pytest,
-    )
+            if isinstance(node, ast.ImportFrom):
+                modules = [node.module or ""]
+            elif isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            else:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
+                    self.has_pytest = True
+                continue
+            for module in modules:
+                self.has_django_import = self.has_django_import or module.startswith("django")
+                self.has_drf_import = self.has_drf_import or module.startswith("rest_framework")
+                self.has_pytest = self.has_pytest or module.startswith("pytest")
+            if self.has_django_import and self.has_drf_import and self.has_pytest:
+                break
 
+    def signals(self) -> DjangoSignals:
+        return DjangoSignals(
+            has_django_import=self.has_django_import,
+            has_drf_import=self.has_drf_import,
+            has_urlpatterns=self.has_urlpatterns,
+            has_pytest=self.has_pytest,
+            declared_in=self.declared_in,
+        )
 
-def collect_django_artifacts(repo_path: Path) -> ArtifactBundle:
-    bundle = ArtifactBundle()
-    bundle.all_files = _iter_files(repo_path)
-    bundle.python_files = [path for path in bundle.all_files if path.suffix == ".py"]
-    bundle.dependency_specs.extend(extract_dependency_specs(repo_path, bundle.all_files))
-    bundle.test_files = [path for path in bundle.python_files if _is_test_file(path)]
-    bundle.workflow_automation_issues.extend(collect_workflow_automation_issues(repo_path, bundle.all_files))
-
-    parsed: list[tuple[Path, ast.Module, str, list[str]]] = []
-    for path in bundle.python_files:
-        text = _read_text(path)
-        if not text:
-            continue
-        try:
-            tree = ast.parse(text)
-        except SyntaxError:
-            continue
-        relative = str(path.relative_to(repo_path))
-        parsed.append((path, tree, relative, text.splitlines()))
 
-    route_map: dict[str, list[str]] = {}
-    route_name_map: dict[str, str] = {}
-    router_prefixes: dict[str, list[str]] = {}
-    for path, tree, _, _ in parsed:
-        if path.name != "urls.py":
-            continue
+def scan_django_signals(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> DjangoSignals:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    observer = DjangoProbeObserver(snapshot)
+    run_probe_pass(snapshot, [observer])
+    return observer.signals()
+
+
+def _extract_file_facts(source: ParsedSource, path: Path, relative: str, *, is_test: bool) -> FilePayload:
+    """Extract the rows of one file that do not depend on URL configuration elsewhere in the repository."""
+
+    tree = source.tree
+    if tree is None:
+        return {}
+    source_lines = source.lines
+    index = PythonModuleIndex(tree)
+    facts: FilePayload = {}
+    if path.name == "urls.py":
         local_route_map, local_route_name_map, local_router_prefixes = _extract_urlpatterns_data(tree)
-        for view_ref, route_paths in local_route_map.items():
-            route_map.setdefault(view_ref, []).extend(route_paths)
-        route_name_map.update(local_route_name_map)
-        for router_var, prefixes in local_router_prefixes.items():
-            router_prefixes.setdefault(router_var, []).extend(prefixes)
-
-    viewset_endpoints, viewset_route_names = _extract_viewset_endpoints(parsed, router_prefixes)
-    route_name_map.update(viewset_route_names)
-    bundle.write_endpoints.extend(viewset_endpoints)
-
-    for path, tree, relative, source_lines in parsed:
-        for endpoint_name, method, route_path, line, snippet in _extract_function_endpoints(tree, route_map, source_lines):
-            bundle.write_endpoints.append((relative, endpoint_name, method, route_path, line, snippet))
-        for endpoint_name, method, route_path, line, snippet in _extract_class_endpoints(tree, route_map, source_lines):
-            bundle.write_endpoints.append((relative, endpoint_name, method, route_path, line, snippet))
-
-        if path in bundle.test_files:
-            for case, line, snippet in _extract_test_cases(tree, source_lines):
-                bundle.test_cases.append((relative, case, line, snippet))
-            for test_name, method, route_path, line, snippet in _extract_test_http_calls(tree, source_lines, route_name_map):
-                bundle.test_http_calls.append((relative, test_name, method, route_path, line, snippet))
-            bundle.generated_test_issues.extend(
-                collect_generated_test_issues(
-                    relative_path=relative,
-                    observations=observe_python_test_quality(
-                        tree,
-                        source_lines,
-                        route_resolver=lambda expr, aliases: _resolve_test_route_expr(expr, aliases, route_name_map),
-                    ),
-                )
+        facts["url_routes"] = [(view_ref, route) for view_ref, routes in local_route_map.items() for route in routes]
+        facts["url_route_names"] = list(local_route_name_map.items())
+        facts["url_router_prefixes"] = [
+            (router_var, prefix) for router_var, prefixes in local_router_prefixes.items() for prefix in prefixes
+        ]
+    facts["router_registrations"] = _extract_router_registrations(tree)
+    viewset_classes: list[tuple[str]] = []
+    viewset_actions: list[tuple[int, str, str, str, int, str]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and _is_viewset_class(node):
+            class_ordinal = len(viewset_classes)
+            viewset_classes.append((node.name,))
+            viewset_actions.extend(
+                (class_ordinal, action.endpoint_name, action.method, action.path_suffix, action.line, action.snippet)
+                for action in _extract_viewset_actions(node, source_lines)
             )
+    facts["viewset_classes"] = viewset_classes
+    facts["viewset_actions"] = viewset_actions
+    facts["route_view_names"] = _route_view_names(tree)
+    if is_test:
+        facts["test_cases"] = [
+            (relative, case, line, snippet) for case, line, snippet in _extract_test_cases(tree, source_lines)
+        ]
+    facts["lossy_decode_issues"] = extract_python_lossy_decode_issues(
+        tree=tree,
+        source_lines=source_lines,
+        relative_path=relative,
+        index=index,
+    )
+    facts["uniqueness_default_issues"] = extract_django_uniqueness_default_issues(
+        tree=tree,
+        source_lines=source_lines,
+        relative_path=relative,
+        index=index,
+    )
+    facts["session_lifecycle_issues"] = extract_python_session_lifecycle_issues(
+        tree=tree,
+        source_lines=source_lines,
+        relative_path=relative,
+        index=index,
+    )
+    return facts
 
-        owner_names = {endpoint_name for file_ref, endpoint_name, *_ in bundle.write_endpoints if file_ref == relative}
-        bundle.write_contract_issues.extend(
-            extract_python_lossy_decode_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-            )
-        )
-        bundle.write_contract_issues.extend(
-            extract_django_uniqueness_default_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-            )
-        )
-        bundle.write_contract_issues.extend(
-            extract_python_write_contract_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-                owner_names=owner_names,
-            )
+
+def _extract_routed_rows(
+    source: ParsedSource,
+    relative: str,
+    *,
+    route_map: dict[str, list[str]],
+    route_name_map: dict[str, str],
+    viewset_owner_names: set[str],
+    is_test: bool,
+) -> FilePayload:
+    """Extract the rows of one file that depend on the repository-wide route context."""
+
+    tree = source.tree
+    if tree is None:
+        return {}
+    source_lines = source.lines
+    index = PythonModuleIndex(tree)
+    write_endpoints = [
+        (relative, endpoint_name, method, route_path, line, snippet)
+        for endpoint_name, method, route_path, line, snippet in [
+            *_extract_function_endpoints(tree, route_map, source_lines),
+            *_extract_class_endpoints(tree, route_map, source_lines),
+        ]
+    ]
+    rows: FilePayload = {"write_endpoints": write_endpoints}
+    if is_test:
+        test_http_calls = _extract_test_http_calls(tree, source_lines, route_name_map)
+        rows["test_http_calls"] = [
+            (relative, test_name, method, route_path, line, snippet)
+            for test_name, method, route_path, line, snippet in test_http_calls
+        ]
+        rows["generated_test_issues"] = collect_generated_test_issues(
+            relative_path=relative,
+            observations=observe_python_test_quality(
+                tree,
+                source_lines,
+                route_resolver=lambda expr, aliases: _resolve_test_route_expr(expr, aliases, route_name_map),
+                index=index,
+            ),
         )
-        bundle.session_lifecycle_issues.extend(
-            extract_python_session_lifecycle_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-            )
+    owner_names = viewset_owner_names | {endpoint_name for _, endpoint_name, *_ in write_endpoints}
+    rows["write_contract_issues"] = extract_python_write_contract_issues(
+        tree=tree,
+        source_lines=source_lines,
+        relative_path=relative,
+        owner_names=owner_names,
+        index=index,
+    )
+    return rows
+
+
+def _extract_file_facts_task(task: FileTask) -> FilePayload:
+    return _extract_file_facts(task.load(), Path(task.path), task.relative_path, is_test=task.is_test)
+
+
+def _extract_routed_task(
+    task: FileTask,
+    *,
+    route_map: dict[str, list[str]],
+    route_name_map: dict[str, str],
+    viewset_owners: dict[str, set[str]],
+) -> FilePayload:
+    return _extract_routed_rows(
+        task.load(),
+        task.relative_path,
+        route_map=route_map,
+        route_name_map=route_name_map,
+        viewset_owner_names=viewset_owners.get(task.relative_path, set()),
+        is_test=task.is_test,
+    )
+
+
+def collect_django_artifacts(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    bundle = ArtifactBundle()
+    bundle.all_files = list(snapshot.files)
+    bundle.python_files = snapshot.files_with_suffix(".py")
+    bundle.dependency_specs.extend(extract_dependency_specs(repo_path, snapshot.catalog.requirements_files, snapshot=snapshot))
+    bundle.test_files = list(snapshot.catalog.python_test_files)
+    bundle.workflow_automation_issues.extend(
+        collect_workflow_automation_issues(repo_path, snapshot.catalog.workflow_files)
+    )
+
+    tasks = [
+        task
+        for path in bundle.python_files
+        if (task := file_task(snapshot, path, is_test=snapshot.catalog.is_python_test_file(path))) is not None
+    ]
+    file_facts = collect_file_payloads(
+        snapshot,
+        tasks,
+        worker=_extract_file_facts_task,
+        namespace=_FILE_FACTS_NAMESPACE,
+        collector_version=_ARTIFACT_CACHE_VERSION,
+        codecs=_FILE_FACTS_CODECS,
+    )
+
+    route_index = DjangoRouteIndex.from_file_facts(
+        (task.relative_path, facts) for task, facts in zip(tasks, file_facts)
+    )
+    bundle.write_endpoints.extend(route_index.viewset_endpoints)
+    routed_tasks = [
+        replace(
+            task,
+            context=route_index.route_context(
+                task.relative_path,
+                (name for (name,) in facts.get("route_view_names", [])),
+                is_test=task.is_test,
+            ),
         )
+        for task, facts in zip(tasks, file_facts)
+    ]
+    routed_rows = collect_file_payloads(
+        snapshot,
+        routed_tasks,
+        worker=partial(
+            _extract_routed_task,
+            route_map=route_index.route_map,
+            route_name_map=route_index.route_name_map,
+            viewset_owners=route_index.viewset_owners,
+        ),
+        namespace=_ROUTED_NAMESPACE,
+        collector_version=_ARTIFACT_CACHE_VERSION,
+        codecs=_ROUTED_CODECS,
+    )
+    for facts, routed in zip(file_facts, routed_rows):
+        bundle.write_endpoints.extend(routed.get("write_endpoints", []))
+        bundle.test_cases.extend(facts.get("test_cases", []))
+        bundle.test_http_calls.extend(routed.get("test_http_calls", []))
+        bundle.generated_test_issues.extend(routed.get("generated_test_issues", []))
+        bundle.write_contract_issues.extend(facts.get("lossy_decode_issues", []))
+        bundle.write_contract_issues.extend(facts.get("uniqueness_default_issues", []))
+        bundle.write_contract_issues.extend(routed.get("write_contract_issues", []))
+        bundle.session_lifecycle_issues.extend(facts.get("session_lifecycle_issues", []))
 
     return bundle
 
 
-__all__ = ["DjangoSignals", "collect_django_artifacts", "scan_django_signals"]
+__all__ = ["DjangoProbeObserver", "DjangoSignals", "collect_django_artifacts", "scan_django_signals"]
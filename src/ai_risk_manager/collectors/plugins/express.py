@@ -3,13 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Literal, cast
 
-from ai_risk_manager.collectors.plugins.base import ArtifactBundle, StackProbeResult
+from ai_risk_manager.collectors.plugins.base import ArtifactBundle, ProbeObserver, StackProbeResult
 from ai_risk_manager.collectors.plugins.express_artifacts import (
+    ExpressProbeObserver,
     ExpressSignals,
     collect_express_artifacts,
     scan_express_signals,
 )
 from ai_risk_manager.collectors.plugins.sdk import CapabilitySignalPluginMixin
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 from ai_risk_manager.schemas.types import Confidence, PreflightResult
 
 
@@ -21,6 +23,8 @@ def _probe_reasons(signals: ExpressSignals) -> list[str]:
         reasons.append("Detected Express write route handlers.")
     if signals.has_test_framework:
         reasons.append("Detected JavaScript test patterns.")
+    if signals.declared_in:
+        reasons.append(f"Express is declared as a dependency in {signals.declared_in}.")
     return reasons
 
 
@@ -64,8 +68,18 @@ class ExpressCollectorPlugin(CapabilitySignalPluginMixin):
         "side_effect_emit_contract",
     }
 
-    def probe(self, repo_path: Path) -> StackProbeResult | None:
-        signals = scan_express_signals(repo_path)
+    def probe(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackProbeResult | None:
+        return self._probe_from_signals(scan_express_signals(repo_path, snapshot=snapshot))
+
+    def probe_observer(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ExpressProbeObserver:
+        return ExpressProbeObserver(resolve_snapshot(repo_path, snapshot))
+
+    def probe_from_observer(self, observer: ProbeObserver) -> StackProbeResult | None:
+        if not isinstance(observer, ExpressProbeObserver):
+            raise TypeError(f"expected ExpressProbeObserver, got {type(observer).__name__}")
+        return self._probe_from_signals(observer.signals())
+
+    def _probe_from_signals(self, signals: ExpressSignals) -> StackProbeResult | None:
         if not signals.has_express_import and not signals.has_write_routes:
             return None
 
@@ -81,12 +95,18 @@ class ExpressCollectorPlugin(CapabilitySignalPluginMixin):
             probe_data=signals,
         )
 
-    def preflight(self, repo_path: Path, probe_data: object | None = None) -> PreflightResult:
-        signals = probe_data if isinstance(probe_data, ExpressSignals) else scan_express_signals(repo_path)
+    def preflight(
+        self,
+        repo_path: Path,
+        probe_data: object | None = None,
+        *,
+        snapshot: RepoSnapshot | None = None,
+    ) -> PreflightResult:
+        signals = probe_data if isinstance(probe_data, ExpressSignals) else scan_express_signals(repo_path, snapshot=snapshot)
         return _preflight_from_signals(signals)
 
-    def collect(self, repo_path: Path) -> ArtifactBundle:
-        return collect_express_artifacts(repo_path)
+    def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+        return collect_express_artifacts(repo_path, snapshot=snapshot)
 
 
 __all__ = ["ExpressCollectorPlugin", "ExpressSignals", "scan_express_signals"]
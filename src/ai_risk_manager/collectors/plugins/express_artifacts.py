@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache, partial
+import mmap
 from pathlib import Path
 import re
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.anchored_scan import AnchoredPattern, AnchorScanner
+from ai_risk_manager.collectors.artifact_cache import FilePayload, RowCodec
+from ai_risk_manager.collectors.parallel import FileTask, collect_file_payloads, file_task
+from ai_risk_manager.collectors.parse_cache import ParsedSource
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle, IngressCoverageArtifact, IngressSurfaceArtifact
 from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
 from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
@@ -12,10 +20,29 @@ from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
     observe_js_test_quality,
 )
 from ai_risk_manager.collectors.plugins.workflow_automation_artifacts import collect_workflow_automation_issues
+from ai_risk_manager.collectors.probe_prefilter import manifest_declaring, run_probe_pass
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 
 WRITE_METHODS = ("post", "put", "patch", "delete")
 JS_SUFFIXES = {".js", ".cjs", ".mjs", ".ts", ".tsx"}
 CSS_SUFFIXES = {".css"}
+_ARTIFACT_CACHE_NAMESPACE = "express"
+_ARTIFACT_CACHE_VERSION = "3"
+_FILE_PAYLOAD_CODECS: dict[str, RowCodec] = {
+    "test_cases": None,
+    "test_ingress_calls": IngressCoverageArtifact,
+    "test_http_calls": None,
+    "generated_test_issues": None,
+    "write_endpoints": None,
+    "ingress_surfaces": IngressSurfaceArtifact,
+    "auth_middleware": None,
+    "write_contract_issues": None,
+    "session_lifecycle_issues": None,
+    "html_render_issues": None,
+    "ui_ergonomics_issues": None,
+    "row_mapped_fields": None,
+    "note_field_usages": None,
+}
 _EXPRESS_IMPORT_RE = re.compile(r"(?:require\(\s*['\"]express['\"]\s*\))|(?:from\s+['\"]express['\"])", re.IGNORECASE)
 _ROUTE_CALL_RE = re.compile(
     r"\b(?P<receiver>[A-Za-z_$][A-Za-z0-9_$]*)\.(?P<method>post|put|patch|delete)\s*\(\s*"
@@ -40,6 +67,11 @@ _TEST_CASE_RE = re.compile(
     re.IGNORECASE,
 )
 _TEST_HINT_RE = re.compile(r"\b(?:describe|it|test)\s*\(", re.IGNORECASE)
+# Byte twins of the probe patterns scan raw or memory-mapped file content without decoding it.
+_EXPRESS_IMPORT_BYTES_RE = re.compile(_EXPRESS_IMPORT_RE.pattern.encode("ascii"), re.IGNORECASE)
+_ROUTE_CALL_BYTES_RE = re.compile(_ROUTE_CALL_RE.pattern.encode("ascii"), re.IGNORECASE)
+_TEST_HINT_BYTES_RE = re.compile(_TEST_HINT_RE.pattern.encode("ascii"), re.IGNORECASE)
+_APP_USE_RE = re.compile(r"\bapp\.use\s*\(", re.IGNORECASE)
 _APP_USE_PREFIX_RE = re.compile(r"\bapp\.use\s*\(\s*(?P<quote>['\"`])(?P<prefix>/[^'\"`]*)?(?P=quote)\s*,", re.IGNORECASE)
 _AUTH_HINT_RE = re.compile(
     r"(req\.(?:header|get)\s*\(|authorization|x-session-token|x-api-key|bearer|token)",
@@ -58,6 +90,24 @@ _FUNCTION_HEADER_RE = re.compile(
     r"\b(?:async\s+)?function\s+(?P<name>[A-Za-z_$][A-Za-z0-9_$]*)\s*\((?P<params>[^)]*)\)",
     re.IGNORECASE,
 )
+_ARROW_BINDING_RE = re.compile(
+    r"\b(?:const|let|var)\s+(?P<name>[A-Za-z_$][A-Za-z0-9_$]*)\s*=\s*(?:async\s*)?"
+    r"(?:\((?P<params>[^)]*)\)|(?P<param>[A-Za-z_$][A-Za-z0-9_$]*))\s*(?::[^=;\n]*)?=>"
+)
+# ``name(params) {`` opening a line is a class or object method; control-flow keywords share the shape.
+_METHOD_HEADER_RE = re.compile(
+    r"^[ \t]*(?:(?:public|private|protected|static|async|get|set)\s+)*"
+    r"(?P<name>(?!(?:if|for|while|switch|catch|with|function|return|super)\b)[A-Za-z_$][A-Za-z0-9_$]*)"
+    r"\s*\((?P<params>[^)]*)\)\s*(?::[^{;\n]*)?\{",
+    re.MULTILINE,
+)
+# Comments and string or template literals. Regular-expression literals are not recognised, so a quote
+# inside one hides the rest of its line; template substitutions count as part of the literal.
+_JS_LITERAL_RE = re.compile(
+    r"//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|/\*[\s\S]*"
+    r"|'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'?|\"[^\"\\\n]*(?:\\[\s\S][^\"\\\n]*)*\"?"
+    r"|`[^`\\]*(?:\\[\s\S][^`\\]*)*`?"
+)
 _INPUT_CHAR_SPLIT_RE = re.compile(
     r"input\.(?P<field>[A-Za-z_$][A-Za-z0-9_$]*)[^\n;]*?\.split\(\s*(?P<quote>['\"])\s*(?P=quote)\s*\)",
     re.IGNORECASE,
@@ -93,6 +143,7 @@ _SAVE_BUTTON_OR_RE = re.compile(
     re.IGNORECASE,
 )
 _APP_MIN_WIDTH_RE = re.compile(r"\.app\s*\{[\s\S]*?\bmin-width\s*:\s*(?P<value>\d+)px\s*;", re.IGNORECASE)
+_INNER_HTML_RE = re.compile(r"(?P<target>[A-Za-z0-9_$.]+)\.innerHTML\s*=\s*(?P<expr>[\s\S]*?);")
 _JOB_PROCESS_RE = re.compile(
     r"\b(?:queue|worker|agenda)\.(?:process|define)\s*\(\s*(?P<quote>['\"`])(?P<name>[^'\"`]+)(?P=quote)"
     r"(?:\s*,\s*(?P<handler>[A-Za-z_$][A-Za-z0-9_$]*))?",
@@ -120,31 +171,83 @@ _EMIT_EVENT_TEST_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Per-file extraction runs every pattern through one ``AnchorScanner``: a pattern is skipped unless its
+# literal anchors occur, and its regex is only tried where they do. Anchors are lowercase for IGNORECASE
+# patterns; ``lead`` covers the receiver run in front of anchors such as ``.post`` and ``.innerHTML``, and
+# ``head`` keeps failed attempts from being retried across a receiver run or, for lazy-span patterns,
+# from rescanning to the end of the file once their span cannot close.
+_IDENTIFIER_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_$")
+_WRITE_CALL_ANCHORS = (".post", ".put", ".patch", ".delete")
+_ROUTE_CALL_SCAN = AnchoredPattern(_ROUTE_CALL_RE, _WRITE_CALL_ANCHORS, lead=_IDENTIFIER_CHARS)
+_TEST_CALL_SCAN = AnchoredPattern(_TEST_CALL_RE, _WRITE_CALL_ANCHORS)
+_TEST_CASE_SCAN = AnchoredPattern(_TEST_CASE_RE)
+_APP_USE_SCAN = AnchoredPattern(_APP_USE_RE, ("app.use",))
+_DB_RUN_INSERT_SCAN = AnchoredPattern(
+    _DB_RUN_INSERT_RE,
+    ("db.run(",),
+    required=("insert",),
+    head=re.compile(r"db\.run\(\s*`\s*INSERT", re.IGNORECASE),
+)
+_DB_RUN_UPDATE_SCAN = AnchoredPattern(
+    _DB_RUN_UPDATE_RE,
+    ("db.run(",),
+    required=("update",),
+    head=re.compile(r"db\.run\(\s*`\s*UPDATE", re.IGNORECASE),
+)
+_FUNCTION_HEADER_SCAN = AnchoredPattern(_FUNCTION_HEADER_RE, ("async", "function"), required=("function",))
+_ARROW_BINDING_SCAN = AnchoredPattern(_ARROW_BINDING_RE, ("const", "let", "var"), required=("=>",))
+_METHOD_HEADER_SCAN = AnchoredPattern(_METHOD_HEADER_RE, required=("{",))
+_INPUT_CHAR_SPLIT_SCAN = AnchoredPattern(_INPUT_CHAR_SPLIT_RE, ("input.",), required=(".split(",))
+_ROW_FIELD_SCAN = AnchoredPattern(_ROW_FIELD_RE, required=("row.",))
+_NOTE_FIELD_SCAN = AnchoredPattern(_NOTE_FIELD_RE, ("note.",))
+_LOCAL_STORAGE_SCAN = AnchoredPattern(_LOCAL_STORAGE_RE, ("localstorage.",))
+_INPUT_UPDATED_AT_VAR_SCAN = AnchoredPattern(
+    _INPUT_UPDATED_AT_VAR_RE, ("const", "let", "var"), required=("input.updatedat",)
+)
+_READING_ROUND_SCAN = AnchoredPattern(_READING_ROUND_RE, ("math.round(",))
+_PRIORITY_TERNARY_SCAN = AnchoredPattern(_PRIORITY_TERNARY_RE, required=(".tofixed(",))
+_ISO_NOW_COMPARE_SCAN = AnchoredPattern(_ISO_NOW_COMPARE_RE, required=("date().toisostring()",))
+_ISO_NOW_COMPARE_REVERSE_SCAN = AnchoredPattern(
+    _ISO_NOW_COMPARE_RE_REVERSE, ("new",), required=("date().toisostring()",)
+)
+_SAVE_BUTTON_OR_SCAN = AnchoredPattern(
+    _SAVE_BUTTON_OR_RE,
+    (".disabled",),
+    lead=_IDENTIFIER_CHARS | {"."},
+    head=re.compile(r"\b[A-Za-z0-9_$.]+\.disabled", re.IGNORECASE),
+    lazy_tail=False,
+)
+_APP_MIN_WIDTH_SCAN = AnchoredPattern(
+    _APP_MIN_WIDTH_RE, (".app",), required=("min-width",), head=re.compile(r"\.app\s*\{", re.IGNORECASE)
+)
+_INNER_HTML_SCAN = AnchoredPattern(
+    _INNER_HTML_RE,
+    (".innerHTML",),
+    lead=_IDENTIFIER_CHARS | {"."},
+    head=re.compile(r"[A-Za-z0-9_$.]+\.innerHTML\s*=\s*"),
+)
+_JOB_PROCESS_SCAN = AnchoredPattern(_JOB_PROCESS_RE, ("queue.", "worker.", "agenda."))
+_CLI_COMMAND_SCAN = AnchoredPattern(_CLI_COMMAND_RE, ("program.", "cli.", "yargs."))
+_EVENT_CONSUMER_SCAN = AnchoredPattern(_EVENT_CONSUMER_RE, ("bus.", "consumer.", "subscriber.", "eventbus."))
+_RUN_JOB_TEST_SCAN = AnchoredPattern(_RUN_JOB_TEST_RE, ("runjob",))
+_RUN_CLI_TEST_SCAN = AnchoredPattern(_RUN_CLI_TEST_RE, ("runcli",))
+_EMIT_EVENT_TEST_SCAN = AnchoredPattern(_EMIT_EVENT_TEST_RE, ("emitevent",))
+
 
 @dataclass
 class ExpressSignals:
     has_express_import: bool
     has_write_routes: bool
     has_test_framework: bool
+    declared_in: str = ""
 
 
-def _read_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return ""
-
-
-def _iter_files(repo_path: Path) -> list[Path]:
-    return iter_project_files(repo_path)
-
-
-def _iter_js_files(all_files: list[Path]) -> list[Path]:
-    return [path for path in all_files if path.suffix.lower() in JS_SUFFIXES]
+def _iter_js_files(snapshot: RepoSnapshot) -> list[Path]:
+    return snapshot.files_with_suffix(*JS_SUFFIXES)
 
 
-def _iter_css_files(all_files: list[Path]) -> list[Path]:
-    return [path for path in all_files if path.suffix.lower() in CSS_SUFFIXES]
+def _iter_css_files(snapshot: RepoSnapshot) -> list[Path]:
+    return snapshot.files_with_suffix(*CSS_SUFFIXES)
 
 
 def _is_test_file(path: Path) -> bool:
@@ -159,10 +262,6 @@ def _is_test_file(path: Path) -> bool:
     )
 
 
-def _line_from_offset(text: str, offset: int) -> int:
-    return text.count("\n", 0, offset) + 1
-
-
 def _line_snippet(source_lines: list[str], line: int, *, window: int = 3) -> str:
     start = max(0, line - 1)
     end = min(len(source_lines), start + window)
@@ -201,17 +300,46 @@ def _path_has_prefix(route_path: str, prefix: str) -> bool:
     return normalized_route == normalized_prefix or normalized_route.startswith(f"{normalized_prefix}/")
 
 
-def _extract_write_endpoints(path: Path, repo_path: Path, text: str, source_lines: list[str]) -> list[tuple[str, str, str, str, int, str]]:
+def _is_route_receiver(receiver: str) -> bool:
+    lowered = receiver.lower()
+    return lowered in {"app", "router"} or lowered.endswith("router")
+
+
+class _LiteralSpans:
+    """Comment and string-literal spans of one JavaScript text, for O(log n) checks that an offset is not code."""
+
+    __slots__ = ("_ends", "_starts")
+
+    def __init__(self, text: str) -> None:
+        starts = array("I")
+        ends = array("I")
+        for match in _JS_LITERAL_RE.finditer(text):
+            starts.append(match.start())
+            ends.append(match.end())
+        self._starts = starts
+        self._ends = ends
+
+    def covers(self, offset: int) -> bool:
+        index = bisect_right(self._starts, offset) - 1
+        return index >= 0 and offset < self._ends[index]
+
+
+def _extract_write_endpoints(
+    path: Path,
+    repo_path: Path,
+    scanner: AnchorScanner,
+    source: ParsedSource,
+    load_literals: Callable[[], _LiteralSpans],
+) -> list[tuple[str, str, str, str, int, str]]:
     endpoints: list[tuple[str, str, str, str, int, str]] = []
     rel_path = str(path.relative_to(repo_path))
 
-    for match in _ROUTE_CALL_RE.finditer(text):
-        receiver = match.group("receiver").lower()
-        if receiver not in {"app", "router"} and not receiver.endswith("router"):
+    for match in scanner.finditer(_ROUTE_CALL_SCAN):
+        if not _is_route_receiver(match.group("receiver")) or load_literals().covers(match.start()):
             continue
         method = match.group("method").upper()
         route_path = match.group("path")
-        line = _line_from_offset(text, match.start())
+        line = source.line_index.line_of(match.start())
         handler = match.group("handler")
         endpoint_name = _normalize_endpoint_name(method, route_path, line, handler)
         endpoints.append(
@@ -221,7 +349,7 @@ def _extract_write_endpoints(path: Path, repo_path: Path, text: str, source_line
                 method,
                 route_path,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
             )
         )
     return endpoints
@@ -230,14 +358,14 @@ def _extract_write_endpoints(path: Path, repo_path: Path, text: str, source_line
 def _extract_generic_ingress_surfaces(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
 ) -> list[IngressSurfaceArtifact]:
     rel_path = str(path.relative_to(repo_path))
     surfaces: list[IngressSurfaceArtifact] = []
 
-    for match in _JOB_PROCESS_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_JOB_PROCESS_SCAN):
+        line = source.line_index.line_of(match.start())
         name = match.group("name").strip()
         handler = (match.group("handler") or "").strip() or name
         surfaces.append(
@@ -250,12 +378,12 @@ def _extract_generic_ingress_surfaces(
                 target=name,
                 method="RUN",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
-    for match in _CLI_COMMAND_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_CLI_COMMAND_SCAN):
+        line = source.line_index.line_of(match.start())
         name = match.group("name").strip()
         surfaces.append(
             IngressSurfaceArtifact(
@@ -267,12 +395,12 @@ def _extract_generic_ingress_surfaces(
                 target=name,
                 method="RUN",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
-    for match in _EVENT_CONSUMER_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_EVENT_CONSUMER_SCAN):
+        line = source.line_index.line_of(match.start())
         name = match.group("name").strip()
         handler = (match.group("handler") or "").strip() or name
         surfaces.append(
@@ -285,7 +413,7 @@ def _extract_generic_ingress_surfaces(
                 target=name,
                 method="CONSUME",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
@@ -295,14 +423,14 @@ def _extract_generic_ingress_surfaces(
 def _extract_test_ingress_calls(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
 ) -> list[IngressCoverageArtifact]:
     rel_path = str(path.relative_to(repo_path))
     rows: list[IngressCoverageArtifact] = []
 
-    for match in _RUN_JOB_TEST_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_RUN_JOB_TEST_SCAN):
+        line = source.line_index.line_of(match.start())
         rows.append(
             IngressCoverageArtifact(
                 file_path=rel_path,
@@ -313,12 +441,12 @@ def _extract_test_ingress_calls(
                 target=match.group("name").strip(),
                 method="RUN",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
-    for match in _RUN_CLI_TEST_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_RUN_CLI_TEST_SCAN):
+        line = source.line_index.line_of(match.start())
         rows.append(
             IngressCoverageArtifact(
                 file_path=rel_path,
@@ -329,12 +457,12 @@ def _extract_test_ingress_calls(
                 target=match.group("name").strip(),
                 method="RUN",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
-    for match in _EMIT_EVENT_TEST_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_EMIT_EVENT_TEST_SCAN):
+        line = source.line_index.line_of(match.start())
         rows.append(
             IngressCoverageArtifact(
                 file_path=rel_path,
@@ -345,16 +473,22 @@ def _extract_test_ingress_calls(
                 target=match.group("name").strip(),
                 method="CONSUME",
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
             )
         )
 
     return rows
 
 
-def _extract_auth_middleware(path: Path, repo_path: Path, text: str, source_lines: list[str]) -> list[tuple[str, int, str]]:
+def _extract_auth_middleware(
+    path: Path,
+    repo_path: Path,
+    scanner: AnchorScanner,
+    source: ParsedSource,
+    load_literals: Callable[[], _LiteralSpans],
+) -> list[tuple[str, int, str]]:
     matches: list[tuple[str, int, str]] = []
-    for start_offset, block in _iter_app_use_blocks(text):
+    for start_offset, block in _iter_app_use_blocks(scanner, load_literals):
         prefix_match = _APP_USE_PREFIX_RE.search(block)
         if prefix_match is None:
             continue
@@ -362,15 +496,18 @@ def _extract_auth_middleware(path: Path, repo_path: Path, text: str, source_line
         body = block[prefix_match.end() :]
         if not (_AUTH_HINT_RE.search(body) and _AUTH_DENY_RE.search(body)):
             continue
-        line = _line_from_offset(text, start_offset)
-        matches.append((prefix, line, _line_snippet(source_lines, line)))
+        line = source.line_index.line_of(start_offset)
+        matches.append((prefix, line, _line_snippet(source.lines, line)))
     return matches
 
 
-def _iter_app_use_blocks(text: str) -> list[tuple[int, str]]:
+def _iter_app_use_blocks(scanner: AnchorScanner, load_literals: Callable[[], _LiteralSpans]) -> list[tuple[int, str]]:
+    text = scanner.text
     blocks: list[tuple[int, str]] = []
-    for match in re.finditer(r"\bapp\.use\s*\(", text, re.IGNORECASE):
+    for match in scanner.finditer(_APP_USE_SCAN):
         start = match.start()
+        if load_literals().covers(start):
+            continue
         open_idx = text.find("(", start)
         if open_idx == -1:
             continue
@@ -436,35 +573,51 @@ def _extract_authorization_boundaries(
     return boundaries
 
 
-def _nearest_test_name(source_lines: list[str], line: int) -> str:
-    start = max(0, line - 20)
-    for idx in range(line - 1, start - 1, -1):
-        match = _TEST_CASE_RE.search(source_lines[idx])
-        if match:
-            return match.group("name").strip() or f"test_line_{line}"
+def _test_names_by_line(scanner: AnchorScanner, source: ParsedSource, literals: _LiteralSpans) -> dict[int, str]:
+    """Map each line that opens a ``test('name'`` or ``it('name'`` call in code to the first such name on it."""
+
+    names: dict[int, str] = {}
+    for match in scanner.finditer(_TEST_CASE_SCAN):
+        if not literals.covers(match.start()):
+            names.setdefault(source.line_index.line_of(match.start()), match.group("name").strip())
+    return names
+
+
+def _nearest_test_name(test_names: dict[int, str], line: int) -> str:
+    for candidate in range(line, max(0, line - 20), -1):
+        if candidate in test_names:
+            return test_names[candidate] or f"test_line_{line}"
     return f"test_line_{line}"
 
 
-def _extract_test_cases(path: Path, repo_path: Path, source_lines: list[str]) -> list[tuple[str, str, int, str]]:
+def _extract_test_cases(
+    path: Path,
+    repo_path: Path,
+    test_names: dict[int, str],
+    source: ParsedSource,
+) -> list[tuple[str, str, int, str]]:
     rel_path = str(path.relative_to(repo_path))
-    rows: list[tuple[str, str, int, str]] = []
-    for idx, line in enumerate(source_lines, start=1):
-        match = _TEST_CASE_RE.search(line)
-        if not match:
-            continue
-        rows.append((rel_path, match.group("name").strip(), idx, _line_snippet(source_lines, idx)))
-    return rows
+    return [(rel_path, name, line, _line_snippet(source.lines, line)) for line, name in test_names.items()]
 
 
-def _extract_test_http_calls(path: Path, repo_path: Path, text: str, source_lines: list[str]) -> list[tuple[str, str, str, str, int, str]]:
+def _extract_test_http_calls(
+    path: Path,
+    repo_path: Path,
+    scanner: AnchorScanner,
+    literals: _LiteralSpans,
+    test_names: dict[int, str],
+    source: ParsedSource,
+) -> list[tuple[str, str, str, str, int, str]]:
     rel_path = str(path.relative_to(repo_path))
     rows: list[tuple[str, str, str, str, int, str]] = []
-    for match in _TEST_CALL_RE.finditer(text):
+    for match in scanner.finditer(_TEST_CALL_SCAN):
+        if literals.covers(match.start()):
+            continue
         method = match.group("method").upper()
         route_path = match.group("path")
-        line = _line_from_offset(text, match.start())
-        test_name = _nearest_test_name(source_lines, line)
-        rows.append((rel_path, test_name, method, route_path, line, _line_snippet(source_lines, line)))
+        line = source.line_index.line_of(match.start())
+        test_name = _nearest_test_name(test_names, line)
+        rows.append((rel_path, test_name, method, route_path, line, _line_snippet(source.lines, line)))
     return rows
 
 
@@ -481,16 +634,21 @@ def _split_args(args_block: str) -> list[str]:
     return [part.strip() for part in args_block.split(",") if part.strip()]
 
 
-def _indexed_functions(text: str) -> list[tuple[int, str, set[str]]]:
+def _indexed_functions(
+    scanner: AnchorScanner, load_literals: Callable[[], _LiteralSpans]
+) -> list[tuple[int, str, set[str]]]:
+    """Return ``(start, name, params)`` for function declarations, arrow bindings, and methods, in source order."""
+
     rows: list[tuple[int, str, set[str]]] = []
-    for match in _FUNCTION_HEADER_RE.finditer(text):
-        params = {
-            token.strip()
-            for token in re.split(r"[\s,]+", match.group("params"))
-            if token.strip()
-        }
-        rows.append((match.start(), match.group("name"), params))
-    return rows
+    for anchored in (_FUNCTION_HEADER_SCAN, _ARROW_BINDING_SCAN, _METHOD_HEADER_SCAN):
+        for match in scanner.finditer(anchored):
+            params_text = match.group("params") or match.groupdict().get("param") or ""
+            params = {token.strip() for token in re.split(r"[\s,]+", params_text) if token.strip()}
+            rows.append((match.start(), match.group("name"), params))
+    if rows:
+        literals = load_literals()
+        rows = [row for row in rows if not literals.covers(row[0])]
+    return sorted(rows, key=lambda row: row[0])
 
 
 def _owner_for_offset(functions: list[tuple[int, str, set[str]]], offset: int) -> tuple[str, set[str]]:
@@ -504,21 +662,21 @@ def _owner_for_offset(functions: list[tuple[int, str, set[str]]], offset: int) -
     return owner_name, owner_params
 
 
-def _extract_row_mapped_fields(text: str, source_lines: list[str]) -> dict[str, tuple[int, str]]:
+def _extract_row_mapped_fields(scanner: AnchorScanner, source: ParsedSource) -> dict[str, tuple[int, str]]:
     fields: dict[str, tuple[int, str]] = {}
-    for match in _ROW_FIELD_RE.finditer(text):
+    for match in scanner.finditer(_ROW_FIELD_SCAN):
         field_name = match.group("key")
-        line = _line_from_offset(text, match.start())
-        fields[field_name] = (line, _line_snippet(source_lines, line))
+        line = source.line_index.line_of(match.start())
+        fields[field_name] = (line, _line_snippet(source.lines, line))
     return fields
 
 
-def _extract_note_field_usages(text: str, source_lines: list[str]) -> list[tuple[str, int, str]]:
+def _extract_note_field_usages(scanner: AnchorScanner, source: ParsedSource) -> list[tuple[str, int, str]]:
     rows: list[tuple[str, int, str]] = []
-    for match in _NOTE_FIELD_RE.finditer(text):
+    for match in scanner.finditer(_NOTE_FIELD_SCAN):
         field_name = match.group("field")
-        line = _line_from_offset(text, match.start())
-        rows.append((field_name, line, _line_snippet(source_lines, line)))
+        line = source.line_index.line_of(match.start())
+        rows.append((field_name, line, _line_snippet(source.lines, line)))
     return rows
 
 
@@ -563,16 +721,17 @@ def _extract_response_field_alias_issues(
 def _extract_write_contract_issues(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
+    load_literals: Callable[[], _LiteralSpans],
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
     rel_path = str(path.relative_to(repo_path))
-    functions = _indexed_functions(text)
+    functions = _indexed_functions(scanner, load_literals)
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     seen: set[tuple[str, str, int]] = set()
 
-    for match in _INPUT_CHAR_SPLIT_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_INPUT_CHAR_SPLIT_SCAN):
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
         field_name = match.group("field")
         marker = ("char_split_normalization", owner_name, line)
@@ -585,15 +744,15 @@ def _extract_write_contract_issues(
                 "char_split_normalization",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {"field_name": field_name},
             )
         )
 
-    for match in _DB_RUN_INSERT_RE.finditer(text):
+    for match in scanner.finditer(_DB_RUN_INSERT_SCAN):
         sql = match.group("sql")
         args = match.group("args")
-        line = _line_from_offset(text, match.start())
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
 
         col_match = re.search(r"INSERT\s+INTO\s+[^(]+\((?P<cols>[\s\S]*?)\)\s*VALUES", sql, re.IGNORECASE)
@@ -625,7 +784,7 @@ def _extract_write_contract_issues(
                     "db_insert_binding_mismatch",
                     owner_name,
                     line,
-                    _line_snippet(source_lines, line),
+                    _line_snippet(source.lines, line),
                     {
                         "column": column,
                         "value_field": value_field,
@@ -635,12 +794,12 @@ def _extract_write_contract_issues(
 
     client_updated_vars = {
         match.group("name")
-        for match in _INPUT_UPDATED_AT_VAR_RE.finditer(text)
+        for match in scanner.finditer(_INPUT_UPDATED_AT_VAR_SCAN)
     }
-    for match in _DB_RUN_UPDATE_RE.finditer(text):
+    for match in scanner.finditer(_DB_RUN_UPDATE_SCAN):
         sql = match.group("sql")
         args = match.group("args")
-        line = _line_from_offset(text, match.start())
+        line = source.line_index.line_of(match.start())
         owner_name, owner_params = _owner_for_offset(functions, match.start())
         sql_flat = " ".join(sql.lower().split())
         if " where " not in sql_flat:
@@ -658,7 +817,7 @@ def _extract_write_contract_issues(
                         "write_scope_missing_entity_filter",
                         owner_name,
                         line,
-                        _line_snippet(source_lines, line),
+                        _line_snippet(source.lines, line),
                         {"missing_filter": "id"},
                     )
                 )
@@ -684,13 +843,13 @@ def _extract_write_contract_issues(
                 "stale_write_without_conflict_guard",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {},
             )
         )
 
-    for match in _READING_ROUND_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_READING_ROUND_SCAN):
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
         owner_lower = owner_name.lower()
         numerator = match.group("numerator")
@@ -709,7 +868,7 @@ def _extract_write_contract_issues(
                 "reading_time_rounding_floor_missing",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {
                     "expression": match.group(0).strip(),
                     "divisor": match.group("divisor"),
@@ -717,8 +876,8 @@ def _extract_write_contract_issues(
             )
         )
 
-    for match in _PRIORITY_TERNARY_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_PRIORITY_TERNARY_SCAN):
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
         owner_lower = owner_name.lower()
         if "priority" not in owner_lower:
@@ -737,7 +896,7 @@ def _extract_write_contract_issues(
                 "priority_ternary_constant_branch",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {
                     "flag_name": match.group("flag").strip(),
                     "true_branch": match.group("true_expr").strip(),
@@ -746,8 +905,8 @@ def _extract_write_contract_issues(
             )
         )
 
-    for match in _ISO_NOW_COMPARE_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_ISO_NOW_COMPARE_SCAN):
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
         compared_value = match.group("left").strip()
         owner_lower = owner_name.lower()
@@ -766,7 +925,7 @@ def _extract_write_contract_issues(
                 "date_string_compare_with_iso",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {
                     "compared_value": compared_value,
                     "operator": match.group("op"),
@@ -774,8 +933,8 @@ def _extract_write_contract_issues(
             )
         )
 
-    for match in _ISO_NOW_COMPARE_RE_REVERSE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_ISO_NOW_COMPARE_REVERSE_SCAN):
+        line = source.line_index.line_of(match.start())
         owner_name, _owner_params = _owner_for_offset(functions, match.start())
         compared_value = match.group("right").strip()
         owner_lower = owner_name.lower()
@@ -794,7 +953,7 @@ def _extract_write_contract_issues(
                 "date_string_compare_with_iso",
                 owner_name,
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {
                     "compared_value": compared_value,
                     "operator": match.group("op"),
@@ -808,16 +967,16 @@ def _extract_write_contract_issues(
 def _extract_session_lifecycle_issues(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
     rel_path = str(path.relative_to(repo_path))
     events: dict[str, list[tuple[str, str, int, str]]] = {"setItem": [], "getItem": [], "removeItem": []}
-    for match in _LOCAL_STORAGE_RE.finditer(text):
+    for match in scanner.finditer(_LOCAL_STORAGE_SCAN):
         op = match.group("op")
         key = match.group("key")
-        line = _line_from_offset(text, match.start())
-        events[op].append((key, _normalize_key_name(key), line, _line_snippet(source_lines, line)))
+        line = source.line_index.line_of(match.start())
+        events[op].append((key, _normalize_key_name(key), line, _line_snippet(source.lines, line)))
 
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     seen: set[tuple[str, str]] = set()
@@ -850,19 +1009,19 @@ def _extract_session_lifecycle_issues(
 def _extract_html_render_issues(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
     rel_path = str(path.relative_to(repo_path))
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     seen: set[tuple[str, int]] = set()
-    for match in re.finditer(r"(?P<target>[A-Za-z0-9_$.]+)\.innerHTML\s*=\s*(?P<expr>[\s\S]*?);", text):
+    for match in scanner.finditer(_INNER_HTML_SCAN):
         expr = match.group("expr")
         if "${" not in expr or "note." not in expr:
             continue
         if "sanitize" in expr.lower():
             continue
-        line = _line_from_offset(text, match.start())
+        line = source.line_index.line_of(match.start())
         marker = (match.group("target"), line)
         if marker in seen:
             continue
@@ -873,7 +1032,7 @@ def _extract_html_render_issues(
                 "unsanitized_innerhtml",
                 "renderNotes",
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {
                     "sink": f"{match.group('target')}.innerHTML",
                 },
@@ -885,16 +1044,17 @@ def _extract_html_render_issues(
 def _extract_ui_ergonomics_issues(
     path: Path,
     repo_path: Path,
-    text: str,
-    source_lines: list[str],
+    scanner: AnchorScanner,
+    source: ParsedSource,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
+    text = scanner.text
     rel_path = str(path.relative_to(repo_path))
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     seen: set[tuple[str, int]] = set()
     lowered = text.lower()
 
-    for match in _SAVE_BUTTON_OR_RE.finditer(text):
-        line = _line_from_offset(text, match.start())
+    for match in scanner.finditer(_SAVE_BUTTON_OR_SCAN):
+        line = source.line_index.line_of(match.start())
         marker = ("save_button_partial_form_enabled", line)
         if marker in seen:
             continue
@@ -905,7 +1065,7 @@ def _extract_ui_ergonomics_issues(
                 "save_button_partial_form_enabled",
                 "updateSaveButtonState",
                 line,
-                _line_snippet(source_lines, line),
+                _line_snippet(source.lines, line),
                 {"condition": "title || content"},
             )
         )
@@ -930,7 +1090,7 @@ def _extract_ui_ergonomics_issues(
             line = 1
             load_idx = text.find("async function loadNotes")
             if load_idx != -1:
-                line = _line_from_offset(text, load_idx)
+                line = source.line_index.line_of(load_idx)
             marker = ("pagination_page_not_normalized_after_mutation", line)
             if marker not in seen:
                 seen.add(marker)
@@ -940,17 +1100,17 @@ def _extract_ui_ergonomics_issues(
                         "pagination_page_not_normalized_after_mutation",
                         "loadNotes",
                         line,
-                        _line_snippet(source_lines, line),
+                        _line_snippet(source.lines, line),
                         {"state_field": "state.page"},
                     )
                 )
 
     if path.suffix.lower() == ".css":
-        min_width_match = _APP_MIN_WIDTH_RE.search(text)
+        min_width_match = scanner.search(_APP_MIN_WIDTH_SCAN)
         if min_width_match is not None:
             min_width = int(min_width_match.group("value"))
             if min_width >= 900:
-                line = _line_from_offset(text, min_width_match.start())
+                line = source.line_index.line_of(min_width_match.start())
                 marker = ("mobile_layout_min_width_overflow", line)
                 if marker not in seen:
                     seen.add(marker)
@@ -960,7 +1120,7 @@ def _extract_ui_ergonomics_issues(
                             "mobile_layout_min_width_overflow",
                             ".app",
                             line,
-                            _line_snippet(source_lines, line),
+                            _line_snippet(source.lines, line),
                             {"min_width_px": str(min_width)},
                         )
                     )
@@ -968,39 +1128,107 @@ def _extract_ui_ergonomics_issues(
     return issues
 
 
-def scan_express_signals(repo_path: Path) -> ExpressSignals:
-    all_files = _iter_files(repo_path)
-    js_files = _iter_js_files(all_files)
-    has_express_import = False
-    has_write_routes = False
-    has_test_framework = False
+class ExpressProbeObserver:
+    """Express probe state: a ``package.json`` check up front, then byte-level regex checks per observed file.
 
-    for path in js_files:
-        text = _read_text(path)
-        if not text:
-            continue
-        if not has_express_import and _EXPRESS_IMPORT_RE.search(text):
-            has_express_import = True
-        if not has_write_routes and not _is_test_file(path):
-            for match in _ROUTE_CALL_RE.finditer(text):
+    Probing only needs a yes/no per pattern, so files are scanned as raw bytes and never decoded into the
+    parse cache.
+    """
+
+    suffixes = tuple(sorted(JS_SUFFIXES))
+
+    def __init__(self, snapshot: RepoSnapshot) -> None:
+        self.declared_in = manifest_declaring(snapshot, "express", ecosystem="node")
+        self.has_express_import = False
+        self.has_write_routes = False
+        self.has_test_framework = False
+
+    @property
+    def saturated(self) -> bool:
+        return self.has_express_import and self.has_write_routes and self.has_test_framework
+
+    def accepts(self, path: Path) -> bool:
+        if path.suffix.lower() not in JS_SUFFIXES:
+            return False
+        is_test = _is_test_file(path)
+        return not (self.has_express_import and (self.has_test_framework if is_test else self.has_write_routes))
+
+    def observe(self, path: Path, content: bytes | mmap.mmap) -> None:
+        if not content:
+            return
+        is_test = _is_test_file(path)
+        if not self.has_express_import and _EXPRESS_IMPORT_BYTES_RE.search(content):
+            self.has_express_import = True
+        if not self.has_write_routes and not is_test:
+            for match in _ROUTE_CALL_BYTES_RE.finditer(content):
                 receiver = match.group("receiver").lower()
-                if receiver in {"app", "router"} or receiver.endswith("router"):
-                    has_write_routes = True
+                if receiver in {b"app", b"router"} or receiver.endswith(b"router"):
+                    self.has_write_routes = True
                     break
-        if not has_test_framework and _is_test_file(path) and _TEST_HINT_RE.search(text):
-            has_test_framework = True
+        if not self.has_test_framework and is_test and _TEST_HINT_BYTES_RE.search(content):
+            self.has_test_framework = True
+
+    def signals(self) -> ExpressSignals:
+        return ExpressSignals(
+            has_express_import=self.has_express_import,
+            has_write_routes=self.has_write_routes,
+            has_test_framework=self.has_test_framework,
+            declared_in=self.declared_in,
+        )
+
+
+def scan_express_signals(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ExpressSignals:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    observer = ExpressProbeObserver(snapshot)
+    run_probe_pass(snapshot, [observer])
+    return observer.signals()
+
+
+def _extract_file_payload(path: Path, repo_path: Path, source: ParsedSource) -> FilePayload:
+    """Extract one JavaScript or CSS file's rows; the result depends only on its path and content."""
+
+    text = source.text
+    scanner = AnchorScanner(text)
+    if path.suffix.lower() in CSS_SUFFIXES:
+        return {"ui_ergonomics_issues": _extract_ui_ergonomics_issues(path, repo_path, scanner, source)}
+    # Comment and string spans are located on the first match that needs them, and at most once.
+    load_literals = cache(partial(_LiteralSpans, text))
+    if _is_test_file(path):
+        literals = load_literals()
+        test_names = _test_names_by_line(scanner, source, literals)
+        return {
+            "test_cases": _extract_test_cases(path, repo_path, test_names, source),
+            "test_ingress_calls": _extract_test_ingress_calls(path, repo_path, scanner, source),
+            "test_http_calls": _extract_test_http_calls(path, repo_path, scanner, literals, test_names, source),
+            "generated_test_issues": collect_generated_test_issues(
+                relative_path=str(path.relative_to(repo_path)),
+                observations=observe_js_test_quality(source),
+            ),
+        }
+    return {
+        "write_endpoints": _extract_write_endpoints(path, repo_path, scanner, source, load_literals),
+        "ingress_surfaces": _extract_generic_ingress_surfaces(path, repo_path, scanner, source),
+        "auth_middleware": _extract_auth_middleware(path, repo_path, scanner, source, load_literals),
+        "write_contract_issues": _extract_write_contract_issues(path, repo_path, scanner, source, load_literals),
+        "session_lifecycle_issues": _extract_session_lifecycle_issues(path, repo_path, scanner, source),
+        "html_render_issues": _extract_html_render_issues(path, repo_path, scanner, source),
+        "ui_ergonomics_issues": _extract_ui_ergonomics_issues(path, repo_path, scanner, source),
+        "row_mapped_fields": [
+            (key, line, snippet) for key, (line, snippet) in _extract_row_mapped_fields(scanner, source).items()
+        ],
+        "note_field_usages": _extract_note_field_usages(scanner, source),
+    }
 
-    return ExpressSignals(
-        has_express_import=has_express_import,
-        has_write_routes=has_write_routes,
-        has_test_framework=has_test_framework,
-    )
 
+def _extract_file_task(task: FileTask, *, repo_path: str) -> FilePayload:
+    return _extract_file_payload(Path(task.path), Path(repo_path), task.load())
 
-def collect_express_artifacts(repo_path: Path) -> ArtifactBundle:
-    all_files = _iter_files(repo_path)
-    js_files = _iter_js_files(all_files)
-    css_files = _iter_css_files(all_files)
+
+def collect_express_artifacts(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    all_files = list(snapshot.files)
+    js_files = _iter_js_files(snapshot)
+    css_files = _iter_css_files(snapshot)
     test_files = [path for path in js_files if _is_test_file(path)]
 
     ingress_surfaces: list[IngressSurfaceArtifact] = []
@@ -1016,45 +1244,35 @@ def collect_express_artifacts(repo_path: Path) -> ArtifactBundle:
     generated_test_issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     backend_row_fields: dict[str, tuple[str, int, str]] = {}
     frontend_note_fields: list[tuple[str, str, int, str]] = []
-    workflow_automation_issues = collect_workflow_automation_issues(repo_path, all_files)
-    for path in js_files:
-        text = _read_text(path)
-        if not text:
-            continue
-        source_lines = text.splitlines()
-        if _is_test_file(path):
-            test_cases.extend(_extract_test_cases(path, repo_path, source_lines))
-            test_ingress_calls.extend(_extract_test_ingress_calls(path, repo_path, text, source_lines))
-            test_http_calls.extend(_extract_test_http_calls(path, repo_path, text, source_lines))
-            generated_test_issues.extend(
-                collect_generated_test_issues(
-                    relative_path=str(path.relative_to(repo_path)),
-                    observations=observe_js_test_quality(text, source_lines),
-                )
-            )
-            continue
-        file_endpoints = _extract_write_endpoints(path, repo_path, text, source_lines)
-        write_endpoints.extend(file_endpoints)
-        ingress_surfaces.extend(_extract_generic_ingress_surfaces(path, repo_path, text, source_lines))
-        rel_path = str(path.relative_to(repo_path))
-        auth_middleware_by_file[rel_path] = _extract_auth_middleware(path, repo_path, text, source_lines)
-        write_contract_issues.extend(_extract_write_contract_issues(path, repo_path, text, source_lines))
-        session_lifecycle_issues.extend(_extract_session_lifecycle_issues(path, repo_path, text, source_lines))
-        html_render_issues.extend(_extract_html_render_issues(path, repo_path, text, source_lines))
-        ui_ergonomics_issues.extend(_extract_ui_ergonomics_issues(path, repo_path, text, source_lines))
-
-        for key, (line, snippet) in _extract_row_mapped_fields(text, source_lines).items():
+    workflow_automation_issues = collect_workflow_automation_issues(repo_path, snapshot.catalog.workflow_files)
+    tasks = [task for path in [*js_files, *css_files] if (task := file_task(snapshot, path)) is not None]
+    payloads = collect_file_payloads(
+        snapshot,
+        tasks,
+        worker=partial(_extract_file_task, repo_path=str(repo_path)),
+        namespace=_ARTIFACT_CACHE_NAMESPACE,
+        collector_version=_ARTIFACT_CACHE_VERSION,
+        codecs=_FILE_PAYLOAD_CODECS,
+    )
+    for task, payload in zip(tasks, payloads):
+        rel_path = task.relative_path
+        test_cases.extend(payload.get("test_cases", []))
+        test_ingress_calls.extend(payload.get("test_ingress_calls", []))
+        test_http_calls.extend(payload.get("test_http_calls", []))
+        generated_test_issues.extend(payload.get("generated_test_issues", []))
+        write_endpoints.extend(payload.get("write_endpoints", []))
+        ingress_surfaces.extend(payload.get("ingress_surfaces", []))
+        if payload.get("auth_middleware"):
+            auth_middleware_by_file[rel_path] = list(payload["auth_middleware"])
+        write_contract_issues.extend(payload.get("write_contract_issues", []))
+        session_lifecycle_issues.extend(payload.get("session_lifecycle_issues", []))
+        html_render_issues.extend(payload.get("html_render_issues", []))
+        ui_ergonomics_issues.extend(payload.get("ui_ergonomics_issues", []))
+        for key, line, snippet in payload.get("row_mapped_fields", []):
             backend_row_fields[key] = (rel_path, line, snippet)
-        for field_name, line, snippet in _extract_note_field_usages(text, source_lines):
+        for field_name, line, snippet in payload.get("note_field_usages", []):
             frontend_note_fields.append((rel_path, field_name, line, snippet))
 
-    for path in css_files:
-        text = _read_text(path)
-        if not text:
-            continue
-        source_lines = text.splitlines()
-        ui_ergonomics_issues.extend(_extract_ui_ergonomics_issues(path, repo_path, text, source_lines))
-
     authorization_boundaries = _extract_authorization_boundaries(write_endpoints, auth_middleware_by_file)
     write_contract_issues.extend(
         _extract_response_field_alias_issues(
@@ -1071,7 +1289,7 @@ def collect_express_artifacts(repo_path: Path) -> ArtifactBundle:
         test_cases=test_cases,
         test_ingress_calls=test_ingress_calls,
         test_http_calls=test_http_calls,
-        dependency_specs=extract_dependency_specs(repo_path, all_files),
+        dependency_specs=extract_dependency_specs(repo_path, snapshot.catalog.requirements_files, snapshot=snapshot),
         authorization_boundaries=authorization_boundaries,
         write_contract_issues=write_contract_issues,
         session_lifecycle_issues=session_lifecycle_issues,
@@ -1082,4 +1300,4 @@ def collect_express_artifacts(repo_path: Path) -> ArtifactBundle:
     )
 
 
-__all__ = ["ExpressSignals", "collect_express_artifacts", "scan_express_signals"]
+__all__ = ["ExpressProbeObserver", "ExpressSignals", "collect_express_artifacts", "scan_express_signals"]
@@ -3,13 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Literal, cast
 
-from ai_risk_manager.collectors.plugins.base import ArtifactBundle, StackProbeResult
+from ai_risk_manager.collectors.plugins.base import ArtifactBundle, ProbeObserver, StackProbeResult
 from ai_risk_manager.collectors.plugins.fastapi_artifacts import (
+    FastAPIProbeObserver,
     FastAPISignals,
     collect_fastapi_artifacts,
     scan_fastapi_signals,
 )
 from ai_risk_manager.collectors.plugins.sdk import CapabilitySignalPluginMixin
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 from ai_risk_manager.schemas.types import Confidence, PreflightResult
 
 
@@ -21,6 +23,8 @@ def _probe_reasons(signals: FastAPISignals) -> list[str]:
         reasons.append("Detected FastAPI router decorator patterns.")
     if signals.has_pytest:
         reasons.append("Detected pytest import patterns.")
+    if signals.declared_in:
+        reasons.append(f"FastAPI is declared as a dependency in {signals.declared_in}.")
     return reasons
 
 
@@ -62,8 +66,18 @@ class FastAPICollectorPlugin(CapabilitySignalPluginMixin):
         "ui_ergonomics",
     }
 
-    def probe(self, repo_path: Path) -> StackProbeResult | None:
-        signals = scan_fastapi_signals(repo_path)
+    def probe(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackProbeResult | None:
+        return self._probe_from_signals(scan_fastapi_signals(repo_path, snapshot=snapshot))
+
+    def probe_observer(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> FastAPIProbeObserver:
+        return FastAPIProbeObserver(resolve_snapshot(repo_path, snapshot))
+
+    def probe_from_observer(self, observer: ProbeObserver) -> StackProbeResult | None:
+        if not isinstance(observer, FastAPIProbeObserver):
+            raise TypeError(f"expected FastAPIProbeObserver, got {type(observer).__name__}")
+        return self._probe_from_signals(observer.signals())
+
+    def _probe_from_signals(self, signals: FastAPISignals) -> StackProbeResult | None:
         if not signals.has_fastapi_import and not signals.has_router:
             return None
 
@@ -79,12 +93,18 @@ class FastAPICollectorPlugin(CapabilitySignalPluginMixin):
             probe_data=signals,
         )
 
-    def preflight(self, repo_path: Path, probe_data: object | None = None) -> PreflightResult:
-        signals = probe_data if isinstance(probe_data, FastAPISignals) else scan_fastapi_signals(repo_path)
+    def preflight(
+        self,
+        repo_path: Path,
+        probe_data: object | None = None,
+        *,
+        snapshot: RepoSnapshot | None = None,
+    ) -> PreflightResult:
+        signals = probe_data if isinstance(probe_data, FastAPISignals) else scan_fastapi_signals(repo_path, snapshot=snapshot)
         return _preflight_from_signals(signals)
 
-    def collect(self, repo_path: Path) -> ArtifactBundle:
-        return collect_fastapi_artifacts(repo_path)
+    def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+        return collect_fastapi_artifacts(repo_path, snapshot=snapshot)
 
 
 __all__ = ["FastAPISignals", "FastAPICollectorPlugin", "scan_fastapi_signals"]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import ast
-from collections.abc import Iterator
 from dataclasses import dataclass
+import mmap
 from pathlib import Path
 import re
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.artifact_cache import FilePayload, RowCodec
+from ai_risk_manager.collectors.parallel import FileTask, collect_file_payloads, file_task
+from ai_risk_manager.collectors.parse_cache import ParsedSource
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle, DataStoreWriteArtifact, ExternalCallArtifact
 from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
 from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
@@ -19,6 +21,9 @@ from ai_risk_manager.collectors.plugins.python_write_contract_artifacts import (
     extract_python_write_contract_issues,
 )
 from ai_risk_manager.collectors.plugins.workflow_automation_artifacts import collect_workflow_automation_issues
+from ai_risk_manager.collectors.probe_prefilter import manifest_declaring, needle_pattern, run_probe_pass
+from ai_risk_manager.collectors.python_ast_index import PythonModuleIndex
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 
 WRITE_METHODS = ("post", "put", "patch", "delete")
 ROUTE_METHODS = WRITE_METHODS + ("get",)
@@ -38,6 +43,22 @@ GUARD_HINTS = (
 )
 DATA_STORE_NAME_HINTS = ("collection", "database", "db", "records", "repo", "repository", "session", "store", "table")
 DATA_STORE_METHODS = {"add", "commit", "create", "delete", "execute", "insert", "save", "update"}
+_ARTIFACT_CACHE_NAMESPACE = "fastapi"
+_ARTIFACT_CACHE_VERSION = "1"
+_FILE_PAYLOAD_CODECS: dict[str, RowCodec] = {
+    "pydantic_models": None,
+    "write_endpoints": None,
+    "endpoint_model_candidates": None,
+    "declared_transitions": None,
+    "handled_transitions": None,
+    "data_store_writes": DataStoreWriteArtifact,
+    "external_calls": ExternalCallArtifact,
+    "test_cases": None,
+    "test_http_calls": None,
+    "generated_test_issues": None,
+    "write_contract_issues": None,
+    "session_lifecycle_issues": None,
+}
 EXTERNAL_CALL_METHODS = {"charge", "dispatch", "emit", "enqueue", "notify", "publish", "send"}
 EXTERNAL_SYSTEM_NAME_HINTS = (
     "broker",
@@ -64,31 +85,7 @@ class FastAPISignals:
     has_fastapi_import: bool
     has_router: bool
     has_pytest: bool
-
-
-def _read_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return ""
-
-
-def _iter_files(repo_path: Path) -> list[Path]:
-    return iter_project_files(repo_path)
-
-
-def _iter_python_files(repo_path: Path) -> list[Path]:
-    return [p for p in _iter_files(repo_path) if p.suffix == ".py"]
-
-
-def _parse_ast(path: Path) -> ast.AST | None:
-    text = _read_text(path)
-    if not text:
-        return None
-    try:
-        return ast.parse(text)
-    except SyntaxError:
-        return None
+    declared_in: str = ""
 
 
 def _line_snippet(source_lines: list[str], line: int, *, window: int = 3) -> str:
@@ -133,9 +130,9 @@ def _has_router_anchor(node: ast.AST) -> bool:
     return False
 
 
-def _extract_write_endpoints(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, str, str, int, str]]:
+def _extract_write_endpoints(index: PythonModuleIndex, source_lines: list[str]) -> list[tuple[str, str, str, int, str]]:
     endpoints: list[tuple[str, str, str, int, str]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
         for decorator in node.decorator_list:
@@ -169,9 +166,9 @@ def _looks_like_external_system(name: str, operation: str) -> bool:
     return any(hint in normalized.split("_") for hint in EXTERNAL_SYSTEM_NAME_HINTS)
 
 
-def _endpoint_functions(tree: ast.AST) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
+def _endpoint_functions(index: PythonModuleIndex) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
     endpoints: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
         if any(_is_router_decorator(decorator)[0] for decorator in node.decorator_list):
@@ -179,16 +176,8 @@ def _endpoint_functions(tree: ast.AST) -> list[ast.FunctionDef | ast.AsyncFuncti
     return endpoints
 
 
-def _walk_runtime_nodes(node: ast.AST) -> Iterator[ast.AST]:
-    yield node
-    for child in ast.iter_child_nodes(node):
-        if isinstance(child, (ast.AsyncFunctionDef, ast.ClassDef, ast.FunctionDef, ast.Lambda)):
-            continue
-        yield from _walk_runtime_nodes(child)
-
-
 def _extract_architecture_effects(
-    tree: ast.AST,
+    index: PythonModuleIndex,
     source_lines: list[str],
 ) -> tuple[list[tuple[str, str, str, int, str]], list[tuple[str, str, str, int, str]]]:
     store_writes: list[tuple[str, str, str, int, str]] = []
@@ -196,11 +185,11 @@ def _extract_architecture_effects(
     seen_stores: set[tuple[str, str, str, int]] = set()
     seen_calls: set[tuple[str, str, str, int]] = set()
 
-    for endpoint in _endpoint_functions(tree):
+    for endpoint in _endpoint_functions(index):
         for statement in endpoint.body:
             if isinstance(statement, (ast.AsyncFunctionDef, ast.ClassDef, ast.FunctionDef)):
                 continue
-            for child in _walk_runtime_nodes(statement):
+            for child in index.runtime_nodes(statement):
                 targets: list[ast.AST] = []
                 if isinstance(child, ast.Assign):
                     targets = list(child.targets)
@@ -255,9 +244,9 @@ def _is_basemodel_subclass(node: ast.ClassDef) -> bool:
     return False
 
 
-def _extract_pydantic_models(tree: ast.AST) -> list[str]:
+def _extract_pydantic_models(index: PythonModuleIndex) -> list[str]:
     models: list[str] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.ClassDef):
         if isinstance(node, ast.ClassDef) and _is_basemodel_subclass(node):
             models.append(node.name)
     return models
@@ -285,9 +274,15 @@ def _decorator_response_model(decorator: ast.AST) -> str | None:
     return None
 
 
-def _extract_endpoint_models(tree: ast.AST, known_models: set[str]) -> list[tuple[str, str]]:
+def _extract_endpoint_model_candidates(index: PythonModuleIndex) -> list[tuple[str, str]]:
+    """Return (endpoint, model name) pairs for every annotated endpoint argument and response model.
+
+    Candidates are filtered against the repository-wide Pydantic model set at merge time, which keeps
+    per-file extraction independent of other files.
+    """
+
     endpoint_models: list[tuple[str, str]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
 
@@ -298,7 +293,7 @@ def _extract_endpoint_models(tree: ast.AST, known_models: set[str]) -> list[tupl
             if ok:
                 is_endpoint = True
                 response_model = _decorator_response_model(decorator)
-                if response_model and response_model in known_models:
+                if response_model:
                     response_models.add(response_model)
 
         if not is_endpoint:
@@ -306,10 +301,10 @@ def _extract_endpoint_models(tree: ast.AST, known_models: set[str]) -> list[tupl
 
         for arg in node.args.args:
             model_name = _annotation_name(arg.annotation)
-            if model_name and model_name in known_models:
+            if model_name:
                 endpoint_models.append((node.name, model_name))
 
-        for model_name in response_models:
+        for model_name in sorted(response_models):
             endpoint_models.append((node.name, model_name))
 
     return endpoint_models
@@ -389,10 +384,15 @@ def _normalize_test_route(path: str) -> str | None:
     return raw
 
 
-def _collect_string_aliases(node: ast.AST, *, base_aliases: dict[str, str] | None = None) -> dict[str, str]:
+def _collect_string_aliases(
+    index: PythonModuleIndex,
+    node: ast.AST,
+    *,
+    base_aliases: dict[str, str] | None = None,
+) -> dict[str, str]:
     aliases: dict[str, str] = dict(base_aliases or {})
     assignments: list[tuple[str, ast.AST]] = []
-    for child in ast.walk(node):
+    for child in index.nodes(ast.Assign, ast.AnnAssign, within=node):
         if isinstance(child, ast.Assign):
             for target in child.targets:
                 if isinstance(target, ast.Name):
@@ -425,17 +425,17 @@ def _is_fixture_decorator(decorator: ast.AST) -> bool:
     return False
 
 
-def _extract_fixture_path_aliases(tree: ast.AST) -> dict[str, str]:
+def _extract_fixture_path_aliases(index: PythonModuleIndex) -> dict[str, str]:
     fixture_aliases: dict[str, str] = {}
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
         if not any(_is_fixture_decorator(decorator) for decorator in node.decorator_list):
             continue
 
-        local_aliases = _collect_string_aliases(node)
+        local_aliases = _collect_string_aliases(index, node)
         fixture_path: str | None = None
-        for child in ast.walk(node):
+        for child in index.nodes(ast.Return, ast.Yield, within=node):
             if isinstance(child, ast.Return):
                 fixture_path = _resolve_string_expr(child.value, local_aliases)
                 if fixture_path is not None:
@@ -453,9 +453,12 @@ def _extract_fixture_path_aliases(tree: ast.AST) -> dict[str, str]:
     return fixture_aliases
 
 
-def _extract_declared_transitions(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, str, str, int, str]]:
+def _extract_declared_transitions(
+    index: PythonModuleIndex,
+    source_lines: list[str],
+) -> list[tuple[str, str, str, int, str]]:
     declared: list[tuple[str, str, str, int, str]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.Assign):
         if not isinstance(node, ast.Assign):
             continue
         if not isinstance(node.value, ast.Dict):
@@ -501,8 +504,8 @@ def _has_guard_hint(value: str) -> bool:
     return any(hint in normalized for hint in GUARD_HINTS)
 
 
-def _looks_like_guard_expr(expr: ast.AST) -> bool:
-    for node in ast.walk(expr):
+def _looks_like_guard_expr(index: PythonModuleIndex, expr: ast.AST) -> bool:
+    for node in index.nodes(ast.Name, ast.Attribute, ast.Call, within=expr):
         if isinstance(node, ast.Name) and _has_guard_hint(node.id):
             return True
         if isinstance(node, ast.Attribute) and _has_guard_hint(node.attr):
@@ -538,28 +541,28 @@ def _extract_status_source(test: ast.AST) -> tuple[str | None, str | None, bool]
     return None, None, False
 
 
-def _has_additional_guard_in_test(test: ast.AST) -> bool:
+def _has_additional_guard_in_test(index: PythonModuleIndex, test: ast.AST) -> bool:
     if not (isinstance(test, ast.BoolOp) and isinstance(test.op, ast.And)):
         return False
     for value in test.values:
         src_state, _, _ = _extract_status_source(value)
         if src_state:
             continue
-        if _looks_like_guard_expr(value):
+        if _looks_like_guard_expr(index, value):
             return True
     return False
 
 
-def _collect_guard_lines(node: ast.AST) -> set[int]:
+def _collect_guard_lines(index: PythonModuleIndex, node: ast.AST) -> set[int]:
     lines: set[int] = set()
-    for child in ast.walk(node):
+    for child in index.nodes(ast.Assert, ast.If, ast.Expr, within=node):
         line = getattr(child, "lineno", None)
         if line is None:
             continue
         if isinstance(child, ast.Assert):
             lines.add(line)
             continue
-        if isinstance(child, ast.If) and _looks_like_guard_expr(child.test):
+        if isinstance(child, ast.If) and _looks_like_guard_expr(index, child.test):
             lines.add(line)
             continue
         if isinstance(child, ast.Expr) and isinstance(child.value, ast.Call):
@@ -568,24 +571,28 @@ def _collect_guard_lines(node: ast.AST) -> set[int]:
     return lines
 
 
-def _extract_handled_transitions(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, str, str, int, str, bool]]:
+def _extract_handled_transitions(
+    index: PythonModuleIndex,
+    source_lines: list[str],
+) -> list[tuple[str, str, str, int, str, bool]]:
     handled: list[tuple[str, str, str, int, str, bool]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
         fn_name = node.name
-        function_guard_lines = _collect_guard_lines(node)
-        for child in ast.walk(node):
+        function_guard_lines: set[int] | None = None
+        for child in index.nodes(ast.If, within=node):
             if not isinstance(child, ast.If):
                 continue
             src_state, status_var_name, status_is_attr = _extract_status_source(child.test)
             if not src_state:
                 continue
 
-            branch_guard_lines = _collect_guard_lines(child)
-            guard_lines = function_guard_lines | branch_guard_lines
-            has_test_guard = _has_additional_guard_in_test(child.test)
-            for stmt in ast.walk(child):
+            if function_guard_lines is None:
+                function_guard_lines = _collect_guard_lines(index, node)
+            guard_lines = function_guard_lines | _collect_guard_lines(index, child)
+            has_test_guard = _has_additional_guard_in_test(index, child.test)
+            for stmt in index.nodes(ast.Assign, within=child):
                 if not isinstance(stmt, ast.Assign):
                     continue
                 for target in stmt.targets:
@@ -608,25 +615,25 @@ def _extract_handled_transitions(tree: ast.AST, source_lines: list[str]) -> list
     return handled
 
 
-def _extract_test_cases(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, int, str]]:
+def _extract_test_cases(index: PythonModuleIndex, source_lines: list[str]) -> list[tuple[str, int, str]]:
     cases: list[tuple[str, int, str]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
             line = getattr(node, "lineno", 1)
             cases.append((node.name, line, _line_snippet(source_lines, line)))
     return cases
 
 
-def _extract_test_http_calls(tree: ast.AST, source_lines: list[str]) -> list[tuple[str, str, str, int, str]]:
+def _extract_test_http_calls(index: PythonModuleIndex, source_lines: list[str]) -> list[tuple[str, str, str, int, str]]:
     calls: list[tuple[str, str, str, int, str]] = []
-    fixture_aliases = _extract_fixture_path_aliases(tree)
-    for node in ast.walk(tree):
+    fixture_aliases = _extract_fixture_path_aliases(index)
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) or not node.name.startswith("test_"):
             continue
         test_name = node.name
         arg_aliases = {arg.arg: fixture_aliases[arg.arg] for arg in node.args.args if arg.arg in fixture_aliases}
-        aliases = _collect_string_aliases(node, base_aliases=arg_aliases)
-        for child in ast.walk(node):
+        aliases = _collect_string_aliases(index, node, base_aliases=arg_aliases)
+        for child in index.nodes(ast.Call, within=node):
             if not isinstance(child, ast.Call) or not isinstance(child.func, ast.Attribute):
                 continue
             method = child.func.attr.lower()
@@ -654,157 +661,221 @@ def _extract_test_http_calls(tree: ast.AST, source_lines: list[str]) -> list[tup
     return calls
 
 
-def scan_fastapi_signals(repo_path: Path) -> FastAPISignals:
-    py_files = _iter_python_files(repo_path)
-    has_fastapi_import = False
-    has_router = False
-    has_pytest = False
+class FastAPIProbeObserver:
+    """FastAPI probe state: a manifest check up front, then a byte prefilter and AST checks per observed file.
+
+    A file is parsed only when its raw bytes contain a needle for a signal that is still missing.
+    """
+
+    suffixes: tuple[str, ...] = (".py",)
+
+    def __init__(self, snapshot: RepoSnapshot) -> None:
+        self._snapshot = snapshot
+        self.declared_in = manifest_declaring(snapshot, "fastapi", ecosystem="python")
+        self.has_fastapi_import = False
+        self.has_router = False
+        self.has_pytest = False
+
+    @property
+    def saturated(self) -> bool:
+        return self.has_fastapi_import and self.has_router and self.has_pytest
 
-    for path in py_files:
-        tree = _parse_ast(path)
+    def accepts(self, path: Path) -> bool:
+        return not self.saturated and path.suffix.lower() == ".py"
+
+    def observe(self, path: Path, content: bytes | mmap.mmap) -> None:
+        needles = [
+            needle
+            for needle, found in (
+                (b"fastapi", self.has_fastapi_import),
+                (b"router", self.has_router),
+                (b"pytest", self.has_pytest),
+            )
+            if not found
+        ]
+        if content and needle_pattern(*needles).search(content) is None:
+            return
+        tree = self._snapshot.parse_python(path)
         if tree is None:
-            continue
+            return
         for node in ast.walk(tree):
-            if not has_fastapi_import and isinstance(node, ast.ImportFrom) and (node.module or "").startswith("fastapi"):
-                has_fastapi_import = True
-            if not has_fastapi_import and isinstance(node, ast.Import):
-                has_fastapi_import = any(alias.name.startswith("fastapi") for alias in node.names)
-            if not has_pytest and isinstance(node, ast.ImportFrom) and (node.module or "").startswith("pytest"):
-                has_pytest = True
-            if not has_pytest and isinstance(node, ast.Import):
-                has_pytest = any(alias.name.startswith("pytest") for alias in node.names)
-            if not has_router and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                for decorator in node.decorator_list:
-                    is_router, _ = _is_router_decorator(decorator)
-                    if is_router:
-                        has_router = True
-                        break
-            if has_fastapi_import and has_router and has_pytest:
+            if isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                self.has_fastapi_import = self.has_fastapi_import or module.startswith("fastapi")
+                self.has_pytest = self.has_pytest or module.startswith("pytest")
+            elif isinstance(node, ast.Import):
+                self.has_fastapi_import = self.has_fastapi_import or any(
+                    alias.name.startswith("fastapi") for alias in node.names
+                )
+                self.has_pytest = self.has_pytest or any(alias.name.startswith("pytest") for alias in node.names)
+            elif not self.has_router and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.has_router = any(_is_router_decorator(decorator)[0] for decorator in node.decorator_list)
+            if self.saturated:
                 break
 
-    return FastAPISignals(
-        has_fastapi_import=has_fastapi_import,
-        has_router=has_router,
-        has_pytest=has_pytest,
-    )
+    def signals(self) -> FastAPISignals:
+        return FastAPISignals(
+            has_fastapi_import=self.has_fastapi_import,
+            has_router=self.has_router,
+            has_pytest=self.has_pytest,
+            declared_in=self.declared_in,
+        )
 
 
-def collect_fastapi_artifacts(repo_path: Path) -> ArtifactBundle:
-    bundle = ArtifactBundle()
-    bundle.all_files = _iter_files(repo_path)
-    bundle.python_files = [p for p in bundle.all_files if p.suffix == ".py"]
-    bundle.dependency_specs.extend(extract_dependency_specs(repo_path, bundle.all_files))
-    bundle.test_files = [
-        p
-        for p in bundle.python_files
-        if (
-            (
-                ("tests" in p.parts)
-                and p.name != "conftest.py"
-                and (p.name.startswith("test_") or p.name.endswith("_test.py"))
-            )
-            or p.name.startswith("test_")
-            or p.name.endswith("_test.py")
+def scan_fastapi_signals(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> FastAPISignals:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    observer = FastAPIProbeObserver(snapshot)
+    run_probe_pass(snapshot, [observer])
+    return observer.signals()
+
+
+def _extract_file_payload(source: ParsedSource, relative: str, *, is_test: bool) -> FilePayload:
+    """Extract one file's rows; the result depends only on its path and content so it can be cached.
+
+    The module is traversed once into a :class:`PythonModuleIndex` that every extractor below reads from.
+    """
+
+    tree = source.tree
+    if tree is None:
+        return {}
+    source_lines = source.lines
+    index = PythonModuleIndex(tree)
+    payload: FilePayload = {
+        "pydantic_models": [(relative, model_name) for model_name in _extract_pydantic_models(index)],
+        "write_endpoints": [
+            (relative, endpoint_name, method, route_path, line, snippet)
+            for endpoint_name, method, route_path, line, snippet in _extract_write_endpoints(index, source_lines)
+        ],
+        "endpoint_model_candidates": [
+            (relative, endpoint_name, model_name)
+            for endpoint_name, model_name in _extract_endpoint_model_candidates(index)
+        ],
+        "declared_transitions": [
+            (relative, machine, src, dst, line, snippet)
+            for machine, src, dst, line, snippet in _extract_declared_transitions(index, source_lines)
+        ],
+        "handled_transitions": [
+            (relative, machine, src, dst, line, snippet, guarded)
+            for machine, src, dst, line, snippet, guarded in _extract_handled_transitions(index, source_lines)
+        ],
+    }
+
+    store_writes, external_calls = _extract_architecture_effects(index, source_lines)
+    payload["data_store_writes"] = [
+        DataStoreWriteArtifact(
+            file_path=relative,
+            owner_name=owner_name,
+            store_name=store_name,
+            operation=operation,
+            line=line,
+            snippet=snippet,
         )
+        for owner_name, store_name, operation, line, snippet in store_writes
+    ]
+    payload["external_calls"] = [
+        ExternalCallArtifact(
+            file_path=relative,
+            owner_name=owner_name,
+            system_name=system_name,
+            operation=operation,
+            line=line,
+            snippet=snippet,
+        )
+        for owner_name, system_name, operation, line, snippet in external_calls
     ]
-    bundle.workflow_automation_issues.extend(collect_workflow_automation_issues(repo_path, bundle.all_files))
-
-    parsed: list[tuple[Path, ast.Module, str, list[str]]] = []
-    for path in bundle.python_files:
-        text = _read_text(path)
-        if not text:
-            continue
-        try:
-            tree = ast.parse(text)
-        except SyntaxError:
-            continue
-        relative = str(path.relative_to(repo_path))
-        parsed.append((path, tree, relative, text.splitlines()))
 
-    for _, tree, relative, _ in parsed:
-        for model_name in _extract_pydantic_models(tree):
-            bundle.pydantic_models.append((relative, model_name))
+    if is_test:
+        payload["test_cases"] = [
+            (relative, case, line, snippet) for case, line, snippet in _extract_test_cases(index, source_lines)
+        ]
+        payload["test_http_calls"] = [
+            (relative, test_name, method, route_path, line, snippet)
+            for test_name, method, route_path, line, snippet in _extract_test_http_calls(index, source_lines)
+        ]
+        payload["generated_test_issues"] = collect_generated_test_issues(
+            relative_path=relative,
+            observations=observe_python_test_quality(
+                tree,
+                source_lines,
+                route_resolver=_resolve_string_expr,
+                index=index,
+            ),
+        )
 
-    known_models = {name for _, name in bundle.pydantic_models}
+    owner_names = {endpoint_name for _, endpoint_name, *_ in payload["write_endpoints"]}
+    payload["write_contract_issues"] = [
+        *extract_python_lossy_decode_issues(
+            tree=tree,
+            source_lines=source_lines,
+            relative_path=relative,
+            index=index,
+        ),
+        *extract_python_write_contract_issues(
+            tree=tree,
+            source_lines=source_lines,
+            relative_path=relative,
+            owner_names=owner_names,
+            index=index,
+        ),
+    ]
+    payload["session_lifecycle_issues"] = extract_python_session_lifecycle_issues(
+        tree=tree,
+        source_lines=source_lines,
+        relative_path=relative,
+        index=index,
+    )
+    return payload
 
-    for path, tree, relative, source_lines in parsed:
-        for endpoint_name, method, route_path, line, snippet in _extract_write_endpoints(tree, source_lines):
-            bundle.write_endpoints.append((relative, endpoint_name, method, route_path, line, snippet))
 
-        for endpoint_name, model_name in _extract_endpoint_models(tree, known_models):
-            bundle.endpoint_models.append((relative, endpoint_name, model_name))
+def _extract_file_task(task: FileTask) -> FilePayload:
+    return _extract_file_payload(task.load(), task.relative_path, is_test=task.is_test)
 
-        for machine, src, dst, line, snippet in _extract_declared_transitions(tree, source_lines):
-            bundle.declared_transitions.append((relative, machine, src, dst, line, snippet))
 
-        for machine, src, dst, line, snippet, invariant_guarded in _extract_handled_transitions(tree, source_lines):
-            bundle.handled_transitions.append((relative, machine, src, dst, line, snippet, invariant_guarded))
+def collect_fastapi_artifacts(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    bundle = ArtifactBundle()
+    bundle.all_files = list(snapshot.files)
+    bundle.python_files = snapshot.files_with_suffix(".py")
+    bundle.dependency_specs.extend(extract_dependency_specs(repo_path, snapshot.catalog.requirements_files, snapshot=snapshot))
+    bundle.test_files = list(snapshot.catalog.python_test_files)
+    bundle.workflow_automation_issues.extend(
+        collect_workflow_automation_issues(repo_path, snapshot.catalog.workflow_files)
+    )
 
-        store_writes, external_calls = _extract_architecture_effects(tree, source_lines)
-        bundle.data_store_writes.extend(
-            DataStoreWriteArtifact(
-                file_path=relative,
-                owner_name=owner_name,
-                store_name=store_name,
-                operation=operation,
-                line=line,
-                snippet=snippet,
-            )
-            for owner_name, store_name, operation, line, snippet in store_writes
-        )
-        bundle.external_calls.extend(
-            ExternalCallArtifact(
-                file_path=relative,
-                owner_name=owner_name,
-                system_name=system_name,
-                operation=operation,
-                line=line,
-                snippet=snippet,
-            )
-            for owner_name, system_name, operation, line, snippet in external_calls
-        )
+    tasks = [
+        task
+        for path in bundle.python_files
+        if (task := file_task(snapshot, path, is_test=snapshot.catalog.is_python_test_file(path))) is not None
+    ]
+    payloads = collect_file_payloads(
+        snapshot,
+        tasks,
+        worker=_extract_file_task,
+        namespace=_ARTIFACT_CACHE_NAMESPACE,
+        collector_version=_ARTIFACT_CACHE_VERSION,
+        codecs=_FILE_PAYLOAD_CODECS,
+    )
 
-        if path in bundle.test_files:
-            for case, line, snippet in _extract_test_cases(tree, source_lines):
-                bundle.test_cases.append((relative, case, line, snippet))
-            for test_name, method, route_path, line, snippet in _extract_test_http_calls(tree, source_lines):
-                bundle.test_http_calls.append((relative, test_name, method, route_path, line, snippet))
-            bundle.generated_test_issues.extend(
-                collect_generated_test_issues(
-                    relative_path=relative,
-                    observations=observe_python_test_quality(
-                        tree,
-                        source_lines,
-                        route_resolver=_resolve_string_expr,
-                    ),
-                )
-            )
+    for payload in payloads:
+        bundle.pydantic_models.extend(payload.get("pydantic_models", []))
+    known_models = {name for _, name in bundle.pydantic_models}
 
-        owner_names = {endpoint_name for file_ref, endpoint_name, *_ in bundle.write_endpoints if file_ref == relative}
-        bundle.write_contract_issues.extend(
-            extract_python_lossy_decode_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-            )
-        )
-        bundle.write_contract_issues.extend(
-            extract_python_write_contract_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-                owner_names=owner_names,
-            )
-        )
-        bundle.session_lifecycle_issues.extend(
-            extract_python_session_lifecycle_issues(
-                tree=tree,
-                source_lines=source_lines,
-                relative_path=relative,
-            )
+    for payload in payloads:
+        bundle.write_endpoints.extend(payload.get("write_endpoints", []))
+        bundle.endpoint_models.extend(
+            row for row in payload.get("endpoint_model_candidates", []) if row[2] in known_models
         )
+        bundle.declared_transitions.extend(payload.get("declared_transitions", []))
+        bundle.handled_transitions.extend(payload.get("handled_transitions", []))
+        bundle.data_store_writes.extend(payload.get("data_store_writes", []))
+        bundle.external_calls.extend(payload.get("external_calls", []))
+        bundle.test_cases.extend(payload.get("test_cases", []))
+        bundle.test_http_calls.extend(payload.get("test_http_calls", []))
+        bundle.generated_test_issues.extend(payload.get("generated_test_issues", []))
+        bundle.write_contract_issues.extend(payload.get("write_contract_issues", []))
+        bundle.session_lifecycle_issues.extend(payload.get("session_lifecycle_issues", []))
 
     return bundle
 
 
-__all__ = ["FastAPISignals", "collect_fastapi_artifacts", "scan_fastapi_signals"]
+__all__ = ["FastAPIProbeObserver", "FastAPISignals", "collect_fastapi_artifacts", "scan_fastapi_signals"]
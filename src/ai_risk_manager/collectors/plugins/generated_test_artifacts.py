@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import ast
+from collections.abc import Sequence
 from dataclasses import dataclass
 import re
 from typing import Callable
 
+from ai_risk_manager.collectors.anchored_scan import AnchoredPattern, AnchorScanner
+from ai_risk_manager.collectors.parse_cache import ParsedSource
+from ai_risk_manager.collectors.python_ast_index import PythonModuleIndex
+
 WRITE_METHODS = {"post", "put", "patch", "delete"}
 _NEGATIVE_HTTP_CODES = {400, 401, 403, 404, 409, 410, 412, 422, 429, 500, 502, 503}
-_JS_TEST_BLOCK_RE = re.compile(
+_JS_TEST_BLOCK_HEAD = (
     r"\b(?:test|it)\s*\(\s*(?P<quote>['\"`])(?P<name>[^'\"`]+)(?P=quote)\s*,\s*"
-    r"(?:async\s*)?(?:\([^)]*\)|[A-Za-z_$][A-Za-z0-9_$]*)\s*=>\s*\{(?P<body>[\s\S]*?)\n\s*\}\s*\)\s*;?",
-    re.IGNORECASE,
+    r"(?:async\s*)?(?:\([^)]*\)|[A-Za-z_$][A-Za-z0-9_$]*)\s*=>\s*\{"
+)
+_JS_TEST_BLOCK_RE = re.compile(_JS_TEST_BLOCK_HEAD + r"(?P<body>[\s\S]*?)\n\s*\}\s*\)\s*;?", re.IGNORECASE)
+# Once one callback body never closes, no later test block can close either, so scanning stops there.
+_JS_TEST_BLOCK_SCAN = AnchoredPattern(
+    _JS_TEST_BLOCK_RE, ("test", "it"), head=re.compile(_JS_TEST_BLOCK_HEAD, re.IGNORECASE)
 )
 _JS_HTTP_CALL_RE = re.compile(
     r"\.(?P<method>post|put|patch|delete)\s*\(\s*(?P<quote>['\"`])(?P<path>[^'\"`]+)(?P=quote)",
@@ -50,10 +59,6 @@ def _line_snippet(source_lines: list[str], line: int, *, window: int = 3) -> str
     return "\n".join(part.rstrip() for part in source_lines[start:end]).strip()
 
 
-def _line_from_offset(text: str, offset: int) -> int:
-    return text.count("\n", 0, offset) + 1
-
-
 def _constant_str(node: ast.AST | None) -> str | None:
     if isinstance(node, ast.Constant) and isinstance(node.value, str):
         return node.value
@@ -96,10 +101,10 @@ def _resolve_string_expr(node: ast.AST | None, aliases: dict[str, str]) -> str |
     return None
 
 
-def _collect_string_aliases(node: ast.AST) -> dict[str, str]:
+def _collect_string_aliases(assignment_nodes: Sequence[ast.AST]) -> dict[str, str]:
     aliases: dict[str, str] = {}
     assignments: list[tuple[str, ast.AST]] = []
-    for child in ast.walk(node):
+    for child in assignment_nodes:
         if isinstance(child, ast.Assign):
             for target in child.targets:
                 if isinstance(target, ast.Name):
@@ -138,20 +143,15 @@ def _call_root_name(node: ast.AST) -> str:
     return ""
 
 
-def _has_negative_path_marker(node: ast.AST) -> bool:
-    for child in ast.walk(node):
-        if isinstance(child, ast.Call) and _call_name(child.func) == "raises":
-            return True
-        if isinstance(child, ast.Constant) and isinstance(child.value, int) and child.value in _NEGATIVE_HTTP_CODES:
-            return True
-    return False
+def _has_negative_path_marker(calls: list[ast.Call], constants: list[ast.Constant]) -> bool:
+    if any(_call_name(call.func) == "raises" for call in calls):
+        return True
+    return any(isinstance(constant.value, int) and constant.value in _NEGATIVE_HTTP_CODES for constant in constants)
 
 
-def _nondeterministic_kinds(node: ast.AST) -> set[str]:
+def _nondeterministic_kinds(calls: list[ast.Call]) -> set[str]:
     kinds: set[str] = set()
-    for child in ast.walk(node):
-        if not isinstance(child, ast.Call):
-            continue
+    for child in calls:
         func_name = _call_name(child.func).lower()
         root_name = _call_root_name(child.func).lower()
 
@@ -181,16 +181,25 @@ def observe_python_test_quality(
     source_lines: list[str],
     *,
     route_resolver: Callable[[ast.AST | None, dict[str, str]], str | None] | None = None,
+    index: PythonModuleIndex | None = None,
 ) -> list[TestQualityObservation]:
+    index = index if index is not None else PythonModuleIndex(tree)
+    tests = [
+        node
+        for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_")
+    ]
+    # One sweep hands every test function its own assignments, calls, and constants in ``ast.walk`` order.
+    subtrees = index.nodes_by_subtree(tests, ast.Assign, ast.AnnAssign, ast.Call, ast.Constant)
     observations: list[TestQualityObservation] = []
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) or not node.name.startswith("test_"):
-            continue
-
-        aliases = _collect_string_aliases(node)
+    for node, members in zip(tests, subtrees):
+        assignments = [child for child in members if isinstance(child, (ast.Assign, ast.AnnAssign))]
+        calls = [child for child in members if isinstance(child, ast.Call)]
+        constants = [child for child in members if isinstance(child, ast.Constant)]
+        aliases = _collect_string_aliases(assignments)
         http_calls: list[tuple[str, str]] = []
-        for child in ast.walk(node):
-            if not isinstance(child, ast.Call) or not isinstance(child.func, ast.Attribute):
+        for child in calls:
+            if not isinstance(child.func, ast.Attribute):
                 continue
             method = child.func.attr.lower()
             if method not in WRITE_METHODS:
@@ -215,19 +224,19 @@ def observe_python_test_quality(
                 line=line,
                 snippet=_line_snippet(source_lines, line),
                 http_calls=http_calls,
-                has_negative_path=_has_negative_path_marker(node),
-                nondeterministic_kinds=_nondeterministic_kinds(node),
+                has_negative_path=_has_negative_path_marker(calls, constants),
+                nondeterministic_kinds=_nondeterministic_kinds(calls),
             )
         )
     return observations
 
 
-def observe_js_test_quality(text: str, source_lines: list[str]) -> list[TestQualityObservation]:
+def observe_js_test_quality(source: ParsedSource) -> list[TestQualityObservation]:
     observations: list[TestQualityObservation] = []
-    for match in _JS_TEST_BLOCK_RE.finditer(text):
+    for match in AnchorScanner(source.text).finditer(_JS_TEST_BLOCK_SCAN):
         test_name = match.group("name").strip()
         body = match.group("body")
-        line = _line_from_offset(text, match.start())
+        line = source.line_index.line_of(match.start())
         http_calls = [
             (http_match.group("method").upper(), http_match.group("path").strip())
             for http_match in _JS_HTTP_CALL_RE.finditer(body)
@@ -241,7 +250,7 @@ def observe_js_test_quality(text: str, source_lines: list[str]) -> list[TestQual
             TestQualityObservation(
                 test_name=test_name,
                 line=line,
-                snippet=_line_snippet(source_lines, line),
+                snippet=_line_snippet(source.lines, line),
                 http_calls=http_calls,
                 has_negative_path=bool(_JS_NEGATIVE_ASSERT_RE.search(body)),
                 nondeterministic_kinds=nondeterministic,
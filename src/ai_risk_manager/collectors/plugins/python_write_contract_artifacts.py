@@ -4,6 +4,9 @@ import ast
 import re
 from typing import cast
 
+from ai_risk_manager.collectors.line_index import LineIndex
+from ai_risk_manager.collectors.python_ast_index import PythonModuleIndex
+
 _RAW_SQL_UPDATE_RE = re.compile(
     r"UPDATE\s+(?P<table>[A-Za-z_][A-Za-z0-9_]*)\s+SET[\s\S]*?WHERE\s+(?P<where>[\s\S]*?)(?:[\"'`]\s*[\),]|$)",
     re.IGNORECASE,
@@ -42,8 +45,8 @@ def _qualname(node: ast.AST, parents: dict[ast.AST, ast.AST]) -> str:
     return ".".join(reversed(parts))
 
 
-def _line_from_offset(block: str, offset: int, start_line: int) -> int:
-    return start_line + block.count("\n", 0, offset)
+def _line_from_offset(block_lines: LineIndex, offset: int, start_line: int) -> int:
+    return start_line + block_lines.line_of(offset) - 1
 
 
 def _normalize_key_name(value: str) -> str:
@@ -95,11 +98,13 @@ def extract_python_session_lifecycle_issues(
     tree: ast.AST,
     source_lines: list[str],
     relative_path: str,
+    index: PythonModuleIndex | None = None,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
+    index = index if index is not None else PythonModuleIndex(tree)
     set_events: list[tuple[str, str, int, str]] = []
     remove_events: list[tuple[str, str, int, str]] = []
 
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.Assign, ast.AnnAssign, ast.Delete, ast.Call):
         line = getattr(node, "lineno", 1)
         snippet = _line_snippet(source_lines, line)
 
@@ -157,9 +162,11 @@ def extract_python_lossy_decode_issues(
     tree: ast.AST,
     source_lines: list[str],
     relative_path: str,
+    index: PythonModuleIndex | None = None,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
+    index = index if index is not None else PythonModuleIndex(tree)
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.Call):
         if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
             continue
         if node.func.attr != "decode":
@@ -193,14 +200,13 @@ def extract_django_uniqueness_default_issues(
     tree: ast.AST,
     source_lines: list[str],
     relative_path: str,
+    index: PythonModuleIndex | None = None,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
-    parents: dict[ast.AST, ast.AST] = {}
-    for parent in ast.walk(tree):
-        for child in ast.iter_child_nodes(parent):
-            parents[child] = parent
+    index = index if index is not None else PythonModuleIndex(tree)
+    parents = index.parents
 
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.Call):
         if not isinstance(node, ast.Call) or not node.args:
             continue
         if not isinstance(node.func, ast.Name) or node.func.id != "CreateOnlyDefault":
@@ -235,18 +241,16 @@ def extract_python_write_contract_issues(
     source_lines: list[str],
     relative_path: str,
     owner_names: set[str],
+    index: PythonModuleIndex | None = None,
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
     if not owner_names:
         return []
 
-    parents: dict[ast.AST, ast.AST] = {}
-    for parent in ast.walk(tree):
-        for child in ast.iter_child_nodes(parent):
-            parents[child] = parent
-
+    index = index if index is not None else PythonModuleIndex(tree)
+    parents = index.parents
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
     seen: set[tuple[str, str, int]] = set()
-    for node in ast.walk(tree):
+    for node in index.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
         owner_name = _qualname(node, parents)
@@ -255,12 +259,13 @@ def extract_python_write_contract_issues(
         start_line = getattr(node, "lineno", 1)
         end_line = getattr(node, "end_lineno", start_line)
         block = "\n".join(source_lines[start_line - 1 : end_line])
+        block_lines = LineIndex(block)
         lowered = block.lower()
 
         for match in _RAW_SQL_UPDATE_RE.finditer(block):
             where_clause = match.group("where")
             if _TENANT_GUARD_RE.search(where_clause) and not _has_entity_filter(where_clause):
-                line = _line_from_offset(block, match.start(), start_line)
+                line = _line_from_offset(block_lines, match.start(), start_line)
                 marker = ("write_scope_missing_entity_filter", owner_name, line)
                 if marker not in seen:
                     seen.add(marker)
@@ -275,7 +280,7 @@ def extract_python_write_contract_issues(
                         )
                     )
             if _CLIENT_FRESHNESS_RE.search(block) and not _FRESHNESS_GUARD_RE.search(where_clause):
-                line = _line_from_offset(block, match.start(), start_line)
+                line = _line_from_offset(block_lines, match.start(), start_line)
                 marker = ("stale_write_without_conflict_guard", owner_name, line)
                 if marker not in seen:
                     seen.add(marker)
@@ -293,7 +298,7 @@ def extract_python_write_contract_issues(
         for match in _QUERYSET_UPDATE_RE.finditer(block):
             filters = match.group("filters")
             if _TENANT_GUARD_RE.search(filters) and not _has_entity_filter_kwargs(filters):
-                line = _line_from_offset(block, match.start(), start_line)
+                line = _line_from_offset(block_lines, match.start(), start_line)
                 marker = ("write_scope_missing_entity_filter", owner_name, line)
                 if marker not in seen:
                     seen.add(marker)
@@ -308,7 +313,7 @@ def extract_python_write_contract_issues(
                         )
                     )
             if _CLIENT_FRESHNESS_RE.search(lowered) and not _FRESHNESS_GUARD_RE.search(filters):
-                line = _line_from_offset(block, match.start(), start_line)
+                line = _line_from_offset(block_lines, match.start(), start_line)
                 marker = ("stale_write_without_conflict_guard", owner_name, line)
                 if marker not in seen:
                     seen.add(marker)
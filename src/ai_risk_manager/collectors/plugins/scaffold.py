@@ -80,6 +80,7 @@ def render_plugin_scaffold(spec: PluginScaffoldSpec) -> str:
         "\n"
         "from ai_risk_manager.collectors.plugins.base import ArtifactBundle, StackProbeResult\n"
         "from ai_risk_manager.collectors.plugins.sdk import CapabilitySignalPluginMixin\n"
+        "from ai_risk_manager.collectors.snapshot import RepoSnapshot\n"
         "from ai_risk_manager.schemas.types import PreflightResult\n"
         "\n"
         "\n"
@@ -93,15 +94,21 @@ def render_plugin_scaffold(spec: PluginScaffoldSpec) -> str:
         f"{unsupported_lines}\n"
         "    }\n"
         "\n"
-        "    def probe(self, repo_path: Path) -> StackProbeResult | None:\n"
+        "    def probe(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackProbeResult | None:\n"
         "        # Replace this stub with stack detection logic for the generated plugin.\n"
         "        return None\n"
         "\n"
-        "    def preflight(self, repo_path: Path, probe_data: object | None = None) -> PreflightResult:\n"
+        "    def preflight(\n"
+        "        self,\n"
+        "        repo_path: Path,\n"
+        "        probe_data: object | None = None,\n"
+        "        *,\n"
+        "        snapshot: RepoSnapshot | None = None,\n"
+        "    ) -> PreflightResult:\n"
         "        # Replace this stub with stack preflight checks for the generated plugin.\n"
         '        return PreflightResult(status="PASS", reasons=[])\n'
         "\n"
-        "    def collect(self, repo_path: Path) -> ArtifactBundle:\n"
+        "    def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:\n"
         "        # Replace this stub with artifact extraction logic for the generated plugin.\n"
         "        return ArtifactBundle()\n"
         "\n"
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import ast
 from pathlib import Path
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.parse_cache import open_source_bytes
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle
 from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
 from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
@@ -12,66 +11,97 @@ from ai_risk_manager.collectors.plugins.generated_test_artifacts import (
     observe_python_test_quality,
 )
 from ai_risk_manager.collectors.plugins.workflow_automation_artifacts import collect_workflow_automation_issues
+from ai_risk_manager.collectors.probe_prefilter import needle_pattern
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
+from ai_risk_manager.schemas.types import L0Depth
 
 _JS_TEST_SUFFIXES = {".js", ".jsx", ".cjs", ".mjs", ".ts", ".tsx"}
+# A test file can only yield generated-test issues through a write call (missing negative path) or a
+# nondeterministic call, so files containing none of these case-insensitive needles are never decoded.
+_PYTHON_CANDIDATE_NEEDLES = (
+    b"post",
+    b"put",
+    b"patch",
+    b"delete",
+    b"sleep",
+    b"time",
+    b"monotonic",
+    b"perf_counter",
+    b"rand",
+    b"choice",
+    b"shuffle",
+    b"uniform",
+    b"urlopen",
+    b"requests",
+    b"httpx",
+    b"urllib",
+)
+_JS_CANDIDATE_NEEDLES = (
+    b"post",
+    b"put",
+    b"patch",
+    b"delete",
+    b"settimeout",
+    b"sleep",
+    b"date",
+    b"random",
+    b"fetch",
+    b"axios",
+    b"http",
+)
 
 
-def _iter_files(repo_path: Path) -> list[Path]:
-    return iter_project_files(repo_path)
-
-
-def _read_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return ""
-
+def _is_candidate(path: Path, needles: tuple[bytes, ...]) -> bool:
+    with open_source_bytes(path) as content:
+        # Empty content also stands for oversized, binary, and UTF-16 files, which a byte scan cannot rule out.
+        return not content or needle_pattern(*needles).search(content) is not None
 
-def _parse_python_ast(text: str) -> ast.AST | None:
-    if not text:
-        return None
-    try:
-        return ast.parse(text)
-    except SyntaxError:
-        return None
 
+def collect_universal_artifacts(
+    repo_path: Path, *, snapshot: RepoSnapshot | None = None, depth: L0Depth = 2
+) -> ArtifactBundle:
+    """Collect L0 artifacts for a repository without a stack collector, escalating one tier at a time.
 
-def _is_test_file(path: Path) -> bool:
-    lowered_name = path.name.lower()
-    lowered_parts = {part.lower() for part in path.parts}
-    return (
-        lowered_name.startswith("test_")
-        or lowered_name.endswith(("_test.py", ".test.js", ".spec.js", ".test.ts", ".spec.ts", ".test.tsx", ".spec.tsx"))
-        or "__tests__" in lowered_parts
-        or "tests" in lowered_parts
-        or "test" in lowered_parts
-    )
+    Tier 0 reads only paths, dependency manifests, and workflow files. Tier 1 byte-scans test files for
+    candidate needles and runs the text-level JavaScript test scan on the files that match. Tier 2 also
+    parses candidate Python tests. *depth* caps the tier; at depth 2 the result equals parsing every test.
+    """
 
-
-def collect_universal_artifacts(repo_path: Path) -> ArtifactBundle:
-    all_files = _iter_files(repo_path)
+    snapshot = resolve_snapshot(repo_path, snapshot)
     bundle = ArtifactBundle(
-        all_files=all_files,
-        python_files=[path for path in all_files if path.suffix.lower() == ".py"],
-        test_files=[path for path in all_files if _is_test_file(path)],
+        all_files=list(snapshot.files),
+        python_files=snapshot.files_with_suffix(".py"),
+        test_files=list(snapshot.catalog.test_files),
+    )
+    bundle.dependency_specs.extend(
+        extract_dependency_specs(repo_path, snapshot.catalog.requirements_files, snapshot=snapshot)
+    )
+    bundle.workflow_automation_issues.extend(
+        collect_workflow_automation_issues(repo_path, snapshot.catalog.workflow_files)
     )
-    bundle.dependency_specs.extend(extract_dependency_specs(repo_path, all_files))
-    bundle.workflow_automation_issues.extend(collect_workflow_automation_issues(repo_path, all_files))
+    if depth < 1:
+        return bundle
 
     for path in bundle.test_files:
+        suffix = path.suffix.lower()
+        if suffix == ".py":
+            if depth < 2 or not _is_candidate(path, _PYTHON_CANDIDATE_NEEDLES):
+                continue
+        elif suffix not in _JS_TEST_SUFFIXES or not _is_candidate(path, _JS_CANDIDATE_NEEDLES):
+            continue
         relative_path = str(path.relative_to(repo_path))
-        text = _read_text(path)
+        source = snapshot.source(path)
+        text = source.text
         if not text:
             continue
-        source_lines = text.splitlines()
-        observations = []
-        if path.suffix.lower() == ".py":
-            tree = _parse_python_ast(text)
+        source_lines = source.lines
+        if suffix == ".py":
+            tree = source.tree
             if tree is None:
                 continue
             observations = observe_python_test_quality(tree, source_lines)
-        elif path.suffix.lower() in _JS_TEST_SUFFIXES:
-            observations = observe_js_test_quality(text, source_lines)
+        else:
+            observations = observe_js_test_quality(source)
         if not observations:
             continue
         bundle.generated_test_issues.extend(
@@ -3,7 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 import re
 
-_WORKFLOW_SUFFIXES = {".yml", ".yaml"}
+from ai_risk_manager.collectors.file_catalog import is_workflow_path
+
 _UNTRUSTED_CONTEXT_RE = re.compile(
     r"\$\{\{\s*github\.event\.(?:pull_request|issue|comment|discussion)"
     r"\.(?:title|body|message|.*body)\s*\}\}",
@@ -28,14 +29,6 @@ def _line_snippet(source_lines: list[str], line: int, *, window: int = 4) -> str
     return "\n".join(part.rstrip() for part in source_lines[start:end]).strip()
 
 
-def _workflow_files(all_files: list[Path]) -> list[Path]:
-    return [
-        path
-        for path in all_files
-        if path.suffix.lower() in _WORKFLOW_SUFFIXES and ".github" in path.parts and "workflows" in path.parts
-    ]
-
-
 def _step_name_before(lines: list[str], idx: int) -> str | None:
     for offset in range(idx, max(-1, idx - 6), -1):
         match = _STEP_NAME_RE.match(lines[offset])
@@ -52,10 +45,12 @@ def _is_external_action_ref(ref: str) -> bool:
 
 def collect_workflow_automation_issues(
     repo_path: Path,
-    all_files: list[Path],
+    files: list[Path],
 ) -> list[tuple[str, str, str, int | None, str, dict[str, str]]]:
+    """Scan GitHub Actions workflows among *files*; pass ``FileCatalog.workflow_files`` to skip the filter scan."""
+
     issues: list[tuple[str, str, str, int | None, str, dict[str, str]]] = []
-    workflow_files = _workflow_files(all_files)
+    workflow_files = [path for path in files if is_workflow_path(path)]
 
     for path in workflow_files:
         text = _read_text(path)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Literal
+
+from ai_risk_manager.collectors.parse_cache import open_source_bytes
+from ai_risk_manager.collectors.snapshot import RepoSnapshot
+
+if TYPE_CHECKING:
+    from ai_risk_manager.collectors.plugins.base import ProbeObserver
+
+ManifestEcosystem = Literal["python", "node"]
+
+_PYTHON_MANIFEST_NAMES = ("pyproject.toml", "Pipfile", "setup.cfg")
+_NODE_MANIFEST_NAMES = ("package.json",)
+
+
+@lru_cache(maxsize=64)
+def needle_pattern(*needles: bytes) -> re.Pattern[bytes]:
+    """Compile a case-insensitive alternation of literal byte *needles*, memoized per needle set."""
+
+    return re.compile(b"|".join(re.escape(needle) for needle in needles), re.IGNORECASE)
+
+
+def run_probe_pass(snapshot: RepoSnapshot, observers: Sequence[ProbeObserver]) -> None:
+    """Feed every observer from one pass over the files matching any observer's suffixes.
+
+    Files are visited in discovery order and opened once for all observers that still accept them. The pass
+    ends as soon as every observer is saturated. Observers receive ``b""`` for empty, oversized, binary, and
+    UTF-16 files, which a byte scan cannot rule out.
+    """
+
+    suffixes = {suffix for observer in observers for suffix in observer.suffixes}
+    if not suffixes:
+        return
+    for path in snapshot.catalog.with_suffix(*suffixes):
+        active = [observer for observer in observers if not observer.saturated]
+        if not active:
+            return
+        interested = [observer for observer in active if observer.accepts(path)]
+        if not interested:
+            continue
+        with open_source_bytes(path) as content:
+            for observer in interested:
+                observer.observe(path, content)
+
+
+@lru_cache(maxsize=32)
+def _declaration_pattern(package: str, ecosystem: ManifestEcosystem) -> re.Pattern[bytes]:
+    name = re.escape(package.encode("ascii"))
+    if ecosystem == "node":
+        return re.compile(rb'"' + name + rb'"\s*:')
+    # Requirement names are case-insensitive, and ``fastapi-users`` must not count as ``fastapi``.
+    return re.compile(rb"(?<![A-Za-z0-9_.-])" + name + rb"(?![A-Za-z0-9_.-])", re.IGNORECASE)
+
+
+def _manifest_files(snapshot: RepoSnapshot, ecosystem: ManifestEcosystem) -> list[Path]:
+    if ecosystem == "node":
+        return snapshot.catalog.named(*_NODE_MANIFEST_NAMES)
+    return [*snapshot.catalog.requirements_files, *snapshot.catalog.named(*_PYTHON_MANIFEST_NAMES)]
+
+
+def manifest_declaring(snapshot: RepoSnapshot, package: str, *, ecosystem: ManifestEcosystem) -> str:
+    """Return the relative path of the first dependency manifest that names *package*, or ``""``."""
+
+    pattern = _declaration_pattern(package, ecosystem)
+    for path in _manifest_files(snapshot, ecosystem):
+        with open_source_bytes(path) as content:
+            if content and pattern.search(content) is not None:
+                return snapshot.relative(path)
+    return ""
+
+
+__all__ = ["manifest_declaring", "needle_pattern", "run_probe_pass"]
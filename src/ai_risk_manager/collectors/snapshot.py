@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import ast
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ai_risk_manager.collectors.artifact_cache import ArtifactCache
+from ai_risk_manager.collectors.exclusions import load_exclusion_rules
+from ai_risk_manager.collectors.file_catalog import FileCatalog
+from ai_risk_manager.collectors.file_discovery import FileStat, iter_project_file_stats
+from ai_risk_manager.collectors.parse_cache import ParsedSource, load_source, reserve_parse_cache
+
+
+@dataclass
+class RepoSnapshot:
+    """Repository-owned files discovered once per run and shared by detection, collection, profiles, and agents.
+
+    ``catalog`` buckets the files by suffix, filename, and role; ``artifact_cache`` and ``jobs`` carry
+    run-scoped collection settings to every collector, and ``process_pool`` is the per-file worker pool
+    shared by collectors that run concurrently (see ``shared_process_pool``). ``skipped`` records discovered files the shared
+    reader refused (oversized, binary, or undecodable) or, with ``skip_generated``, that look generated
+    or minified, and why.
+    """
+
+    repo_path: Path
+    catalog: FileCatalog = field(default_factory=FileCatalog)
+    stats: dict[Path, FileStat] = field(default_factory=dict)
+    artifact_cache: ArtifactCache | None = field(default=None, repr=False)
+    jobs: int = 1
+    process_pool: Executor | None = field(default=None, repr=False)
+    skip_generated: bool = False
+    skipped: dict[Path, str] = field(default_factory=dict)
+
+    @property
+    def files(self) -> list[Path]:
+        return self.catalog.files
+
+    def files_with_suffix(self, *suffixes: str) -> list[Path]:
+        """Return files whose lowercased suffix matches, preserving discovery order."""
+
+        return self.catalog.with_suffix(*suffixes)
+
+    def stat(self, path: Path) -> FileStat | None:
+        return self.stats.get(path)
+
+    def relative(self, path: Path) -> str:
+        return str(path.relative_to(self.repo_path))
+
+    def source(self, path: Path) -> ParsedSource:
+        """Return the shared decoded source for *path*, keyed by the index object ID or stat captured at discovery."""
+
+        file_stat = self.stats.get(path)
+        if file_stat is None:
+            return load_source(path)
+        source = load_source(path, mtime_ns=file_stat.mtime_ns, size=file_stat.size, blob_id=file_stat.blob_id)
+        if source.generated and self.skip_generated:
+            source = source.without_content(source.generated)
+        if source.skip_reason:
+            self.skipped[path] = source.skip_reason
+        return source
+
+    def read_text(self, path: Path) -> str:
+        """Return UTF-8 file text; unreadable files yield an empty string."""
+
+        return self.source(path).text
+
+    def blob_id(self, path: Path) -> str:
+        """Return the git-style content hash of *path*, or an empty string when it is unreadable."""
+
+        return self.source(path).blob_id
+
+    def parse_python(self, path: Path) -> ast.Module | None:
+        """Return the shared parsed module for *path*, or ``None`` for empty or syntactically invalid files."""
+
+        return self.source(path).tree
+
+
+def build_repo_snapshot(repo_path: Path) -> RepoSnapshot:
+    """Discover repository-owned files once, catalog them for the rest of the run, and size the parse cache to fit."""
+
+    exclusions = load_exclusion_rules(repo_path)
+    snapshot = RepoSnapshot(repo_path=repo_path, skip_generated=exclusions.skip_generated)
+    for path, file_stat in iter_project_file_stats(repo_path, exclusions=exclusions):
+        snapshot.catalog.add(path)
+        snapshot.stats[path] = file_stat
+    reserve_parse_cache(len(snapshot.stats))
+    return snapshot
+
+
+def resolve_snapshot(repo_path: Path, snapshot: RepoSnapshot | None) -> RepoSnapshot:
+    """Reuse a run snapshot for *repo_path* when one was provided, otherwise discover files now."""
+
+    if snapshot is not None and snapshot.repo_path == repo_path:
+        return snapshot
+    return build_repo_snapshot(repo_path)
+
+
+__all__ = ["FileStat", "RepoSnapshot", "build_repo_snapshot", "resolve_snapshot"]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ai_risk_manager.graph.store import GraphStore
+from ai_risk_manager.schemas.types import Graph, Node
+
+# Flow edges are every edge except test coverage, which points from a test into the flow it covers.
+_COVERAGE_EDGE_TYPE = "covered_by"
+
+
+@dataclass(frozen=True)
+class GraphAnalysis:
+    """Reachability along flow edges, computed once per graph and shared by every rule.
+
+    ``flow_masks[i]`` is a bitmask of the node type codes reachable from interned id ``i`` through one or
+    more flow edges. The masks come from one pass: Tarjan's algorithm condenses the flow edges into strongly
+    connected components, and the components are summarized in the reverse topological order it emits them,
+    so each component ORs together the summaries of its successors. A node reaches its own type only on a cycle.
+    """
+
+    graph: Graph
+    store: GraphStore
+    flow_masks: list[int]
+
+    @classmethod
+    def from_graph(cls, graph: Graph, store: GraphStore | None = None) -> GraphAnalysis:
+        """Analyze *graph*, reusing *store* when the caller already built the store of this same graph."""
+
+        store = store if store is not None else GraphStore.from_graph(graph)
+        return cls(graph=graph, store=store, flow_masks=_flow_type_masks(store))
+
+    def reaches_all(self, node_id: str, node_types: Iterable[str]) -> bool:
+        """Return whether flow edges from *node_id* reach a node of every type in *node_types*."""
+
+        index = self.store.index_by_id.get(node_id)
+        mask = self.flow_masks[index] if index is not None else 0
+        for node_type in node_types:
+            code = self.store.type_code(node_type)
+            if code < 0 or not mask >> code & 1:
+                return False
+        return True
+
+    def flow_types(self, node_id: str) -> set[str]:
+        index = self.store.index_by_id.get(node_id)
+        mask = self.flow_masks[index] if index is not None else 0
+        return {name for code, name in enumerate(self.store.type_names) if mask >> code & 1}
+
+    def flow_nodes(self, node_id: str) -> list[Node]:
+        """Return the nodes reachable from *node_id* through flow edges, in depth-first discovery order."""
+
+        store = self.store
+        start = store.index_by_id.get(node_id)
+        if start is None:
+            return []
+        coverage = store.type_code(_COVERAGE_EDGE_TYPE)
+        pending = store.successors(start, skip_edge_type=coverage)
+        visited: set[int] = set()
+        reachable: list[Node] = []
+        while pending:
+            index = pending.pop()
+            if index in visited:
+                continue
+            visited.add(index)
+            position = store.node_positions[index]
+            if position >= 0:
+                reachable.append(self.graph.nodes[position])
+            pending.extend(store.successors(index, skip_edge_type=coverage))
+        return reachable
+
+
+def _flow_type_masks(store: GraphStore) -> list[int]:
+    size = len(store.ids)
+    coverage = store.type_code(_COVERAGE_EDGE_TYPE)
+    successors = [store.successors(index, skip_edge_type=coverage) for index in range(size)]
+    own_masks = [
+        1 << store.node_types[index] if store.node_positions[index] >= 0 else 0 for index in range(size)
+    ]
+
+    order = [-1] * size
+    low = [0] * size
+    on_stack = bytearray(size)
+    stack: list[int] = []
+    component = [-1] * size
+    component_own: list[int] = []
+    component_reach: list[int] = []
+    counter = 0
+    for root in range(size):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, 0)]
+        while work:
+            node, child = work[-1]
+            targets = successors[node]
+            if child < len(targets):
+                work[-1] = (node, child + 1)
+                target = targets[child]
+                if order[target] == -1:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work.append((target, 0))
+                elif on_stack[target] and order[target] < low[node]:
+                    low[node] = order[target]
+                continue
+            work.pop()
+            if work and low[node] < low[work[-1][0]]:
+                low[work[-1][0]] = low[node]
+            if low[node] != order[node]:
+                continue
+            # ``node`` roots a component. Every component its members point into is already summarized.
+            current = len(component_reach)
+            members: list[int] = []
+            own = 0
+            while True:
+                member = stack.pop()
+                on_stack[member] = 0
+                component[member] = current
+                members.append(member)
+                own |= own_masks[member]
+                if member == node:
+                    break
+            reach = 0
+            for member in members:
+                for target in successors[member]:
+                    target_component = component[target]
+                    if target_component == current:
+                        reach |= own
+                    else:
+                        reach |= component_own[target_component] | component_reach[target_component]
+            component_own.append(own)
+            component_reach.append(reach)
+    return [component_reach[component[index]] for index in range(size)]
+
+
+__all__ = ["GraphAnalysis"]
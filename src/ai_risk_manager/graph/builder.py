@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 import re
 
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle, DataStoreWriteArtifact, ExternalCallArtifact
-from ai_risk_manager.signals.types import SignalBundle
+from ai_risk_manager.graph.store import GraphStore
+from ai_risk_manager.signals.merge import signal_key
+from ai_risk_manager.signals.types import CapabilitySignal, SignalBundle
 from ai_risk_manager.schemas.types import Edge, Graph, Node, TransitionSpec
 
 
@@ -55,24 +58,68 @@ def _is_path_param(segment: str) -> bool:
     return token.startswith(":") and len(token) > 1
 
 
-def _route_paths_match(api_path: str, observed_path: str) -> bool:
-    normalized_api = _normalize_route_path(api_path)
-    normalized_observed = _normalize_route_path(observed_path)
-    if normalized_api == normalized_observed:
-        return True
+class _RouteTrie:
+    """Routes of one HTTP method keyed by path segment, with ``{id}`` and ``:id`` segments as wildcards.
 
-    api_parts = [part for part in normalized_api.split("/") if part]
-    observed_parts = [part for part in normalized_observed.split("/") if part]
-    if len(api_parts) != len(observed_parts):
-        return False
+    ``match`` returns the routes with as many segments as the observed path where every segment is equal
+    or a parameter on either side. It walks only the branches that can still match instead of comparing
+    the path against every route.
+    """
 
-    for api_part, observed_part in zip(api_parts, observed_parts):
-        if api_part == observed_part:
-            continue
-        if _is_path_param(api_part) or _is_path_param(observed_part):
-            continue
-        return False
-    return True
+    __slots__ = ("api_ids", "children", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RouteTrie] = {}
+        self.wildcard: _RouteTrie | None = None
+        self.api_ids: list[str] = []
+
+    def add(self, route_path: str, api_id: str) -> None:
+        node = self
+        for part in _path_parts(route_path):
+            if _is_path_param(part):
+                if node.wildcard is None:
+                    node.wildcard = _RouteTrie()
+                node = node.wildcard
+            else:
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _RouteTrie()
+                node = child
+        node.api_ids.append(api_id)
+
+    def match(self, observed_path: str) -> set[str]:
+        level = [self]
+        for part in _path_parts(observed_path):
+            any_segment = _is_path_param(part)
+            next_level: list[_RouteTrie] = []
+            for node in level:
+                if any_segment:
+                    next_level.extend(node.children.values())
+                elif (child := node.children.get(part)) is not None:
+                    next_level.append(child)
+                if node.wildcard is not None:
+                    next_level.append(node.wildcard)
+            if not next_level:
+                return set()
+            level = next_level
+        return {api_id for node in level for api_id in node.api_ids}
+
+
+def _path_parts(route_path: str) -> list[str]:
+    # Normalizing is not idempotent for whitespace-only segments ("/a/ " becomes "/a/" and then "/a"), and
+    # matching has always compared twice-normalized paths.
+    return [part for part in _normalize_route_path(route_path).split("/") if part]
+
+
+def _token_index(names: list[str]) -> tuple[list[set[str]], dict[str, list[int]]]:
+    """Return each name's tokens and, per token, the ascending positions of the names that contain it."""
+
+    token_sets = [_tokens(name) for name in names]
+    postings: dict[str, list[int]] = {}
+    for position, tokens in enumerate(token_sets):
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+    return token_sets, postings
 
 
 def _test_type(test_file_path: str, *, has_http_call: bool) -> str:
@@ -86,9 +133,16 @@ def _test_type(test_file_path: str, *, has_http_call: bool) -> str:
 
 def _artifact_bundle_from_signals(signals: SignalBundle) -> ArtifactBundle:
     artifacts = ArtifactBundle()
-    pydantic_seen: set[tuple[str, str]] = set()
+    _add_signal_artifacts(artifacts, signals.signals, set())
+    return artifacts
+
 
-    for signal in signals.signals:
+def _add_signal_artifacts(
+    artifacts: ArtifactBundle,
+    signals: Iterable[CapabilitySignal],
+    pydantic_seen: set[tuple[str, str]],
+) -> None:
+    for signal in signals:
         attrs = signal.attributes
         file_path, line = _split_source_ref(signal.source_ref)
         if signal.kind == "http_write_surface":
@@ -276,8 +330,6 @@ def _artifact_bundle_from_signals(signals: SignalBundle) -> ArtifactBundle:
                 )
             )
 
-    return artifacts
-
 
 def _build_graph_from_artifacts(artifacts: ArtifactBundle) -> Graph:
     graph = Graph()
@@ -316,14 +368,14 @@ def _build_graph_from_artifacts(artifacts: ArtifactBundle) -> Graph:
     api_node_ids_by_name: dict[str, str] = {}
     api_node_ids_by_file_name: dict[tuple[str, str], str] = {}
     api_ids_by_route: dict[tuple[str, str], list[str]] = {}
-    api_routes_by_method: dict[str, list[tuple[str, str]]] = {}
+    api_routes_by_method: dict[str, _RouteTrie] = {}
     for file_path, endpoint_name, method, route_path, line, snippet in artifacts.write_endpoints:
         api_node_id = f"api:{_safe_id(file_path)}:{endpoint_name}"
         normalized_route_path = _normalize_route_path(route_path)
         api_node_ids_by_name[endpoint_name] = api_node_id
         api_node_ids_by_file_name[(file_path, endpoint_name)] = api_node_id
         api_ids_by_route.setdefault((method.upper(), normalized_route_path), []).append(api_node_id)
-        api_routes_by_method.setdefault(method.upper(), []).append((normalized_route_path, api_node_id))
+        api_routes_by_method.setdefault(method.upper(), _RouteTrie()).add(normalized_route_path, api_node_id)
         graph.nodes.append(
             Node(
                 id=api_node_id,
@@ -388,10 +440,8 @@ def _build_graph_from_artifacts(artifacts: ArtifactBundle) -> Graph:
             continue
         normalized_route_path = _normalize_route_path(route_path)
         matched_api_ids: set[str] = set(api_ids_by_route.get((method.upper(), normalized_route_path), []))
-        if not matched_api_ids:
-            for api_route, api_id in api_routes_by_method.get(method.upper(), []):
-                if _route_paths_match(api_route, normalized_route_path):
-                    matched_api_ids.add(api_id)
+        if not matched_api_ids and (routes := api_routes_by_method.get(method.upper())) is not None:
+            matched_api_ids = routes.match(normalized_route_path)
 
         for api_id in sorted(matched_api_ids):
             covered_pairs.add((test_id, api_id))
@@ -408,16 +458,21 @@ def _build_graph_from_artifacts(artifacts: ArtifactBundle) -> Graph:
                 )
             )
 
-    # Fallback heuristic: connect tests to endpoints when names overlap.
+    # Fallback heuristic: connect tests to endpoints when names overlap. Candidate tests come from the
+    # rarest token of the endpoint name, in graph order.
     api_nodes = [n for n in graph.nodes if n.type == "API"]
     test_nodes = [n for n in graph.nodes if n.type == "TestCase"]
+    test_token_sets, tests_by_token = _token_index([test.name for test in test_nodes])
     for api in api_nodes:
         api_tokens = _tokens(api.name)
-        for test in test_nodes:
+        if not api_tokens:
+            continue
+        candidates = min((tests_by_token.get(token, []) for token in api_tokens), key=len)
+        for position in candidates:
+            test = test_nodes[position]
             if (test.id, api.id) in covered_pairs:
                 continue
-            test_tokens = _tokens(test.name)
-            if api_tokens and api_tokens.issubset(test_tokens):
+            if api_tokens.issubset(test_token_sets[position]):
                 graph.edges.append(
                     Edge(
                         id=f"edge:{test.id}->{api.id}",
@@ -603,6 +658,85 @@ def build_graph(artifacts: ArtifactBundle | SignalBundle) -> Graph:
     return _build_graph_from_artifacts(artifacts)
 
 
+# Signal kinds that ``_build_graph_from_artifacts`` turns into nodes or edges.
+_GRAPH_SIGNAL_KINDS = frozenset(
+    {
+        "http_write_surface",
+        "request_contract_binding",
+        "state_transition_declared",
+        "state_transition_handled_guarded",
+        "test_to_endpoint_coverage",
+        "data_store_write",
+        "external_call",
+        "dependency_version_policy",
+    }
+)
+
+
+class GraphBuilder:
+    """The graph of a signal bundle, kept current as signal deltas are merged into it.
+
+    ``GraphBuilder(signals).graph()`` equals ``build_graph(signals)``, and after ``merge(delta)`` it equals
+    ``build_graph(merge_signal_bundles(signals, delta))``. Only the delta's new signals are converted to
+    artifacts; the bundle seen so far is never re-derived. A delta without graph-bearing kinds (PR
+    heuristics, profile smoke checks, most semantic signals) leaves the graph as is, and ``graph`` keeps
+    returning the same object. ``store`` is that graph's ``GraphStore``, built at most once per graph and
+    shared by impacted-scope filtering and the rule engine.
+    """
+
+    def __init__(self, signals: SignalBundle) -> None:
+        self._signals: list[CapabilitySignal] | None = list(signals.signals)
+        self._keys: set[str] = set()
+        self._artifacts = ArtifactBundle()
+        self._pydantic_seen: set[tuple[str, str]] = set()
+        _add_signal_artifacts(self._artifacts, signals.signals, self._pydantic_seen)
+        self._graph: Graph | None = None
+        self._store: GraphStore | None = None
+
+    def graph(self) -> Graph:
+        if self._graph is None:
+            self._graph = _build_graph_from_artifacts(self._artifacts)
+            self._store = None
+        return self._graph
+
+    def store(self) -> GraphStore:
+        graph = self.graph()
+        if self._store is None:
+            self._store = GraphStore.from_graph(graph)
+        return self._store
+
+    def merge(self, delta: SignalBundle) -> None:
+        if self._signals is not None:
+            self._drop_duplicate_signals(self._signals)
+            self._signals = None
+        added: list[CapabilitySignal] = []
+        for signal in delta.signals:
+            key = signal_key(signal)
+            if key in self._keys:
+                continue
+            self._keys.add(key)
+            if signal.kind in _GRAPH_SIGNAL_KINDS:
+                added.append(signal)
+        if added:
+            _add_signal_artifacts(self._artifacts, added, self._pydantic_seen)
+            self._graph = None
+
+    def _drop_duplicate_signals(self, signals: list[CapabilitySignal]) -> None:
+        # Merging collapses repeated signals of the initial bundle too; rebuild only if it had any.
+        unique: list[CapabilitySignal] = []
+        for signal in signals:
+            key = signal_key(signal)
+            if key not in self._keys:
+                self._keys.add(key)
+                unique.append(signal)
+        if len(unique) == len(signals):
+            return
+        self._artifacts = ArtifactBundle()
+        self._pydantic_seen = set()
+        _add_signal_artifacts(self._artifacts, unique, self._pydantic_seen)
+        self._graph = None
+
+
 def low_confidence_ratio(graph: Graph) -> float:
     total = len(graph.nodes) + len(graph.edges)
     if total == 0:
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+
+from ai_risk_manager.schemas.types import Graph
+
+
+@dataclass(frozen=True)
+class GraphStore:
+    """Interned, array-backed adjacency of one ``Graph``.
+
+    Node ids, and ids that only appear as edge endpoints, are interned to consecutive integers: nodes first
+    in graph order, then dangling endpoints in edge order. Node and edge types are small-int codes into
+    ``type_names``, and edge endpoints are integer columns. Outgoing and incoming edges are CSR arrays: the
+    outgoing edges of id ``i`` are ``out_edges[out_offsets[i]:out_offsets[i + 1]]``, in ``graph.edges`` order.
+
+    The store is a read-only index for traversals. ``Graph.nodes`` and ``Graph.edges`` stay the form that
+    rules read and reports serialize, so build a new store whenever the graph changes.
+    """
+
+    ids: list[str]
+    index_by_id: dict[str, int]
+    node_positions: array[int]
+    node_types: array[int]
+    type_names: list[str]
+    edge_sources: array[int]
+    edge_targets: array[int]
+    edge_types: array[int]
+    out_offsets: array[int]
+    out_edges: array[int]
+    in_offsets: array[int]
+    in_edges: array[int]
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> GraphStore:
+        index_by_id: dict[str, int] = {}
+        ids: list[str] = []
+        type_codes: dict[str, int] = {}
+        type_names: list[str] = []
+
+        def intern(node_id: str) -> int:
+            index = index_by_id.get(node_id)
+            if index is None:
+                index = index_by_id[node_id] = len(ids)
+                ids.append(node_id)
+            return index
+
+        def type_code(name: str) -> int:
+            code = type_codes.get(name)
+            if code is None:
+                code = type_codes[name] = len(type_names)
+                type_names.append(name)
+            return code
+
+        # A repeated node id resolves to its last node, as ``{node.id: node for node in graph.nodes}`` does.
+        positions: dict[int, int] = {}
+        for position, node in enumerate(graph.nodes):
+            positions[intern(node.id)] = position
+        edge_sources = array("I", [intern(edge.source_node_id) for edge in graph.edges])
+        edge_targets = array("I", [intern(edge.target_node_id) for edge in graph.edges])
+        edge_types = array("H", [type_code(edge.type) for edge in graph.edges])
+
+        node_positions = array("i", [-1]) * len(ids)
+        node_types = array("H", [0]) * len(ids)
+        for index, position in positions.items():
+            node_positions[index] = position
+            node_types[index] = type_code(graph.nodes[position].type)
+
+        out_offsets, out_edges = _csr(edge_sources, len(ids))
+        in_offsets, in_edges = _csr(edge_targets, len(ids))
+        return cls(
+            ids=ids,
+            index_by_id=index_by_id,
+            node_positions=node_positions,
+            node_types=node_types,
+            type_names=type_names,
+            edge_sources=edge_sources,
+            edge_targets=edge_targets,
+            edge_types=edge_types,
+            out_offsets=out_offsets,
+            out_edges=out_edges,
+            in_offsets=in_offsets,
+            in_edges=in_edges,
+        )
+
+    def type_code(self, name: str) -> int:
+        """Return the code of a node or edge type, or ``-1`` when the graph has none of that type."""
+
+        try:
+            return self.type_names.index(name)
+        except ValueError:
+            return -1
+
+    def successors(self, index: int, *, skip_edge_type: int = -1) -> list[int]:
+        """Return the targets of the outgoing edges of *index* in edge order, skipping one edge type."""
+
+        edge_types = self.edge_types
+        edge_targets = self.edge_targets
+        return [
+            edge_targets[edge]
+            for edge in self.out_edges[self.out_offsets[index] : self.out_offsets[index + 1]]
+            if edge_types[edge] != skip_edge_type
+        ]
+
+    def neighbours(self, index: int) -> list[int]:
+        """Return the endpoints of every edge that touches *index*, in either direction."""
+
+        outgoing = self.out_edges[self.out_offsets[index] : self.out_offsets[index + 1]]
+        incoming = self.in_edges[self.in_offsets[index] : self.in_offsets[index + 1]]
+        return [
+            *(self.edge_targets[edge] for edge in outgoing),
+            *(self.edge_sources[edge] for edge in incoming),
+        ]
+
+
+def _csr(endpoints: array[int], size: int) -> tuple[array[int], array[int]]:
+    offsets = array("I", [0]) * (size + 1)
+    for endpoint in endpoints:
+        offsets[endpoint + 1] += 1
+    for index in range(size):
+        offsets[index + 1] += offsets[index]
+    cursor = array("I", offsets)
+    edges = array("I", [0]) * len(endpoints)
+    for edge, endpoint in enumerate(endpoints):
+        edges[cursor[endpoint]] = edge
+        cursor[endpoint] += 1
+    return offsets, edges
+
+
+__all__ = ["GraphStore"]
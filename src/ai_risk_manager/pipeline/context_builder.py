@@ -3,7 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Literal, cast
 
-from ai_risk_manager.schemas.types import AnalysisEngine, CIMode, Confidence, RiskPolicy, RunContext, Severity, SupportLevel
+from ai_risk_manager.schemas.types import (
+    AnalysisEngine,
+    CIMode,
+    Confidence,
+    L0Depth,
+    RiskPolicy,
+    RunContext,
+    Severity,
+    SupportLevel,
+)
 
 
 def normalize_cli_choice(value: str) -> str:
@@ -21,6 +30,7 @@ _ANALYSIS_ENGINE_CHOICES = {"deterministic", "hybrid", "ai_first"}
 _CONFIDENCE_CHOICES = {"high", "medium", "low"}
 _CI_MODE_CHOICES = {"advisory", "soft", "block_new_critical"}
 _SUPPORT_LEVEL_CHOICES = {"auto", "l0", "l1", "l2"}
+_L0_DEPTH_CHOICES = {0, 1, 2}
 _RISK_POLICY_CHOICES = {"conservative", "balanced", "aggressive"}
 _SEVERITY_CHOICES = {"critical", "high", "medium", "low"}
 
@@ -50,6 +60,10 @@ def build_run_context(
     ci_mode: str = "advisory",
     support_level: str = "auto",
     risk_policy: str = "balanced",
+    cache_dir: Path | None = None,
+    jobs: int | None = None,
+    multi_stack: bool = False,
+    l0_depth: int = 2,
 ) -> RunContext:
     mode_value = cast(Mode, _parse_choice(mode, _MODE_CHOICES, field="mode"))
     provider_value = cast(Provider, _parse_choice(provider, _PROVIDER_CHOICES, field="provider"))
@@ -63,6 +77,8 @@ def build_run_context(
         SupportLevel, _parse_choice(support_level, _SUPPORT_LEVEL_CHOICES, field="support_level")
     )
     risk_policy_value = cast(RiskPolicy, _parse_choice(risk_policy, _RISK_POLICY_CHOICES, field="risk_policy"))
+    if l0_depth not in _L0_DEPTH_CHOICES:
+        raise ValueError(f"Invalid value for l0_depth: {l0_depth!r}. Allowed: 0, 1, 2.")
     fail_on_severity_value: Severity | None = None
     if fail_on_severity is not None:
         fail_on_severity_value = cast(
@@ -86,4 +102,8 @@ def build_run_context(
         ci_mode=ci_mode_value,
         support_level=support_level_value,
         risk_policy=risk_policy_value,
+        cache_dir=cache_dir,
+        jobs=jobs,
+        multi_stack=multi_stack,
+        l0_depth=cast(L0Depth, l0_depth),
     )
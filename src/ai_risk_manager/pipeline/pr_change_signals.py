@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 import re
 
+from ai_risk_manager.collectors.anchored_scan import AnchoredPattern, AnchorScanner
 from ai_risk_manager.signals.types import CapabilitySignal, SignalBundle, SignalKind
 
 _SOURCE_SUFFIXES = {
@@ -114,6 +115,9 @@ _ADDED_4XX_BRANCH_RE = re.compile(
     r"raise\s+HTTPException[\s\S]*?status_code\s*=\s*(?:status\.HTTP_[A-Z_]*4\d\d|4\d\d)",
     re.IGNORECASE,
 )
+_ADDED_4XX_BRANCH_SCAN = AnchoredPattern(
+    _ADDED_4XX_BRANCH_RE, ("raise",), head=re.compile(r"raise\s+HTTPException", re.IGNORECASE)
+)
 _ADDED_NEGATIVE_TEST_RE = re.compile(
     r"(?:status_code|status)\s*(?:==|in)\s*(?:\{[^}]*4\d\d|4\d\d)|"
     r"pytest\.raises|assertRaises|assert[\s\S]{0,80}(?:error|detail|forbidden|unauthorized|conflict)",
@@ -604,7 +608,7 @@ def build_pr_diff_signal_bundle(
         for source_path, added_text in added_by_file.items():
             if source_path not in changed or not _is_source_file(source_path):
                 continue
-            if not _ADDED_4XX_BRANCH_RE.search(added_text):
+            if AnchorScanner(added_text).search(_ADDED_4XX_BRANCH_SCAN) is None:
                 continue
             signals.append(
                 CapabilitySignal(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 import json
 from pathlib import Path
@@ -12,7 +13,12 @@ from ai_risk_manager.agents.qa_strategy_agent import generate_test_plan
 from ai_risk_manager.agents.semantic_risk_agent import generate_semantic_findings
 from ai_risk_manager.agents.semantic_signal_agent import generate_semantic_signals
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle
-from ai_risk_manager.graph.builder import build_graph, low_confidence_ratio
+from ai_risk_manager.collectors.artifact_cache import ArtifactCache
+from ai_risk_manager.collectors.parallel import resolve_jobs
+from ai_risk_manager.collectors.parse_cache import clear_parse_cache
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, build_repo_snapshot
+from ai_risk_manager.graph.builder import GraphBuilder, low_confidence_ratio
+from ai_risk_manager.graph.store import GraphStore
 from ai_risk_manager.pipeline.merge_findings import (
     ensure_fingerprint,
     fingerprint_aliases,
@@ -151,22 +157,30 @@ def _resolve_changed_files(repo_path: Path, base: str | None, *, sinks: Pipeline
     return active_sinks.changed_files.resolve(repo_path, base)
 
 
-def _filter_graph_to_impacted(graph: Graph, changed_files: set[str]) -> Graph:
+def _filter_graph_to_impacted(graph: Graph, changed_files: set[str], store: GraphStore | None = None) -> Graph:
     changed = {_normalize_path(path) for path in changed_files}
-    node_by_id = {node.id: node for node in graph.nodes}
-
     impacted_ids = {node.id for node in graph.nodes if _source_file_ref(node.source_ref) in changed}
     if not impacted_ids:
         return Graph(nodes=[], edges=[], declared_transitions=[], handled_transitions=[])
 
-    expanded = set(impacted_ids)
-    for edge in graph.edges:
-        if edge.source_node_id in impacted_ids or edge.target_node_id in impacted_ids:
-            expanded.add(edge.source_node_id)
-            expanded.add(edge.target_node_id)
-
-    nodes = [node_by_id[node_id] for node_id in expanded if node_id in node_by_id]
-    edges = [edge for edge in graph.edges if edge.source_node_id in expanded and edge.target_node_id in expanded]
+    store = store if store is not None else GraphStore.from_graph(graph)
+    expanded = bytearray(len(store.ids))
+    for node_id in impacted_ids:
+        index = store.index_by_id[node_id]
+        expanded[index] = 1
+        for neighbour in store.neighbours(index):
+            expanded[neighbour] = 1
+
+    nodes = [
+        graph.nodes[position]
+        for index, position in enumerate(store.node_positions)
+        if expanded[index] and position >= 0
+    ]
+    edges = [
+        edge
+        for edge, source, target in zip(graph.edges, store.edge_sources, store.edge_targets)
+        if expanded[source] and expanded[target]
+    ]
     declared = [transition for transition in graph.declared_transitions if _source_file_ref(transition.source_ref) in changed]
     handled = [transition for transition in graph.handled_transitions if _source_file_ref(transition.source_ref) in changed]
     return Graph(nodes=nodes, edges=edges, declared_transitions=declared, handled_transitions=handled)
@@ -301,6 +315,8 @@ def _compute_run_metrics(
     evidence_completeness: float,
     analysis_scope: AnalysisScope,
     duration_ms: int,
+    skipped_files: dict[str, int] | None = None,
+    rule_duration_ms: dict[str, float] | None = None,
 ) -> RunMetrics:
     if not findings.findings:
         return RunMetrics(
@@ -315,6 +331,8 @@ def _compute_run_metrics(
             competitive_mode=competitive_mode,
             analysis_scope=analysis_scope,
             duration_ms=duration_ms,
+            skipped_files=dict(skipped_files or {}),
+            rule_duration_ms=dict(rule_duration_ms or {}),
         )
 
     total = max(1, len(findings.findings))
@@ -339,6 +357,8 @@ def _compute_run_metrics(
         competitive_mode=competitive_mode,
         analysis_scope=analysis_scope,
         duration_ms=duration_ms,
+        skipped_files=dict(skipped_files or {}),
+        rule_duration_ms=dict(rule_duration_ms or {}),
     )
 
 
@@ -348,6 +368,7 @@ class _PreflightStage:
     prepared_profile: CodeRiskPreparedProfile
     ui_flow_profile: UiFlowPreparedProfile
     business_invariant_profile: BusinessInvariantPreparedProfile
+    snapshot: RepoSnapshot
 
 
 @dataclass
@@ -361,6 +382,7 @@ class _ScopeStage:
     analysis_scope: AnalysisScope
     analysis_graph: Graph
     analysis_signals: SignalBundle
+    analysis_graph_builder: GraphBuilder
     fallback_reason: str | None
     changed_files: set[str] | None
     diff_text: str | None
@@ -378,6 +400,7 @@ class _AnalysisStage:
     suppressed_count: int
     verified_fingerprints: set[str]
     policy: PolicyConfig
+    rule_duration_ms: dict[str, float]
 
 
 def _stage_preflight(
@@ -388,7 +411,13 @@ def _stage_preflight(
     notes: list[str],
 ) -> tuple[_PreflightStage | None, int | None]:
     t = sinks.progress.start(1, total_steps, "Stack detection and pre-flight")
-    detection = detect_stack(ctx.repo_path)
+    snapshot = build_repo_snapshot(ctx.repo_path)
+    snapshot.jobs = resolve_jobs(ctx.jobs)
+    if ctx.cache_dir is not None:
+        snapshot.artifact_cache = ArtifactCache.load(ctx.cache_dir)
+        if snapshot.artifact_cache.load_error is not None:
+            notes.append(f"Artifact cache was unreadable and has been reset ({snapshot.artifact_cache.load_error}).")
+    detection = detect_stack(ctx.repo_path, snapshot=snapshot)
 
     code_risk_profile = get_profile("code_risk")
     if code_risk_profile is None:
@@ -397,7 +426,7 @@ def _stage_preflight(
         return None, 2
     code_risk_profile = cast(CodeRiskProfile, code_risk_profile)
 
-    prepared_profile, exit_code = code_risk_profile.prepare(ctx, notes, detection=detection)
+    prepared_profile, exit_code = code_risk_profile.prepare(ctx, notes, detection=detection, snapshot=snapshot)
     sinks.progress.finish(1, total_steps, "Stack detection and pre-flight", t)
     if exit_code is not None or prepared_profile is None:
         return None, exit_code or 2
@@ -407,7 +436,7 @@ def _stage_preflight(
         notes.append("Shipped ui_flow_risk profile is not registered.")
         return None, 2
     ui_flow_profile = cast(UiFlowProfile, ui_flow_profile)
-    prepared_ui_flow = ui_flow_profile.prepare(ctx.repo_path)
+    prepared_ui_flow = ui_flow_profile.prepare(ctx.repo_path, snapshot=snapshot)
 
     business_invariant_profile = get_profile("business_invariant_risk")
     if business_invariant_profile is None:
@@ -422,17 +451,47 @@ def _stage_preflight(
             prepared_profile=prepared_profile,
             ui_flow_profile=prepared_ui_flow,
             business_invariant_profile=prepared_business_invariant,
+            snapshot=snapshot,
         ),
         None,
     )
 
 
+def _persist_artifact_cache(cache: ArtifactCache, notes: list[str]) -> None:
+    notes.append(f"Artifact cache: {cache.hits} cached extraction(s) reused, {cache.misses} recomputed.")
+    try:
+        cache.save()
+    except OSError as exc:
+        notes.append(f"Artifact cache could not be written: {exc}.")
+
+
+def _skipped_files_note(snapshot: RepoSnapshot) -> str | None:
+    if not snapshot.skipped:
+        return None
+    by_reason: dict[str, list[str]] = defaultdict(list)
+    for path, reason in snapshot.skipped.items():
+        by_reason[reason].append(snapshot.relative(path))
+    reasons = "; ".join(f"{reason}: {', '.join(sorted(paths))}" for reason, paths in sorted(by_reason.items()))
+    return f"Skipped {len(snapshot.skipped)} file(s) during collection ({reasons})."
+
+
+def _timeout_note(snapshot: RepoSnapshot) -> str | None:
+    timed_out = sorted(snapshot.relative(path) for path, reason in snapshot.skipped.items() if reason == "timeout")
+    if not timed_out:
+        return None
+    return (
+        f"Extraction exceeded the per-file CPU budget (AIRISK_FILE_CPU_BUDGET) for {len(timed_out)} file(s); "
+        f"their artifacts are missing, e.g. {', '.join(timed_out[:3])}."
+    )
+
+
 def _stage_collect_artifacts(
     ctx: RunContext,
     *,
     prepared_profile: CodeRiskPreparedProfile,
     sinks: PipelineSinks,
     total_steps: int,
+    notes: list[str],
 ) -> _CollectStage:
     t = sinks.progress.start(2, total_steps, "Collecting artifacts")
     code_risk_profile = get_profile("code_risk")
@@ -440,6 +499,13 @@ def _stage_collect_artifacts(
         raise RuntimeError("Shipped code_risk profile is not registered.")
     code_risk_profile = cast(CodeRiskProfile, code_risk_profile)
     artifacts, signals = code_risk_profile.collect(prepared_profile, ctx.repo_path)
+    snapshot = prepared_profile.snapshot
+    if snapshot is not None and (skipped_note := _skipped_files_note(snapshot)) is not None:
+        notes.append(skipped_note)
+    if snapshot is not None and (timeout_note := _timeout_note(snapshot)) is not None:
+        notes.append(timeout_note)
+    if snapshot is not None and snapshot.artifact_cache is not None:
+        _persist_artifact_cache(snapshot.artifact_cache, notes)
     sinks.progress.finish(2, total_steps, "Collecting artifacts", t)
     return _CollectStage(artifacts=artifacts, signals=signals)
 
@@ -449,24 +515,27 @@ def _stage_build_graph(
     *,
     sinks: PipelineSinks,
     total_steps: int,
-) -> Graph:
+) -> GraphBuilder:
     t = sinks.progress.start(3, total_steps, "Building graph")
-    graph = build_graph(signals)
+    graph_builder = GraphBuilder(signals)
+    graph_builder.graph()
     sinks.progress.finish(3, total_steps, "Building graph", t)
-    return graph
+    return graph_builder
 
 
 def _stage_resolve_scope(
     ctx: RunContext,
-    graph: Graph,
+    graph_builder: GraphBuilder,
     signals: SignalBundle,
     *,
     sinks: PipelineSinks,
     notes: list[str],
 ) -> _ScopeStage:
     analysis_scope: AnalysisScope = "full"
+    graph = graph_builder.graph()
     analysis_graph = graph
     analysis_signals = signals
+    analysis_graph_builder = graph_builder
     fallback_reason: str | None = None
     changed_files: set[str] | None = None
     diff_text: str | None = None
@@ -488,10 +557,11 @@ def _stage_resolve_scope(
                 fallback_reason = "changed_files_empty"
                 notes.append("No changed files detected in PR diff; using full_fallback scan.")
             else:
-                impacted_graph = _filter_graph_to_impacted(graph, changed_files)
+                impacted_graph = _filter_graph_to_impacted(graph, changed_files, graph_builder.store())
                 if impacted_graph.nodes:
                     analysis_graph = impacted_graph
                     analysis_signals = _filter_signals_to_impacted(signals, changed_files)
+                    analysis_graph_builder = GraphBuilder(analysis_signals)
                     analysis_scope = "impacted"
                     notes.append(f"Impacted subgraph selected from {len(changed_files)} changed file(s).")
                 else:
@@ -507,6 +577,7 @@ def _stage_resolve_scope(
         analysis_scope=analysis_scope,
         analysis_graph=analysis_graph,
         analysis_signals=analysis_signals,
+        analysis_graph_builder=analysis_graph_builder,
         fallback_reason=fallback_reason,
         changed_files=changed_files,
         diff_text=diff_text,
@@ -593,8 +664,10 @@ def _stage_analysis(
     sinks: PipelineSinks,
     total_steps: int,
     notes: list[str],
+    snapshot: RepoSnapshot | None = None,
 ) -> tuple[_AnalysisStage | None, int | None]:
     deterministic_signals = scope.analysis_signals
+    graph_builder = scope.analysis_graph_builder
     if ctx.mode == "pr":
         pr_change_signals = build_pr_change_signal_bundle(scope.changed_files, scope.diff_text, ctx.repo_path)
         pr_diff_signals = build_pr_diff_signal_bundle(ctx.repo_path, scope.diff_text, scope.changed_files)
@@ -604,12 +677,21 @@ def _stage_analysis(
         if pr_change_signals.signals:
             notes.append(f"Universal PR heuristics produced {len(pr_change_signals.signals)} signal(s).")
             deterministic_signals = merge_signal_bundles(deterministic_signals, pr_change_signals, min_confidence="low")
+            graph_builder.merge(pr_change_signals)
         if profile_signals.signals:
             notes.append(f"Profile heuristics produced {len(profile_signals.signals)} signal(s).")
             deterministic_signals = merge_signal_bundles(deterministic_signals, profile_signals, min_confidence="low")
+            graph_builder.merge(profile_signals)
 
     t = sinks.progress.start(4, total_steps, "Running deterministic rules")
-    findings_raw = run_rules(deterministic_signals, risk_policy=ctx.risk_policy)
+    rule_timings: dict[str, float] = {}
+    findings_raw = run_rules(
+        graph_builder.graph(),
+        signals=deterministic_signals,
+        risk_policy=ctx.risk_policy,
+        timings=rule_timings,
+        store=graph_builder.store(),
+    )
     sinks.progress.finish(4, total_steps, "Running deterministic rules", t)
     deterministic_graph = scope.analysis_graph
 
@@ -636,8 +718,8 @@ def _stage_analysis(
     notes.extend(semantic_signal_notes)
     filtered_semantic_signals = merge_signal_bundles(semantic_signals, min_confidence=ctx.min_confidence)
     semantic_signal_count = len(filtered_semantic_signals.signals)
-    merged_signals = merge_signal_bundles(deterministic_signals, filtered_semantic_signals, min_confidence="low")
-    semantic_graph = build_graph(merged_signals)
+    graph_builder.merge(filtered_semantic_signals)
+    semantic_graph = graph_builder.graph()
     semantic_findings = FindingsReport(findings=[], generated_without_llm=True)
     generic_advisory_findings = FindingsReport(findings=[], generated_without_llm=True)
     if ctx.analysis_engine != "deterministic":
@@ -652,6 +734,7 @@ def _stage_analysis(
                 ctx.repo_path,
                 provider=provider_resolution.provider,
                 generated_without_llm=provider_resolution.generated_without_llm,
+                snapshot=snapshot,
             )
             notes.extend(generic_notes)
     else:
@@ -750,6 +833,7 @@ def _stage_analysis(
             suppressed_count=suppressed_count,
             verified_fingerprints=verified_fingerprints,
             policy=policy,
+            rule_duration_ms={name: round(seconds * 1000, 3) for name, seconds in rule_timings.items()},
         ),
         None,
     )
@@ -794,6 +878,18 @@ def _resolve_exit_code(
 
 
 def run_pipeline(ctx: RunContext, *, sinks: PipelineSinks | None = None) -> tuple[PipelineResult | None, int, list[str]]:
+    try:
+        return _run_pipeline_stages(ctx, sinks=sinks)
+    finally:
+        # Parsed sources serve one run; a long-lived process must not keep every repository it analyzed.
+        clear_parse_cache()
+
+
+def _run_pipeline_stages(
+    ctx: RunContext,
+    *,
+    sinks: PipelineSinks | None = None,
+) -> tuple[PipelineResult | None, int, list[str]]:
     active_sinks = sinks or PipelineSinks()
     pipeline_started = time.perf_counter()
     total_steps = 6
@@ -808,9 +904,10 @@ def run_pipeline(ctx: RunContext, *, sinks: PipelineSinks | None = None) -> tupl
         prepared_profile=preflight_stage.prepared_profile,
         sinks=active_sinks,
         total_steps=total_steps,
+        notes=notes,
     )
-    graph = _stage_build_graph(collected_stage.signals, sinks=active_sinks, total_steps=total_steps)
-    scope_stage = _stage_resolve_scope(ctx, graph, collected_stage.signals, sinks=active_sinks, notes=notes)
+    graph_builder = _stage_build_graph(collected_stage.signals, sinks=active_sinks, total_steps=total_steps)
+    scope_stage = _stage_resolve_scope(ctx, graph_builder, collected_stage.signals, sinks=active_sinks, notes=notes)
     profile_review_focus, profile_notes, profile_signals = _resolve_ui_flow_assessment(
         repo_path=ctx.repo_path,
         ui_flow_profile=preflight_stage.ui_flow_profile,
@@ -849,6 +946,7 @@ def run_pipeline(ctx: RunContext, *, sinks: PipelineSinks | None = None) -> tupl
         sinks=active_sinks,
         total_steps=total_steps,
         notes=notes,
+        snapshot=preflight_stage.snapshot,
     )
     if analysis_exit is not None or analysis_stage is None:
         return None, analysis_exit or 1, notes
@@ -863,6 +961,8 @@ def run_pipeline(ctx: RunContext, *, sinks: PipelineSinks | None = None) -> tupl
         evidence_completeness=analysis_stage.summary.evidence_completeness,
         analysis_scope=scope_stage.analysis_scope,
         duration_ms=duration_ms,
+        skipped_files=dict(sorted(Counter(preflight_stage.snapshot.skipped.values()).items())),
+        rule_duration_ms=analysis_stage.rule_duration_ms,
     )
     result = PipelineResult(
         preflight=preflight_stage.preflight,
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from ai_risk_manager.collectors.plugins.base import ArtifactBundle, CollectorPlugin
+from ai_risk_manager.collectors.parallel import shared_process_pool
+from ai_risk_manager.collectors.plugins.base import ArtifactBundle, CollectorPlugin, merge_artifact_bundles
 from ai_risk_manager.collectors.plugins.registry import get_plugin_for_stack
 from ai_risk_manager.collectors.plugins.universal_artifacts import collect_universal_artifacts
+from ai_risk_manager.collectors.snapshot import RepoSnapshot
 from ai_risk_manager.profiles.base import ProfileApplicability, ProfileId
 from ai_risk_manager.schemas.types import (
     AppliedSupportLevel,
     AnalysisEngine,
     CompetitiveMode,
+    L0Depth,
     PreflightResult,
     RepositorySupportState,
     RunContext,
     SupportLevel,
 )
 from ai_risk_manager.signals.adapters import artifact_bundle_to_signal_bundle
+from ai_risk_manager.signals.merge import merge_signal_bundles
 from ai_risk_manager.signals.types import SignalBundle
 from ai_risk_manager.stacks.discovery import StackDetectionResult
 
@@ -69,6 +74,67 @@ class CodeRiskPreparedProfile:
     support_level_applied: AppliedSupportLevel
     competitive_mode: CompetitiveMode
     repository_support_state: RepositorySupportState
+    snapshot: RepoSnapshot | None = field(default=None, repr=False)
+    extra_plugins: tuple[CollectorPlugin, ...] = ()
+    l0_depth: L0Depth = 2
+
+
+def _additional_stack_plugins(
+    ctx: RunContext,
+    notes: list[str],
+    *,
+    detection: StackDetectionResult,
+    snapshot: RepoSnapshot | None,
+) -> tuple[CollectorPlugin, ...]:
+    extra_plugins: list[CollectorPlugin] = []
+    for probe in detection.probes[1:]:
+        plugin = get_plugin_for_stack(probe.stack_id)
+        if plugin is None:
+            continue
+        preflight = plugin.preflight(ctx.repo_path, probe_data=probe.probe_data, snapshot=snapshot)
+        if preflight.status == "FAIL":
+            notes.append(f"Additional stack {probe.stack_id} skipped: pre-flight failed.")
+            continue
+        notes.append(f"Additional stack collected: {probe.stack_id} (confidence: {probe.confidence}).")
+        extra_plugins.append(plugin)
+    return tuple(extra_plugins)
+
+
+def _collect_plugin(
+    plugin: CollectorPlugin,
+    repo_path: Path,
+    snapshot: RepoSnapshot | None,
+) -> tuple[ArtifactBundle, SignalBundle]:
+    artifacts = plugin.collect(repo_path, snapshot=snapshot)
+    collect_signals_from_artifacts = getattr(plugin, "collect_signals_from_artifacts", None)
+    if callable(collect_signals_from_artifacts):
+        return artifacts, collect_signals_from_artifacts(artifacts)
+    return artifacts, artifact_bundle_to_signal_bundle(artifacts)
+
+
+def _collect_plugins(
+    plugins: tuple[CollectorPlugin, ...],
+    repo_path: Path,
+    snapshot: RepoSnapshot | None,
+) -> tuple[ArtifactBundle, SignalBundle]:
+    """Collect several stacks and merge their bundles in plugin order.
+
+    Collectors may read the same files: FastAPI and Django both extract every ``.py`` file, and every
+    collector reads the dependency manifests. ``merge_artifact_bundles`` drops repository-level rows (file
+    lists, dependency specs, workflow issues) that an earlier bundle already contributed, compared by
+    ``repr(row)``, and concatenates every other field unchanged. With ``--jobs`` above one the collectors run on threads
+    that share a single per-file process pool, so a mixed repository takes about as long as its slowest
+    collector. Artifact-cache reads and writes stay in this process.
+    """
+
+    if snapshot is None or snapshot.jobs <= 1:
+        results = [_collect_plugin(plugin, repo_path, snapshot) for plugin in plugins]
+    else:
+        with shared_process_pool(snapshot), ThreadPoolExecutor(max_workers=len(plugins)) as executor:
+            results = list(executor.map(lambda plugin: _collect_plugin(plugin, repo_path, snapshot), plugins))
+    artifacts = merge_artifact_bundles(*(bundle for bundle, _ in results))
+    signals = merge_signal_bundles(*(bundle for _, bundle in results), min_confidence="low")
+    return artifacts, signals
 
 
 class CodeRiskProfile:
@@ -80,6 +146,7 @@ class CodeRiskProfile:
         notes: list[str],
         *,
         detection: StackDetectionResult,
+        snapshot: RepoSnapshot | None = None,
     ) -> tuple[CodeRiskPreparedProfile | None, int | None]:
         notes.append(f"Detected stack: {detection.stack_id} (confidence: {detection.confidence}).")
         support_level_applied = _resolve_support_level(ctx.support_level, detection.stack_id)
@@ -99,8 +166,10 @@ class CodeRiskProfile:
                 status="WARN",
                 reasons=[*detection.reasons, "Unknown stack: fallback to L0 universal risk mode."],
             )
+            if ctx.l0_depth < 2:
+                notes.append(f"L0 collection depth: {ctx.l0_depth} (full depth is 2).")
         else:
-            preflight = plugin.preflight(ctx.repo_path, probe_data=detection.probe_data)
+            preflight = plugin.preflight(ctx.repo_path, probe_data=detection.probe_data, snapshot=snapshot)
 
         if preflight.status == "FAIL":
             notes.append(f"Support level applied: {support_level_applied}.")
@@ -117,6 +186,9 @@ class CodeRiskProfile:
                     support_level_applied = downgraded
 
         notes.append(f"Support level applied: {support_level_applied}.")
+        extra_plugins: tuple[CollectorPlugin, ...] = ()
+        if ctx.multi_stack and plugin is not None:
+            extra_plugins = _additional_stack_plugins(ctx, notes, detection=detection, snapshot=snapshot)
         return (
             CodeRiskPreparedProfile(
                 profile_id=self.profile_id,
@@ -130,20 +202,21 @@ class CodeRiskProfile:
                     plugin=plugin,
                     support_level_applied=support_level_applied,
                 ),
+                snapshot=snapshot,
+                extra_plugins=extra_plugins,
+                l0_depth=ctx.l0_depth,
             ),
             None,
         )
 
     def collect(self, prepared: CodeRiskPreparedProfile, repo_path: Path) -> tuple[ArtifactBundle, SignalBundle]:
-        artifacts = collect_universal_artifacts(repo_path) if prepared.plugin is None else prepared.plugin.collect(repo_path)
-        collect_signals_from_artifacts = (
-            getattr(prepared.plugin, "collect_signals_from_artifacts", None) if prepared.plugin is not None else None
-        )
-        if callable(collect_signals_from_artifacts):
-            signals = collect_signals_from_artifacts(artifacts)
-        else:
-            signals = artifact_bundle_to_signal_bundle(artifacts)
-        return artifacts, signals
+        snapshot = prepared.snapshot
+        if prepared.plugin is None:
+            artifacts = collect_universal_artifacts(repo_path, snapshot=snapshot, depth=prepared.l0_depth)
+            return artifacts, artifact_bundle_to_signal_bundle(artifacts)
+        if prepared.extra_plugins:
+            return _collect_plugins((prepared.plugin, *prepared.extra_plugins), repo_path, snapshot)
+        return _collect_plugin(prepared.plugin, repo_path, snapshot)
 
 
 __all__ = ["CodeRiskPreparedProfile", "CodeRiskProfile"]
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 from ai_risk_manager.profiles.base import ProfileApplicability, ProfileId
 from ai_risk_manager.profiles.ui_flow_smoke import load_ui_smoke_manifest, run_ui_smoke
 from ai_risk_manager.signals.types import SignalBundle
@@ -74,8 +74,8 @@ class UiFlowScopeAssessment:
     smoke_signals: SignalBundle
 
 
-def _iter_candidate_files(repo_path: Path) -> list[Path]:
-    return iter_project_files(repo_path)
+def _iter_candidate_files(repo_path: Path, snapshot: RepoSnapshot | None = None) -> list[Path]:
+    return list(resolve_snapshot(repo_path, snapshot).files)
 
 
 def _read_json(path: Path) -> dict | None:
@@ -261,8 +261,8 @@ def _collect_changed_scope(changed_files: set[str] | None) -> _ChangedUiScope:
 class UiFlowProfile:
     profile_id: ProfileId = "ui_flow_risk"
 
-    def prepare(self, repo_path: Path) -> UiFlowPreparedProfile:
-        files = _iter_candidate_files(repo_path)
+    def prepare(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> UiFlowPreparedProfile:
+        files = _iter_candidate_files(repo_path, snapshot)
         framework = _detect_framework(repo_path, files)
         if framework is None and not _has_ui_surface(repo_path, files):
             return UiFlowPreparedProfile(profile_id=self.profile_id, applicability="not_applicable", framework=None)
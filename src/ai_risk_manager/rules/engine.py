@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
 from typing import cast
 
+from ai_risk_manager.graph.analysis import GraphAnalysis
 from ai_risk_manager.graph.builder import build_graph
-from ai_risk_manager.signals.types import SignalBundle
+from ai_risk_manager.graph.store import GraphStore
+from ai_risk_manager.signals.types import CapabilitySignal, SignalBundle, SignalKind
 from ai_risk_manager.schemas.types import Confidence, Finding, FindingsReport, Graph, Node, RiskPolicy, Severity
 
 DEPENDENCY_VIOLATIONS_BY_POLICY: dict[RiskPolicy, set[str]] = {
@@ -38,30 +43,12 @@ def _api_display_label(api: Node) -> str:
 _FULL_WRITE_FLOW_TYPES = {"Entity", "Transition", "DataStore", "ExternalSystem"}
 
 
-def _reachable_architecture_nodes(graph: Graph, start_node_id: str) -> list[Node]:
-    nodes_by_id = {node.id: node for node in graph.nodes}
-    outgoing: dict[str, list[str]] = {}
-    for edge in graph.edges:
-        if edge.type == "covered_by":
-            continue
-        outgoing.setdefault(edge.source_node_id, []).append(edge.target_node_id)
-
-    pending = list(outgoing.get(start_node_id, []))
-    visited: set[str] = set()
-    reachable: list[Node] = []
-    while pending:
-        node_id = pending.pop()
-        if node_id in visited:
-            continue
-        visited.add(node_id)
-        node = nodes_by_id.get(node_id)
-        if node is not None:
-            reachable.append(node)
-        pending.extend(outgoing.get(node_id, []))
-    return reachable
-
-
-def _run_rules_on_graph(graph: Graph, *, risk_policy: RiskPolicy = "balanced") -> FindingsReport:
+def _run_rules_on_graph(
+    graph: Graph,
+    *,
+    risk_policy: RiskPolicy = "balanced",
+    store: GraphStore | None = None,
+) -> FindingsReport:
     findings: list[Finding] = []
     api_nodes = [n for n in graph.nodes if n.type == "API"]
     dependency_nodes = [n for n in graph.nodes if n.type == "Dependency"]
@@ -74,12 +61,8 @@ def _run_rules_on_graph(graph: Graph, *, risk_policy: RiskPolicy = "balanced") -
         test_node = test_nodes_by_id.get(edge.source_node_id)
         if test_node is not None and str(test_node.details.get("test_type")) in {"integration", "e2e"}:
             integration_covered_api_ids.add(edge.target_node_id)
-    reachable_by_api = {api.id: _reachable_architecture_nodes(graph, api.id) for api in api_nodes}
-    full_flow_api_ids = {
-        api_id
-        for api_id, reachable in reachable_by_api.items()
-        if _FULL_WRITE_FLOW_TYPES.issubset({node.type for node in reachable})
-    }
+    analysis = GraphAnalysis.from_graph(graph, store)
+    full_flow_api_ids = {api.id for api in api_nodes if analysis.reaches_all(api.id, _FULL_WRITE_FLOW_TYPES)}
 
     for api in api_nodes:
         if api.id not in covered_api_ids:
@@ -109,7 +92,7 @@ def _run_rules_on_graph(graph: Graph, *, risk_policy: RiskPolicy = "balanced") -
         if api.id not in full_flow_api_ids or api.id in integration_covered_api_ids:
             continue
         api_label = _api_display_label(api)
-        reachable = reachable_by_api[api.id]
+        reachable = analysis.flow_nodes(api.id)
         evidence_refs = list(dict.fromkeys([api.source_ref, *(node.source_ref for node in reachable)]))
         downstream_labels = ", ".join(
             f"{node.type}:{node.name}" for node in reachable if node.type in _FULL_WRITE_FLOW_TYPES
@@ -241,19 +224,20 @@ def _run_rules_on_graph(graph: Graph, *, risk_policy: RiskPolicy = "balanced") -
     return FindingsReport(findings=findings, generated_without_llm=True)
 
 
-def _run_signal_only_rules(signals: SignalBundle) -> list[Finding]:
+def _run_signal_only_rules(signals: SignalBundle, *, timings: dict[str, float] | None = None) -> list[Finding]:
+    signals_by_kind: dict[str, list[CapabilitySignal]] = {}
+    for signal in signals.signals:
+        signals_by_kind.setdefault(signal.kind, []).append(signal)
+
     findings: list[Finding] = []
-    findings.extend(_run_missing_required_side_effect_rule(signals))
-    findings.extend(_run_critical_write_missing_authz_rule(signals))
-    findings.extend(_run_write_contract_integrity_rule(signals))
-    findings.extend(_run_session_lifecycle_consistency_rule(signals))
-    findings.extend(_run_html_render_safety_rule(signals))
-    findings.extend(_run_ui_ergonomics_rule(signals))
-    findings.extend(_run_ui_journey_smoke_rule(signals))
-    findings.extend(_run_business_invariant_risk_rule(signals))
-    findings.extend(_run_generated_test_quality_rule(signals))
-    findings.extend(_run_workflow_automation_risk_rule(signals))
-    findings.extend(_run_pr_change_risk_rule(signals))
+    for rule in SIGNAL_RULES:
+        relevant = [signal for kind in rule.kinds for signal in signals_by_kind.get(kind, [])]
+        if not relevant:
+            continue
+        started = time.perf_counter()
+        findings.extend(rule.run(SignalBundle(signals=relevant, supported_kinds=signals.supported_kinds)))
+        if timings is not None:
+            timings[rule.name] = time.perf_counter() - started
     return findings
 
 
@@ -1505,9 +1489,60 @@ def _run_pr_change_risk_rule(signals: SignalBundle) -> list[Finding]:
     return findings
 
 
-def run_rules(graph: Graph | SignalBundle, *, risk_policy: RiskPolicy = "balanced") -> FindingsReport:
+@dataclass(frozen=True)
+class SignalRule:
+    """A signal-only rule and the signal kinds it reads; the engine hands it only signals of those kinds."""
+
+    name: str
+    kinds: tuple[SignalKind, ...]
+    run: Callable[[SignalBundle], list[Finding]]
+
+
+SIGNAL_RULES: tuple[SignalRule, ...] = (
+    SignalRule("missing_required_side_effect", ("side_effect_emit_contract",), _run_missing_required_side_effect_rule),
+    SignalRule(
+        "critical_write_missing_authz",
+        ("authorization_boundary_enforced", "http_write_surface"),
+        _run_critical_write_missing_authz_rule,
+    ),
+    SignalRule("write_contract_integrity", ("write_contract_integrity",), _run_write_contract_integrity_rule),
+    SignalRule(
+        "session_lifecycle_consistency",
+        ("session_lifecycle_consistency",),
+        _run_session_lifecycle_consistency_rule,
+    ),
+    SignalRule("html_render_safety", ("html_render_safety",), _run_html_render_safety_rule),
+    SignalRule("ui_ergonomics", ("ui_ergonomics",), _run_ui_ergonomics_rule),
+    SignalRule("ui_journey_smoke", ("ui_journey_smoke",), _run_ui_journey_smoke_rule),
+    SignalRule("business_invariant_risk", ("business_invariant_risk",), _run_business_invariant_risk_rule),
+    SignalRule("generated_test_quality", ("generated_test_quality",), _run_generated_test_quality_rule),
+    SignalRule("workflow_automation_risk", ("workflow_automation_risk",), _run_workflow_automation_risk_rule),
+    SignalRule("pr_change_risk", ("pr_change_risk",), _run_pr_change_risk_rule),
+)
+
+
+def run_rules(
+    graph: Graph | SignalBundle,
+    *,
+    signals: SignalBundle | None = None,
+    risk_policy: RiskPolicy = "balanced",
+    timings: dict[str, float] | None = None,
+    store: GraphStore | None = None,
+) -> FindingsReport:
+    """Run the graph rules and, when *signals* are given, the signal-only rules.
+
+    *store* is the ``GraphStore`` of *graph* when the caller already has one, so it is not built twice.
+    """
+
     if isinstance(graph, SignalBundle):
-        graph_findings = _run_rules_on_graph(build_graph(graph), risk_policy=risk_policy)
-        signal_findings = _run_signal_only_rules(graph)
-        return FindingsReport(findings=[*graph_findings.findings, *signal_findings], generated_without_llm=True)
-    return _run_rules_on_graph(graph, risk_policy=risk_policy)
+        signals = graph
+        graph = build_graph(signals)
+        store = None
+    started = time.perf_counter()
+    graph_findings = _run_rules_on_graph(graph, risk_policy=risk_policy, store=store)
+    if timings is not None:
+        timings["graph"] = time.perf_counter() - started
+    if signals is None:
+        return graph_findings
+    signal_findings = _run_signal_only_rules(signals, timings=timings)
+    return FindingsReport(findings=[*graph_findings.findings, *signal_findings], generated_without_llm=True)
@@ -15,6 +15,7 @@ FindingStatus = Literal["new", "resolved", "unchanged"]
 AnalysisEngine = Literal["deterministic", "hybrid", "ai_first"]
 CIMode = Literal["advisory", "soft", "block_new_critical"]
 SupportLevel = Literal["auto", "l0", "l1", "l2"]
+L0Depth = Literal[0, 1, 2]
 AppliedSupportLevel = Literal["l0", "l1", "l2"]
 RiskPolicy = Literal["conservative", "balanced", "aggressive"]
 CompetitiveMode = Literal["deterministic", "hybrid"]
@@ -260,6 +261,10 @@ class RunContext:
     ci_mode: CIMode = "advisory"
     support_level: SupportLevel = "auto"
     risk_policy: RiskPolicy = "balanced"
+    cache_dir: Path | None = None
+    jobs: int | None = None
+    multi_stack: bool = False
+    l0_depth: L0Depth = 2
 
 
 @dataclass
@@ -293,6 +298,8 @@ class RunMetrics:
     competitive_mode: CompetitiveMode
     analysis_scope: AnalysisScope
     duration_ms: int
+    skipped_files: dict[str, int] = field(default_factory=dict)
+    rule_duration_ms: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
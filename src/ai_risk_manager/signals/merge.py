@@ -8,7 +8,7 @@ from ai_risk_manager.signals.types import CapabilitySignal, SignalBundle, Signal
 CONFIDENCE_RANK: dict[Confidence, int] = {"low": 1, "medium": 2, "high": 3}
 
 
-def _signal_key(signal: CapabilitySignal) -> str:
+def signal_key(signal: CapabilitySignal) -> str:
     return "|".join(
         [
             signal.kind,
@@ -52,7 +52,7 @@ def merge_signal_bundles(*bundles: SignalBundle, min_confidence: Confidence = "l
         for signal in bundle.signals:
             if not _meets_min_confidence(signal.confidence, min_confidence):
                 continue
-            key = _signal_key(signal)
+            key = signal_key(signal)
             existing = merged.get(key)
             merged[key] = signal if existing is None else _merge_signal(existing, signal)
 
@@ -3,7 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from ai_risk_manager.collectors.plugins.base import StackId, StackProbeResult
+from ai_risk_manager.collectors.plugins.base import (
+    CollectorPlugin,
+    ObservingProbePlugin,
+    ProbeObserver,
+    StackId,
+    StackProbeResult,
+)
+from ai_risk_manager.collectors.probe_prefilter import run_probe_pass
+from ai_risk_manager.collectors.snapshot import RepoSnapshot, resolve_snapshot
 from ai_risk_manager.schemas.types import Confidence
 from ai_risk_manager.collectors.plugins.registry import list_plugins
 
@@ -20,27 +28,51 @@ class StackDetectionResult:
     confidence: Confidence
     reasons: list[str] = field(default_factory=list)
     probe_data: object | None = None
+    probes: list[StackProbeResult] = field(default_factory=list)
 
 
-def detect_stack(repo_path: Path) -> StackDetectionResult:
-    best_probe: StackProbeResult | None = None
+def detect_stack(repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> StackDetectionResult:
+    """Probe every registered plugin and keep the first probe with the highest confidence.
+
+    ``probes`` lists every passing probe, ranked by confidence and then registration order, so the first
+    entry is the selected stack.
+
+    Plugins that expose a probe observer are fed from one shared pass over the snapshot, so each candidate
+    file is opened and parsed at most once however many plugins are registered. Other plugins run their own
+    ``probe``.
+    """
+
+    snapshot = resolve_snapshot(repo_path, snapshot)
+    plugins: list[tuple[CollectorPlugin, ObservingProbePlugin | None, ProbeObserver | None]] = []
     for plugin in list_plugins():
-        probe = plugin.probe(repo_path)
-        if probe is None:
-            continue
-        if best_probe is None or _CONFIDENCE_RANK[probe.confidence] > _CONFIDENCE_RANK[best_probe.confidence]:
-            best_probe = probe
+        if isinstance(plugin, ObservingProbePlugin):
+            plugins.append((plugin, plugin, plugin.probe_observer(repo_path, snapshot=snapshot)))
+        else:
+            plugins.append((plugin, None, None))
+    run_probe_pass(snapshot, [observer for _, _, observer in plugins if observer is not None])
+
+    passing: list[StackProbeResult] = []
+    for plugin, observing, observer in plugins:
+        if observing is not None and observer is not None:
+            probe = observing.probe_from_observer(observer)
+        else:
+            probe = plugin.probe(repo_path, snapshot=snapshot)
+        if probe is not None:
+            passing.append(probe)
+    ranked = sorted(passing, key=lambda probe: -_CONFIDENCE_RANK[probe.confidence])
 
-    if best_probe is None:
+    if not ranked:
         return StackDetectionResult(
             stack_id="unknown",
             confidence="low",
             reasons=["No supported stack signals were detected."],
         )
 
+    best_probe = ranked[0]
     return StackDetectionResult(
         stack_id=best_probe.stack_id,
         confidence=best_probe.confidence,
         reasons=best_probe.reasons,
         probe_data=best_probe.probe_data,
+        probes=ranked,
     )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from ai_risk_manager.collectors.anchored_scan import AnchoredPattern, AnchorScanner
+from ai_risk_manager.collectors.plugins import express_artifacts, generated_test_artifacts
+from ai_risk_manager.pipeline import pr_change_signals
+
+_SCANS = sorted(
+    (f"{module.__name__.rsplit('.', 1)[-1]}.{name}", value)
+    for module in (express_artifacts, generated_test_artifacts, pr_change_signals)
+    for name, value in vars(module).items()
+    if isinstance(value, AnchoredPattern)
+)
+_FRAGMENTS = [
+    "router.post('/orders', createOrder)",
+    "app.Delete(\"/notes/:id\", remove)",
+    "adminRouter.patch(`/x`",
+    "9app.put('/y')",
+    "app.use('/api', (req, res, next) => { if (!req.header('x-api-key')) res.status(401) })",
+    "async function saveNote(id, input) {",
+    "function loadNotes() {",
+    "db.run(`INSERT INTO notes (title, body) VALUES (?, ?)`, [input.title, input.content])",
+    "db.run(`UPDATE notes SET updated_at = ? WHERE user_id = ?`, [input.updatedAt, userId])",
+    "const stamp = input.updatedAt;",
+    "input.tags.split('')",
+    "title: row.title,",
+    "note.isPinned",
+    "localStorage.setItem('sessionToken', t); localStorage.removeItem('session_token')",
+    "Math.round(words / 200)",
+    "(boost ? 1 : base + boost).toFixed(2)",
+    "note.dueDate < new Date().toISOString()",
+    "new  Date().toISOString() >= task.deadline",
+    "form.saveBtn.disabled = !(title || content)",
+    "list.innerHTML = `<li>${note.title}</li>`;",
+    ".app { min-width: 960px; }",
+    "queue.process('email', sendEmail)",
+    "program.command('sync')",
+    "eventBus.on('order.created', onCreated)",
+    "runJob('email') runCli('sync') emitEvent('order.created')",
+    "ſubscriber.on('x') Kconsumer.subscribe('y') İnput.a.split(\"\")",
+    "a.b.c.d.e.f.g.h",
+    "db.run(`INSERT x",
+    "x.innerHTML = a",
+    "a.disabled = x",
+    ".app {",
+    "it('saves a note', () => {",
+    "test(\"rejects\", async () => {",
+    "expect(res.status).toBe(400)",
+    "\n  });",
+    "\n})",
+    "raise HTTPException(",
+    "raise HTTPException(status_code=404, detail='missing')",
+    "if not order:\n    raise",
+    " ",
+    "\n",
+    ";",
+    "(",
+    ")",
+    "é",
+]
+
+
+@pytest.mark.parametrize(("name", "anchored"), _SCANS)
+def test_anchor_scanner_matches_finditer_for_collector_patterns(name: str, anchored: AnchoredPattern) -> None:
+    rng = random.Random(name)
+    for _ in range(40):
+        text = "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        scanner = AnchorScanner(text)
+        expected = [(match.span(), match.groupdict()) for match in anchored.pattern.finditer(text)]
+        assert [(match.span(), match.groupdict()) for match in scanner.finditer(anchored)] == expected, text
+
+
+def test_anchor_scanner_skips_patterns_without_anchors_or_required_literals() -> None:
+    calls: list[int] = []
+
+    class CountingPattern:
+        flags = re.IGNORECASE
+
+        def match(self, text: str, position: int) -> None:
+            calls.append(position)
+
+        def finditer(self, text: str) -> list[re.Match[str]]:
+            calls.append(-1)
+            return []
+
+    scanner = AnchorScanner("const x = 1;\nqueue.size();\n")
+    assert list(scanner.finditer(AnchoredPattern(CountingPattern(), ("db.run(",)))) == []  # type: ignore[arg-type]
+    assert list(scanner.finditer(AnchoredPattern(CountingPattern(), required=("row.",)))) == []  # type: ignore[arg-type]
+    assert calls == []
+
+    assert list(scanner.finditer(AnchoredPattern(CountingPattern(), ("queue.",)))) == []  # type: ignore[arg-type]
+    assert calls == [scanner.text.index("queue.")]
+    assert scanner.positions("queue.", ignore_case=True) == [13]
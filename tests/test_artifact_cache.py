@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ai_risk_manager.collectors import parse_cache
+from ai_risk_manager.collectors.artifact_cache import (
+    ARTIFACT_CACHE_FILENAME,
+    ArtifactCache,
+    cached_file_payload,
+)
+from ai_risk_manager.collectors.plugins.base import DataStoreWriteArtifact
+from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
+from ai_risk_manager.collectors.plugins.django_artifacts import collect_django_artifacts
+from ai_risk_manager.collectors.plugins.express_artifacts import collect_express_artifacts
+from ai_risk_manager.collectors.plugins.fastapi_artifacts import collect_fastapi_artifacts
+from ai_risk_manager.collectors.snapshot import build_repo_snapshot
+
+_CODECS = {"rows": None, "writes": DataStoreWriteArtifact}
+_EVAL_REPOS = Path(__file__).resolve().parents[1] / "eval" / "repos"
+
+
+def _write_payload() -> dict[str, list[object]]:
+    return {
+        "rows": [("app/api.py", "create_order", 3, "snippet", {"field": "status"})],
+        "writes": [DataStoreWriteArtifact("app/api.py", "create_order", "db", "add", 4, "db.add(order)")],
+    }
+
+
+def test_artifact_cache_round_trips_rows_and_dataclasses(tmp_path: Path) -> None:
+    cache = ArtifactCache.load(tmp_path / "cache")
+    computed = cached_file_payload(
+        cache,
+        namespace="test",
+        collector_version="1",
+        relative_path="app/api.py",
+        blob_id="abc",
+        codecs=_CODECS,
+        compute=_write_payload,
+    )
+    cache.save()
+
+    reloaded = ArtifactCache.load(tmp_path / "cache")
+    cached = cached_file_payload(
+        reloaded,
+        namespace="test",
+        collector_version="1",
+        relative_path="app/api.py",
+        blob_id="abc",
+        codecs=_CODECS,
+        compute=lambda: pytest.fail("cached payload should be reused"),
+    )
+
+    assert cached == computed
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_artifact_cache_key_changes_with_content_and_collector_version(tmp_path: Path) -> None:
+    cache = ArtifactCache.load(tmp_path)
+    for blob_id, version in [("abc", "1"), ("def", "1"), ("abc", "2")]:
+        cached_file_payload(
+            cache,
+            namespace="test",
+            collector_version=version,
+            relative_path="app/api.py",
+            blob_id=blob_id,
+            codecs=_CODECS,
+            compute=_write_payload,
+        )
+
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+@pytest.mark.parametrize("content", [b"not gzip", gzip.compress(b"{not json"), gzip.compress(b'{"format_version": 99}')])
+def test_artifact_cache_recovers_from_corrupt_index(tmp_path: Path, content: bytes) -> None:
+    (tmp_path / ARTIFACT_CACHE_FILENAME).write_bytes(content)
+
+    cache = ArtifactCache.load(tmp_path)
+
+    assert len(cache) == 0
+    assert cache.load_error is not None
+    cache.save()
+    assert ArtifactCache.load(tmp_path).load_error is None
+
+
+def _lookup(cache: ArtifactCache, name: str) -> None:
+    cached_file_payload(
+        cache,
+        namespace="test",
+        collector_version="1",
+        relative_path=f"{name}.py",
+        blob_id=name,
+        codecs=_CODECS,
+        compute=_write_payload,
+    )
+
+
+def test_artifact_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    first = ArtifactCache.load(tmp_path)
+    _lookup(first, "old")
+    _lookup(first, "kept")
+    first.save()
+
+    second = ArtifactCache.load(tmp_path)
+    _lookup(second, "kept")
+    second.max_bytes = len(gzip.decompress((tmp_path / ARTIFACT_CACHE_FILENAME).read_bytes())) // 2
+    second.save()
+
+    third = ArtifactCache.load(tmp_path)
+    _lookup(third, "kept")
+    assert len(third) == 1
+    assert third.hits == 1
+
+
+@pytest.mark.parametrize(
+    ("sample", "collect"),
+    [
+        ("milestone22_fastapi_graph_flow_gap", collect_fastapi_artifacts),
+        ("milestone7_django_viewset", collect_django_artifacts),
+        ("milestone14_express_ui_gap", collect_express_artifacts),
+    ],
+)
+def test_warm_artifact_cache_reproduces_cold_collection(tmp_path: Path, sample: str, collect) -> None:
+    repo_path = _EVAL_REPOS / sample
+    expected = collect(repo_path)
+
+    cold_snapshot = build_repo_snapshot(repo_path)
+    cold_snapshot.artifact_cache = ArtifactCache.load(tmp_path)
+    assert collect(repo_path, snapshot=cold_snapshot) == expected
+    cold_snapshot.artifact_cache.save()
+
+    warm_snapshot = build_repo_snapshot(repo_path)
+    warm_snapshot.artifact_cache = ArtifactCache.load(tmp_path)
+    assert collect(repo_path, snapshot=warm_snapshot) == expected
+    assert warm_snapshot.artifact_cache.misses == 0
+    assert warm_snapshot.artifact_cache.hits > 0
+
+
+def test_warm_artifact_cache_does_not_read_clean_tracked_files(tmp_path: Path, write_file) -> None:
+    repo_path = tmp_path / "repo"
+    write_file(
+        repo_path / "app" / "api.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return 1\n",
+    )
+    write_file(repo_path / "app" / "draft.py", "from fastapi import APIRouter\n")
+    git = ["git", "-C", str(repo_path), "-c", "user.name=riskmap", "-c", "user.email=riskmap@example.com"]
+    subprocess.run(["git", "init", "-q", str(repo_path)], check=True)
+    subprocess.run([*git, "add", "app/api.py"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+
+    def collect() -> ArtifactCache:
+        snapshot = build_repo_snapshot(repo_path)
+        snapshot.artifact_cache = ArtifactCache.load(tmp_path / "cache")
+        collect_fastapi_artifacts(repo_path, snapshot=snapshot)
+        snapshot.artifact_cache.save()
+        return snapshot.artifact_cache
+
+    collect()
+    parse_cache.clear_parse_cache()
+    with patch("ai_risk_manager.collectors.parse_cache._read_source", wraps=parse_cache._read_source) as read_mock:
+        cache = collect()
+
+    assert cache.misses == 0
+    # The untracked file is read to hash it; the clean tracked one is served from its index object ID.
+    assert [call.args[0].name for call in read_mock.call_args_list] == ["draft.py"]
+
+
+def test_django_urls_edit_reextracts_only_files_routed_through_it(tmp_path: Path, write_file) -> None:
+    repo_path = tmp_path / "repo"
+    views = (
+        "from rest_framework.decorators import api_view\n\n"
+        "@api_view(['POST'])\n"
+        "def {name}(request):\n"
+        "    return None\n"
+    )
+    write_file(repo_path / "app" / "orders.py", views.format(name="create_order"))
+    write_file(repo_path / "app" / "refunds.py", views.format(name="create_refund"))
+    write_file(repo_path / "tests" / "test_orders.py", "def test_create(client):\n    client.post('/orders')\n")
+    urls = (
+        "from django.urls import path\n"
+        "from app.orders import create_order\n"
+        "from app.refunds import create_refund\n\n"
+        "urlpatterns = [path('{orders}', create_order), path('refunds', create_refund, name='refunds')]\n"
+    )
+    write_file(repo_path / "app" / "urls.py", urls.format(orders="orders"))
+
+    def collect() -> tuple[ArtifactCache, list[tuple[str, str, str, str, int, str]]]:
+        snapshot = build_repo_snapshot(repo_path)
+        snapshot.artifact_cache = ArtifactCache.load(tmp_path / "cache")
+        bundle = collect_django_artifacts(repo_path, snapshot=snapshot)
+        snapshot.artifact_cache.save()
+        return snapshot.artifact_cache, bundle.write_endpoints
+
+    collect()
+    write_file(repo_path / "app" / "urls.py", urls.format(orders="v2/orders"))
+    cache, endpoints = collect()
+
+    assert sorted(row[3] for row in endpoints) == ["/refunds", "/v2/orders"]
+    # urls.py misses twice (facts and routed rows); orders.py misses once because its route moved.
+    assert cache.misses == 3
+
+
+def test_dependency_manifests_are_cached_by_content(tmp_path: Path, write_file) -> None:
+    repo_path = tmp_path / "repo"
+    write_file(repo_path / "package.json", '{"dependencies": {"express": "^4.19.0"}}\n')
+    write_file(repo_path / "requirements.txt", "fastapi==0.110.0\n")
+
+    def extract() -> tuple[ArtifactCache, list[tuple[object, ...]]]:
+        snapshot = build_repo_snapshot(repo_path)
+        snapshot.artifact_cache = ArtifactCache.load(tmp_path / "cache")
+        rows = extract_dependency_specs(repo_path, snapshot.catalog.requirements_files, snapshot=snapshot)
+        snapshot.artifact_cache.save()
+        return snapshot.artifact_cache, rows
+
+    _, cold_rows = extract()
+    write_file(repo_path / "requirements.txt", "fastapi>=0.110.0\n")
+    cache, warm_rows = extract()
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert warm_rows[1] == cold_rows[1]
+    assert warm_rows[0][1:5] == ("fastapi", ">=0.110.0", 1, "range_not_pinned")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ai_risk_manager.collectors.plugins import universal_artifacts
+from ai_risk_manager.collectors.plugins.dependency_artifacts import extract_dependency_specs
 from ai_risk_manager.collectors.plugins.registry import get_plugin_for_stack, get_signal_plugin_for_stack
 
 
@@ -786,6 +788,28 @@ def test_fastapi_plugin_collects_project_dependencies_from_pyproject(tmp_path: P
     assert ("uvicorn", None, "runtime") in violations
 
 
+def test_dependency_specs_report_first_line_of_each_manifest_entry(tmp_path: Path, write_file) -> None:
+    write_file(
+        tmp_path / "package.json",
+        '{\n  "name": "demo",\n  "dependencies": {\n    "express": "^4.19.0",\n    "lodash": "4.17.21"\n  },\n'
+        '  "devDependencies": {\n    "jest": "*"\n  }\n}\n',
+    )
+    write_file(
+        tmp_path / "pyproject.toml",
+        "[project]\nname = 'demo'\ndependencies = [\n  'httpx>=0.27',\n  'uvicorn==0.30.0',\n]\n",
+    )
+
+    rows = extract_dependency_specs(tmp_path, [])
+
+    assert [(name, line) for _, name, _, line, _, _ in rows] == [
+        ("httpx", 4),
+        ("uvicorn", 5),
+        ("express", 4),
+        ("lodash", 5),
+        ("jest", 8),
+    ]
+
+
 def test_fastapi_plugin_marks_dev_dependency_scope_from_optional_group(tmp_path: Path, write_file) -> None:
     write_file(
         tmp_path / "app" / "api.py",
@@ -1060,3 +1084,35 @@ def test_django_plugin_ignores_create_default_outside_uniqueness_logic(tmp_path:
     bundle = plugin.collect(tmp_path)
 
     assert not any(issue[1] == "unique_constraint_constant_create_default" for issue in bundle.write_contract_issues)
+
+
+def test_universal_collector_escalates_tiers_only_for_candidate_test_files(
+    tmp_path: Path, write_file, monkeypatch
+) -> None:
+    write_file(
+        tmp_path / "tests" / "test_orders.py",
+        "def test_create_order(client):\n    client.post('/orders', json={})\n",
+    )
+    write_file(tmp_path / "tests" / "test_math.py", "def test_sum():\n    assert 1 + 1 == 2\n")
+    write_file(
+        tmp_path / "tests" / "orders.test.js",
+        "it('creates order', async () => {\n  await request(app).post('/orders');\n});\n",
+    )
+    observed: list[str] = []
+    original = universal_artifacts.observe_python_test_quality
+
+    def spy(tree, source_lines, **kwargs):
+        observed.append(source_lines[0])
+        return original(tree, source_lines, **kwargs)
+
+    monkeypatch.setattr(universal_artifacts, "observe_python_test_quality", spy)
+
+    def issue_tests(depth: int) -> set[str]:
+        bundle = universal_artifacts.collect_universal_artifacts(tmp_path, depth=depth)
+        return {row[2] for row in bundle.generated_test_issues}
+
+    assert issue_tests(0) == set()
+    assert issue_tests(1) == {"creates order"}
+    assert observed == []
+    assert issue_tests(2) == {"creates order", "test_create_order"}
+    assert observed == ["def test_create_order(client):"]
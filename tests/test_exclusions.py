@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+
+import pytest
+
+from ai_risk_manager.collectors.exclusions import ExclusionRules, load_exclusion_rules, parse_exclusion_settings
+from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.snapshot import build_repo_snapshot
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "excluded"),
+    [
+        ("*.min.js", "web/static/app.min.js", True),
+        ("*.min.js", "web/static/app.js", False),
+        ("**/generated/**", "api/generated/models.py", True),
+        ("**/generated/**", "generated/models.py", True),
+        ("**/generated/**", "api/generated.py", False),
+        ("openapi_client/**", "openapi_client/api/users.py", True),
+        ("openapi_client/**", "vendor/openapi_client/api.py", False),
+        ("openapi_client", "vendor/openapi_client/api.py", True),
+        ("/build.py", "build.py", True),
+        ("/build.py", "tools/build.py", False),
+        ("fixtures/", "tests/fixtures/data.py", True),
+        ("fixtures/", "tests/fixtures", False),
+        ("schema_v?.sql", "db/schema_v2.sql", True),
+        ("schema_v[!0-9].sql", "db/schema_v2.sql", False),
+        ("!keep.py", "keep.py", False),
+    ],
+)
+def test_exclusion_globs_follow_gitignore_semantics(pattern: str, path: str, excluded: bool) -> None:
+    assert ExclusionRules(patterns=(pattern,)).excludes(path) is excluded
+
+
+def test_parse_exclusion_settings_reads_block_and_inline_lists() -> None:
+    rules = parse_exclusion_settings(
+        "critical_flows:\n"
+        "  - id: checkout\n"
+        "    match: [checkout]\n"
+        "exclude:\n"
+        "  - \"**/generated/**\"  # client code\n"
+        "  - '*.min.js'\n"
+        "exclude_generated: false\n"
+    )
+    assert rules.patterns == ("**/generated/**", "*.min.js")
+    assert rules.skip_generated is False
+
+    inline = parse_exclusion_settings("exclude: [openapi_client/**, '*.pb.py']\n")
+    assert inline.patterns == ("openapi_client/**", "*.pb.py")
+    assert inline.skip_generated is False
+    assert parse_exclusion_settings("exclude_generated: true\n").skip_generated is True
+
+
+@pytest.mark.parametrize("use_git", [False, True])
+def test_discovery_applies_repo_owned_exclusions(tmp_path: Path, write_file, use_git: bool) -> None:
+    write_file(tmp_path / ".riskmap.yml", "exclude:\n  - 'openapi_client/**'\n  - '*.min.js'\n")
+    write_file(tmp_path / "app" / "main.py", "print('owned')\n")
+    write_file(tmp_path / "openapi_client" / "api.py", "print('generated')\n")
+    write_file(tmp_path / "web" / "app.min.js", "var a=1;\n")
+    write_file(tmp_path / "web" / "app.js", "const a = 1;\n")
+    if use_git:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+
+    discovered = {path.relative_to(tmp_path).as_posix() for path in iter_project_files(tmp_path)}
+
+    assert discovered == {".riskmap.yml", "app/main.py", "web/app.js"}
+    assert load_exclusion_rules(tmp_path / "app") == ExclusionRules()
+
+
+def test_snapshot_skips_generated_and_minified_sources_only_when_enabled(tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "client" / "models.py", "# Code generated by openapi-generator. DO NOT EDIT.\nA = 1\n")
+    write_file(tmp_path / "web" / "bundle.js", "var a=1;" * 1000 + "\n")
+    write_file(tmp_path / "app" / "main.py", "# Routes for the public API.\nB = 2\n")
+    write_file(tmp_path / "app" / "settings.py", "# Auto-generated defaults; do not edit by hand.\nC = 3\n")
+
+    default = build_repo_snapshot(tmp_path)
+    assert default.read_text(tmp_path / "client" / "models.py").startswith("# Code generated")
+    assert default.skipped == {}
+
+    write_file(tmp_path / ".riskmap.yml", "exclude_generated: true\n")
+    snapshot = build_repo_snapshot(tmp_path)
+
+    assert snapshot.read_text(tmp_path / "client" / "models.py") == ""
+    assert snapshot.parse_python(tmp_path / "client" / "models.py") is None
+    assert snapshot.read_text(tmp_path / "web" / "bundle.js") == ""
+    assert snapshot.read_text(tmp_path / "app" / "main.py") == "# Routes for the public API.\nB = 2\n"
+    assert snapshot.read_text(tmp_path / "app" / "settings.py").startswith("# Auto-generated")
+    assert {snapshot.relative(path): reason for path, reason in snapshot.skipped.items()} == {
+        "client/models.py": "generated",
+        "web/bundle.js": "minified",
+    }
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_risk_manager.collectors.anchored_scan import AnchorScanner
+from ai_risk_manager.collectors.parse_cache import load_source
+from ai_risk_manager.collectors.plugins.express_artifacts import (
+    _extract_file_payload,
+    _indexed_functions,
+    _LiteralSpans,
+    _owner_for_offset,
+)
+
+
+def test_literal_spans_cover_comments_and_strings_only() -> None:
+    text = "// app.post('/a')\nconst s = \"it's // not a comment\"; /* b */ run(`x ${y}`);\n"
+    spans = _LiteralSpans(text)
+
+    assert spans.covers(text.index("app.post"))
+    assert spans.covers(text.index("not a comment"))
+    assert spans.covers(text.index("x ${y}"))
+    assert not spans.covers(text.index("const"))
+    assert not spans.covers(text.index("run("))
+    assert not spans.covers(len(text) - 1)
+
+
+def test_owner_lookup_covers_arrow_bindings_and_class_methods() -> None:
+    text = (
+        "const db = open();\n"
+        "async function save(req, res) {\n"
+        "  return 1;\n"
+        "}\n"
+        "const pick = async (id, user) => id;\n"
+        "// function commented(x) {\n"
+        "class Store {\n"
+        "  update(id): void { return; }\n"
+        "}\n"
+        "if (ready) { go(); }\n"
+    )
+    functions = _indexed_functions(AnchorScanner(text), lambda: _LiteralSpans(text))
+
+    assert [name for _start, name, _params in functions] == ["save", "pick", "update"]
+    assert _owner_for_offset(functions, text.index("return 1")) == ("save", {"req", "res"})
+    assert _owner_for_offset(functions, text.index("id;")) == ("pick", {"id", "user"})
+    assert _owner_for_offset(functions, text.index("return;")) == ("update", {"id"})
+    assert _owner_for_offset(functions, text.index("open")) == ("module_scope", set())
+
+
+def test_express_extraction_ignores_routes_and_tests_in_comments_and_strings(tmp_path: Path, write_file) -> None:
+    write_file(
+        tmp_path / "src" / "app.js",
+        "// router.post('/old', legacyHandler)\n"
+        "const doc = \"app.delete('/doc')\";\n"
+        "router.post('/orders', createOrder);\n",
+    )
+    write_file(
+        tmp_path / "test" / "orders.test.js",
+        "/* it('skipped', () => request(app).post('/skip')) */\n"
+        "it('creates order', async () => {\n"
+        "  await request(app).post('/orders');\n"
+        "});\n",
+    )
+
+    app_path = tmp_path / "src" / "app.js"
+    app_payload = _extract_file_payload(app_path, tmp_path, load_source(app_path))
+    assert [(row[2], row[3], row[4]) for row in app_payload["write_endpoints"]] == [("POST", "/orders", 3)]
+
+    test_path = tmp_path / "test" / "orders.test.js"
+    test_payload = _extract_file_payload(test_path, tmp_path, load_source(test_path))
+    assert [row[1:3] for row in test_payload["test_cases"]] == [("creates order", 2)]
+    assert [row[1:5] for row in test_payload["test_http_calls"]] == [("creates order", "POST", "/orders", 3)]
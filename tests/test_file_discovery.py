@@ -3,7 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 import subprocess
 
-from ai_risk_manager.collectors.file_discovery import iter_project_files
+from ai_risk_manager.collectors.file_discovery import iter_project_file_stats, iter_project_files
+from ai_risk_manager.collectors.parse_cache import git_blob_id
+from ai_risk_manager.collectors.snapshot import build_repo_snapshot, resolve_snapshot
 
 
 def _relative_paths(repo_path: Path) -> set[str]:
@@ -49,3 +51,96 @@ def test_file_discovery_preserves_relative_repo_path_style(tmp_path: Path, write
 
     assert discovered == [Path("service/api.py")]
     assert _relative_paths(Path(".")) == {"service/api.py"}
+
+
+def _git(repo_path: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo_path), "-c", "user.name=riskmap", "-c", "user.email=riskmap@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_git_discovery_keys_clean_tracked_files_by_index_object_id(tmp_path: Path, write_file) -> None:
+    repo_path = tmp_path / "repo"
+    write_file(repo_path / "service" / "clean.py", "CLEAN = 1\n")
+    write_file(repo_path / "service" / "edited.py", "EDITED = 1\n")
+    write_file(repo_path / "service" / "removed.py", "REMOVED = 1\n")
+    write_file(repo_path / "top.py", "TOP = 1\n")
+    subprocess.run(["git", "init", "-q", str(repo_path)], check=True)
+    _git(repo_path, "add", ".")
+    _git(repo_path, "commit", "-q", "-m", "init")
+    write_file(repo_path / "service" / "edited.py", "EDITED = 2\n")
+    write_file(repo_path / "service" / "untracked.py", "NEW = 1\n")
+    (repo_path / "service" / "removed.py").unlink()
+
+    discovered = {path.relative_to(repo_path).as_posix(): stat for path, stat in iter_project_file_stats(repo_path)}
+
+    assert sorted(discovered) == ["service/clean.py", "service/edited.py", "service/untracked.py", "top.py"]
+    clean = discovered["service/clean.py"]
+    assert clean.blob_id == git_blob_id(b"CLEAN = 1\n")
+    assert clean.size is None and clean.mtime_ns is None
+    assert discovered["service/edited.py"].blob_id == ""
+    assert discovered["service/edited.py"].size == len("EDITED = 2\n")
+    assert discovered["service/untracked.py"].size == len("NEW = 1\n")
+
+    snapshot = build_repo_snapshot(repo_path / "service")
+    assert [snapshot.relative(path) for path in snapshot.files] == ["clean.py", "edited.py", "untracked.py"]
+    clean_path = repo_path / "service" / "clean.py"
+    assert snapshot.read_text(clean_path) == "CLEAN = 1\n"
+    assert snapshot.blob_id(clean_path) == clean.blob_id
+    assert snapshot.blob_id(repo_path / "service" / "edited.py") == git_blob_id(b"EDITED = 2\n")
+
+
+def test_repo_snapshot_indexes_files_by_suffix_and_stat(tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "app" / "main.py", "print('owned')\n")
+    write_file(tmp_path / "web" / "App.TSX", "export const App = () => null;\n")
+    write_file(tmp_path / "web" / "routes.js", "module.exports = {};\n")
+
+    snapshot = build_repo_snapshot(tmp_path)
+
+    assert [snapshot.relative(path) for path in snapshot.files] == ["app/main.py", "web/App.TSX", "web/routes.js"]
+    assert [snapshot.relative(path) for path in snapshot.files_with_suffix(".js", ".tsx")] == [
+        "web/App.TSX",
+        "web/routes.js",
+    ]
+    main_py = tmp_path / "app" / "main.py"
+    file_stat = snapshot.stat(main_py)
+    assert file_stat is not None
+    assert file_stat.size == len("print('owned')\n")
+    assert snapshot.read_text(main_py) == "print('owned')\n"
+
+
+def test_resolve_snapshot_reuses_matching_repo_only(tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "repo" / "api.py", "print('owned')\n")
+    write_file(tmp_path / "other" / "api.py", "print('other')\n")
+    snapshot = build_repo_snapshot(tmp_path / "repo")
+
+    assert resolve_snapshot(tmp_path / "repo", snapshot) is snapshot
+    assert resolve_snapshot(tmp_path / "other", snapshot).repo_path == tmp_path / "other"
+
+
+def test_repo_snapshot_catalog_buckets_files_by_name_and_role(tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "app" / "api.py", "API = 1\n")
+    write_file(tmp_path / "app" / "urls.py", "urlpatterns = []\n")
+    write_file(tmp_path / "tests" / "conftest.py", "import pytest\n")
+    write_file(tmp_path / "tests" / "test_api.py", "def test_api():\n    pass\n")
+    write_file(tmp_path / "web" / "cart.spec.ts", "it('works', () => {});\n")
+    write_file(tmp_path / ".github" / "workflows" / "ci.yml", "on: push\n")
+    write_file(tmp_path / "requirements-dev.txt", "pytest==8.0.0\n")
+    write_file(tmp_path / "notes.txt", "not a manifest\n")
+
+    catalog = build_repo_snapshot(tmp_path).catalog
+
+    def relative(paths: list[Path]) -> list[str]:
+        return [path.relative_to(tmp_path).as_posix() for path in paths]
+
+    assert relative(catalog.named("urls.py", "conftest.py")) == ["app/urls.py", "tests/conftest.py"]
+    assert relative(catalog.python_test_files) == ["tests/test_api.py"]
+    assert relative(catalog.test_files) == ["tests/conftest.py", "tests/test_api.py", "web/cart.spec.ts"]
+    assert relative(catalog.workflow_files) == [".github/workflows/ci.yml"]
+    assert relative(catalog.requirements_files) == ["requirements-dev.txt"]
+    assert catalog.is_python_test_file(tmp_path / "tests" / "test_api.py")
+    assert not catalog.is_python_test_file(tmp_path / "tests" / "conftest.py")
+    assert tmp_path / "app" / "api.py" in catalog
+    assert tmp_path / "missing.py" not in catalog
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from ai_risk_manager.graph.analysis import GraphAnalysis
+from ai_risk_manager.graph.builder import GraphBuilder
+from ai_risk_manager.graph.store import GraphStore
+from ai_risk_manager.schemas.types import Edge, Graph, Node
+from ai_risk_manager.signals.types import SignalBundle
+
+
+def _node(node_id: str, node_type: str, name: str = "") -> Node:
+    return Node(id=node_id, type=node_type, name=name or node_id, layer="domain", source_ref="app.py")
+
+
+def _edge(source: str, target: str, edge_type: str) -> Edge:
+    return Edge(
+        id=f"{source}->{target}",
+        source_node_id=source,
+        target_node_id=target,
+        type=edge_type,
+        source_ref="app.py",
+        evidence="",
+    )
+
+
+def test_graph_store_interns_ids_and_lists_edges_in_graph_order() -> None:
+    graph = Graph(
+        nodes=[_node("api", "API"), _node("store", "DataStore"), _node("test", "TestCase"), _node("api", "API", "late")],
+        edges=[
+            _edge("test", "api", "covered_by"),
+            _edge("api", "store", "writes"),
+            _edge("api", "ghost", "triggers"),
+            _edge("store", "api", "triggers"),
+        ],
+    )
+    store = GraphStore.from_graph(graph)
+
+    assert store.ids == ["api", "store", "test", "ghost"]
+    assert graph.nodes[store.node_positions[0]].name == "late"
+    assert store.node_positions[3] == -1
+    assert store.type_names[store.node_types[1]] == "DataStore"
+    assert store.successors(0) == [1, 3]
+    assert store.successors(2, skip_edge_type=store.type_code("covered_by")) == []
+    assert sorted(store.neighbours(0)) == [1, 1, 2, 3]
+    assert store.type_code("validated_by") == -1
+
+
+def test_graph_analysis_summarizes_flow_types_through_cycles_but_not_coverage() -> None:
+    graph = Graph(
+        nodes=[
+            _node("api", "API"),
+            _node("transition", "Transition"),
+            _node("entity", "Entity"),
+            _node("store", "DataStore"),
+            _node("test", "TestCase"),
+        ],
+        edges=[
+            _edge("api", "transition", "triggers"),
+            _edge("transition", "entity", "validated_by"),
+            _edge("entity", "transition", "triggers"),
+            _edge("entity", "store", "writes"),
+            _edge("store", "test", "covered_by"),
+        ],
+    )
+    analysis = GraphAnalysis.from_graph(graph)
+
+    assert analysis.flow_types("api") == {"Transition", "Entity", "DataStore"}
+    assert analysis.flow_types("transition") == {"Transition", "Entity", "DataStore"}
+    assert analysis.flow_types("store") == set()
+    assert analysis.reaches_all("api", {"Entity", "DataStore"})
+    assert not analysis.reaches_all("api", {"Entity", "ExternalSystem"})
+    assert [node.id for node in analysis.flow_nodes("api")] == ["transition", "entity", "store"]
+
+
+def test_graph_builder_shares_one_store_per_graph() -> None:
+    builder = GraphBuilder(SignalBundle(signals=[]))
+    store = builder.store()
+
+    assert builder.store() is store
+    assert GraphAnalysis.from_graph(builder.graph(), store).store is store
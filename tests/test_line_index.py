@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import random
+
+from ai_risk_manager.collectors.line_index import LineIndex
+from ai_risk_manager.collectors.parse_cache import ParsedSource
+
+
+def test_line_index_matches_newline_counting() -> None:
+    rng = random.Random(7)
+    text = "".join(rng.choice(["a", "b", " ", "\n", "\r\n", "é"]) for _ in range(2000))
+    index = LineIndex(text)
+
+    assert len(index) == text.count("\n") + 1
+    for offset in [0, 1, len(text) - 1, len(text), *rng.sample(range(len(text)), 200)]:
+        assert index.line_of(offset) == text.count("\n", 0, offset) + 1
+
+
+def test_parsed_source_builds_its_line_index_once() -> None:
+    text = "router.post('/a')\n\nrouter.put('/b')\n"
+    source = ParsedSource(text=text, lines=text.splitlines())
+
+    assert source.line_index.line_of(0) == 1
+    assert source.line_index.line_of(text.index("router.put")) == 3
+    assert source.line_index is source.line_index
+    assert ParsedSource(text="", lines=[]).line_index.line_of(0) == 1
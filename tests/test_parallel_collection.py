@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ai_risk_manager.collectors import parallel
+from ai_risk_manager.collectors.parallel import resolve_jobs
+from ai_risk_manager.collectors.plugins.django_artifacts import collect_django_artifacts
+from ai_risk_manager.collectors.plugins.express_artifacts import collect_express_artifacts
+from ai_risk_manager.collectors.plugins.fastapi_artifacts import collect_fastapi_artifacts
+from ai_risk_manager.collectors.snapshot import build_repo_snapshot
+
+_EVAL_REPOS = Path(__file__).resolve().parents[1] / "eval" / "repos"
+
+
+def test_resolve_jobs_reads_environment_and_cpu_count(monkeypatch) -> None:
+    monkeypatch.delenv("AIRISK_JOBS", raising=False)
+    assert resolve_jobs() == 1
+    monkeypatch.setenv("AIRISK_JOBS", "3")
+    assert resolve_jobs() == 3
+    assert resolve_jobs(2) == 2
+    monkeypatch.setenv("AIRISK_JOBS", "many")
+    assert resolve_jobs() == 1
+    assert resolve_jobs(0) >= 1
+    assert resolve_jobs(-4) == 1
+
+
+@pytest.mark.parametrize(
+    ("sample", "collect"),
+    [
+        ("milestone22_fastapi_graph_flow_gap", collect_fastapi_artifacts),
+        ("milestone7_django_viewset", collect_django_artifacts),
+        ("milestone14_express_ui_gap", collect_express_artifacts),
+    ],
+)
+def test_parallel_collection_matches_serial_output(monkeypatch, sample: str, collect) -> None:
+    repo_path = _EVAL_REPOS / sample
+    serial = collect(repo_path)
+
+    monkeypatch.setattr(parallel, "_MIN_PARALLEL_TASKS", 1)
+    snapshot = build_repo_snapshot(repo_path)
+    snapshot.jobs = 2
+
+    assert collect(repo_path, snapshot=snapshot) == serial
+
+
+def test_merge_artifact_bundles_dedupes_only_repository_level_rows_across_bundles() -> None:
+    from ai_risk_manager.collectors.plugins.base import ArtifactBundle, merge_artifact_bundles
+
+    shared = Path("README.md")
+    spec = ("requirements.txt", "fastapi", "", 1, "unpinned_version", "runtime")
+    route = ("api.py", "create_order", "POST", "/orders", 3, "")
+    first = ArtifactBundle(
+        all_files=[shared, Path("api.py")],
+        dependency_specs=[spec, spec],
+        write_endpoints=[route, route],
+        pydantic_models=[("api.py", "Order")],
+    )
+    second = ArtifactBundle(
+        all_files=[shared, Path("server.js")],
+        dependency_specs=[spec],
+        pydantic_models=[("api.py", "Order")],
+    )
+
+    merged = merge_artifact_bundles(first, second)
+    assert merged.all_files == [shared, Path("api.py"), Path("server.js")]
+    assert merged.dependency_specs == [spec, spec]
+    assert merged.write_endpoints == [route, route]
+    assert merged.pydantic_models == [("api.py", "Order"), ("api.py", "Order")]
+    assert merge_artifact_bundles(first) == first
+
+
+def test_shared_process_pool_is_scoped_to_the_snapshot() -> None:
+    snapshot = build_repo_snapshot(_EVAL_REPOS / "milestone7_django_viewset")
+    with parallel.shared_process_pool(snapshot):
+        assert snapshot.process_pool is None
+
+    snapshot.jobs = 2
+    with parallel.shared_process_pool(snapshot):
+        pool = snapshot.process_pool
+        assert pool is not None
+        with parallel.shared_process_pool(snapshot):
+            assert snapshot.process_pool is pool
+    assert snapshot.process_pool is None
+
+
+def test_small_batches_go_to_a_running_shared_pool() -> None:
+    class RecordingPool:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def map(self, fn, items, chunksize: int = 1):
+            self.batches.append(list(items))
+            return map(fn, self.batches[-1])
+
+    pool = RecordingPool()
+
+    assert parallel._run_tasks(len, ["a", "bb"], 2) == [1, 2]
+    assert parallel._run_tasks(len, ["a", "bb"], 2, pool) == [1, 2]
+    assert parallel._run_tasks(len, [], 2, pool) == []
+    assert pool.batches == [["a", "bb"]]
+
+
+def test_file_over_cpu_budget_is_skipped_with_timeout_reason(monkeypatch, tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "package.json", '{"dependencies": {"express": "^4.18.0"}}')
+    write_file(tmp_path / "server.js", "const app = express();\napp.post('/notes', createNote);\n")
+    # A test callback followed by a long blank run backtracks quadratically in the test-block pattern.
+    write_file(tmp_path / "tests" / "notes.test.js", "it('lists notes', () => {" + "\n" * 50_000)
+    monkeypatch.setenv("AIRISK_FILE_CPU_BUDGET", "0.2")
+
+    snapshot = build_repo_snapshot(tmp_path)
+    bundle = collect_express_artifacts(tmp_path, snapshot=snapshot)
+
+    assert snapshot.skipped == {tmp_path / "tests" / "notes.test.js": "timeout"}
+    assert [row[3] for row in bundle.write_endpoints] == ["/notes"]
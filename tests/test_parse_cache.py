@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from ai_risk_manager.collectors import parse_cache
+from ai_risk_manager.collectors.parse_cache import (
+    clear_parse_cache,
+    load_source,
+    open_source_bytes,
+    reserve_parse_cache,
+)
+from ai_risk_manager.collectors.snapshot import build_repo_snapshot
+
+
+def test_load_source_reuses_unchanged_file_and_parses_once(tmp_path: Path, write_file) -> None:
+    module = tmp_path / "app" / "api.py"
+    write_file(module, "def handler():\n    return 1\n")
+
+    with patch("ai_risk_manager.collectors.parse_cache._parse_module", wraps=parse_cache._parse_module) as parse_mock:
+        first = load_source(module)
+        second = load_source(module)
+        assert first is second
+        assert first.lines == ["def handler():", "    return 1"]
+        assert first.tree is not None
+        assert second.tree is first.tree
+
+    assert parse_mock.call_count == 1
+
+
+def test_load_source_rereads_file_after_change(tmp_path: Path, write_file) -> None:
+    module = tmp_path / "api.py"
+    write_file(module, "VALUE = 1\n")
+    first = load_source(module)
+
+    write_file(module, "VALUE = 22\n")
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_source(module).text == "VALUE = 22\n"
+    assert first.text == "VALUE = 1\n"
+
+
+def test_load_source_handles_invalid_python_and_binary_files(tmp_path: Path, write_file) -> None:
+    broken = tmp_path / "broken.py"
+    write_file(broken, "def broken(:\n")
+    binary = tmp_path / "blob.py"
+    binary.write_bytes(b"\xff\xfe\x00")
+
+    assert load_source(broken).text == "def broken(:\n"
+    assert load_source(broken).tree is None
+    assert load_source(binary).text == ""
+    assert load_source(tmp_path / "missing.py").lines == []
+
+
+def test_parse_cache_respects_entry_limit(tmp_path: Path, write_file, monkeypatch) -> None:
+    clear_parse_cache()
+    monkeypatch.setenv("AIRISK_PARSE_CACHE_MAX_ENTRIES", "1")
+    write_file(tmp_path / "a.py", "A = 1\n")
+    write_file(tmp_path / "b.py", "B = 1\n")
+
+    first = load_source(tmp_path / "a.py")
+    load_source(tmp_path / "b.py")
+
+    assert load_source(tmp_path / "a.py") is not first
+    clear_parse_cache()
+
+
+def test_parse_cache_holds_every_snapshot_file(tmp_path: Path, write_file, monkeypatch) -> None:
+    clear_parse_cache()
+    monkeypatch.delenv("AIRISK_PARSE_CACHE_MAX_ENTRIES", raising=False)
+    monkeypatch.setattr(parse_cache, "_DEFAULT_MAX_ENTRIES", 1)
+    write_file(tmp_path / "a.py", "A = 1\n")
+    write_file(tmp_path / "b.py", "B = 1\n")
+
+    snapshot = build_repo_snapshot(tmp_path)
+    first = snapshot.source(tmp_path / "a.py")
+    snapshot.source(tmp_path / "b.py")
+    assert snapshot.source(tmp_path / "a.py") is first
+
+    monkeypatch.setenv("AIRISK_PARSE_CACHE_MAX_ENTRIES", "1")
+    reserve_parse_cache(3)
+    write_file(tmp_path / "c.py", "C = 1\n")
+    load_source(tmp_path / "c.py")
+    assert load_source(tmp_path / "a.py") is not first
+
+    monkeypatch.delenv("AIRISK_PARSE_CACHE_MAX_ENTRIES")
+    reserve_parse_cache(10**9)
+    assert parse_cache._max_entries() == parse_cache._MAX_RESERVED_ENTRIES
+    clear_parse_cache()
+    assert parse_cache._max_entries() == 1
+
+
+def test_snapshot_sources_share_process_cache(tmp_path: Path, write_file) -> None:
+    write_file(tmp_path / "service.py", "def run():\n    return 1\n")
+
+    first = build_repo_snapshot(tmp_path)
+    second = build_repo_snapshot(tmp_path)
+
+    assert first.parse_python(tmp_path / "service.py") is second.parse_python(tmp_path / "service.py")
+
+
+def test_load_source_skips_oversized_and_binary_files_with_reason(tmp_path: Path, write_file, monkeypatch) -> None:
+    monkeypatch.setenv("AIRISK_MAX_FILE_BYTES", "64")
+    write_file(tmp_path / "bundle.min.js", "var a=1;" * 20)
+    (tmp_path / "dump.py").write_bytes(b"DATA = 1\n\0\0binary")
+    (tmp_path / "legacy.py").write_bytes("NAME = 'caf\u00e9'\n".encode("latin-1"))
+    write_file(tmp_path / "small.py", "VALUE = 1\n")
+
+    snapshot = build_repo_snapshot(tmp_path)
+    for path in snapshot.files:
+        snapshot.source(path)
+
+    assert load_source(tmp_path / "bundle.min.js").skip_reason == "too_large"
+    assert load_source(tmp_path / "dump.py").text == ""
+    assert {snapshot.relative(path): reason for path, reason in snapshot.skipped.items()} == {
+        "bundle.min.js": "too_large",
+        "dump.py": "binary",
+        "legacy.py": "undecodable",
+    }
+    assert snapshot.read_text(tmp_path / "small.py") == "VALUE = 1\n"
+
+
+def test_load_source_decodes_byte_order_marks(tmp_path: Path) -> None:
+    (tmp_path / "bom.py").write_bytes(b"\xef\xbb\xbfVALUE = 1\r\n")
+    (tmp_path / "wide.py").write_text("WIDE = 2\n", encoding="utf-16")
+
+    assert load_source(tmp_path / "bom.py").lines == ["VALUE = 1"]
+    assert load_source(tmp_path / "bom.py").tree is not None
+    assert load_source(tmp_path / "wide.py").text == "WIDE = 2\n"
+
+
+def test_open_source_bytes_memory_maps_large_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(parse_cache, "_MMAP_MIN_BYTES", 16)
+    large = tmp_path / "server.js"
+    large.write_bytes(b"// padding\n" * 8 + b"const express = require('express');\n")
+    (tmp_path / "empty.js").write_bytes(b"")
+    (tmp_path / "image.js").write_bytes(b"\x89PNG\0\0" * 8)
+
+    with open_source_bytes(large) as content:
+        assert not isinstance(content, bytes)
+        assert content.find(b"require('express')") > 0
+    with open_source_bytes(tmp_path / "empty.js") as content:
+        assert content == b""
+    with open_source_bytes(tmp_path / "image.js") as content:
+        assert content == b""
+    with open_source_bytes(tmp_path / "missing.js") as content:
+        assert content == b""
@@ -51,3 +51,34 @@ def test_workloads_match_versioned_budget_file() -> None:
     assert {workload.name for workload in performance_suite.WORKLOADS} == set(budgets["workloads"])
     for workload in performance_suite.WORKLOADS:
         assert workload.file_count == budgets["workloads"][workload.name]["file_count"]
+
+
+def test_evaluate_budgets_flags_superlinear_adversarial_growth() -> None:
+    names = list(performance_suite.ADVERSARIAL_INPUTS)
+    report = {
+        "workloads": {},
+        "adversarial": {
+            names[0]: {"best_ms": [10.0, 180.0], "growth_ratio": 18.0},
+            names[1]: {"best_ms": [0.2, 3.0], "growth_ratio": 15.0},
+            **{name: {"best_ms": [10.0, 41.0], "growth_ratio": 4.1} for name in names[2:-1]},
+        },
+    }
+    budgets = {
+        "workloads": {},
+        "adversarial": {"base_size": 4000, "scale": 4, "max_growth_ratio": 8.0, "noise_floor_ms": 5.0},
+    }
+
+    errors = performance_suite.evaluate_budgets(report, budgets)
+
+    assert errors == [
+        f"adversarial {names[0]} grew 18.00x for a 4x larger input (limit 8.00x)",
+        f"missing adversarial result: {names[-1]}",
+    ]
+
+
+def test_adversarial_inputs_scan_in_linear_time() -> None:
+    budgets = performance_suite._load_budgets(performance_suite.DEFAULT_BUDGETS)["adversarial"]
+    report = {"workloads": {}, "adversarial": performance_suite.measure_adversarial(1000, budgets["scale"], 3)}
+
+    assert set(report["adversarial"]) == set(performance_suite.ADVERSARIAL_INPUTS)
+    assert performance_suite.evaluate_budgets(report, {"workloads": {}, "adversarial": budgets}) == []
@@ -1888,15 +1888,129 @@ def test_pipeline_reuses_probe_data_for_preflight(tmp_path: Path, write_file) ->
 
     from ai_risk_manager.collectors.plugins import fastapi as fastapi_plugin
 
+    with (
+        patch(
+            "ai_risk_manager.collectors.plugins.fastapi.scan_fastapi_signals",
+            wraps=fastapi_plugin.scan_fastapi_signals,
+        ) as scan_mock,
+        patch.object(
+            fastapi_plugin.FastAPICollectorPlugin,
+            "probe_observer",
+            autospec=True,
+            side_effect=fastapi_plugin.FastAPICollectorPlugin.probe_observer,
+        ) as observer_mock,
+    ):
+        result, code, _ = run_pipeline(ctx)
+
+    assert result is not None
+    assert code == 0
+    assert observer_mock.call_count == 1
+    assert scan_mock.call_count == 0
+
+
+def test_pipeline_discovers_repository_files_once(tmp_path: Path, write_file) -> None:
+    write_file(
+        tmp_path / "app" / "api.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return {'ok': True}\n",
+    )
+    write_file(tmp_path / "tests" / "test_orders.py", "import pytest\n\ndef test_smoke():\n    assert True\n")
+
+    ctx = RunContext(
+        repo_path=tmp_path,
+        mode="full",
+        base=None,
+        output_dir=tmp_path / ".riskmap",
+        provider="auto",
+        no_llm=True,
+    )
+
+    from ai_risk_manager.collectors import snapshot as snapshot_module
+
     with patch(
-        "ai_risk_manager.collectors.plugins.fastapi.scan_fastapi_signals",
-        wraps=fastapi_plugin.scan_fastapi_signals,
-    ) as scan_mock:
+        "ai_risk_manager.collectors.snapshot.iter_project_file_stats",
+        wraps=snapshot_module.iter_project_file_stats,
+    ) as discovery_mock:
         result, code, _ = run_pipeline(ctx)
 
     assert result is not None
     assert code == 0
-    assert scan_mock.call_count == 1
+    assert discovery_mock.call_count == 1
+
+
+def test_pipeline_parses_each_python_file_once(tmp_path: Path, write_file) -> None:
+    write_file(
+        tmp_path / "app" / "api.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return {'ok': True}\n",
+    )
+    write_file(tmp_path / "tests" / "test_orders.py", "import pytest\n\ndef test_smoke():\n    assert True\n")
+
+    ctx = RunContext(
+        repo_path=tmp_path,
+        mode="full",
+        base=None,
+        output_dir=tmp_path / ".riskmap",
+        provider="auto",
+        no_llm=True,
+    )
+
+    from ai_risk_manager.collectors import parse_cache
+
+    with patch("ai_risk_manager.collectors.parse_cache._parse_module", wraps=parse_cache._parse_module) as parse_mock:
+        result, code, _ = run_pipeline(ctx)
+
+    assert result is not None
+    assert code == 0
+    assert parse_mock.call_count == 2
+
+
+def test_pipeline_releases_parse_cache_when_run_ends(tmp_path: Path, write_file) -> None:
+    from ai_risk_manager.collectors import parse_cache
+
+    write_file(tmp_path / "app" / "api.py", "VALUE = 1\n")
+    ctx = RunContext(
+        repo_path=tmp_path,
+        mode="full",
+        base=None,
+        output_dir=tmp_path / ".riskmap",
+        provider="auto",
+        no_llm=True,
+    )
+
+    run_pipeline(ctx)
+
+    assert not parse_cache._CACHE
+    assert parse_cache._reserved_entries == 0
+
+
+def test_pipeline_reuses_artifact_cache_on_warm_run(tmp_path: Path, write_file) -> None:
+    repo_path = tmp_path / "repo"
+    write_file(
+        repo_path / "app" / "api.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return {'ok': True}\n",
+    )
+    write_file(repo_path / "tests" / "test_orders.py", "import pytest\n\ndef test_smoke():\n    assert True\n")
+
+    def _run() -> tuple[list[str], list[str]]:
+        ctx = RunContext(
+            repo_path=repo_path,
+            mode="full",
+            base=None,
+            output_dir=tmp_path / "out",
+            provider="auto",
+            no_llm=True,
+            cache_dir=tmp_path / "cache",
+        )
+        result, code, notes = run_pipeline(ctx)
+        assert result is not None
+        assert code == 0
+        return [finding.id for finding in result.findings.findings], notes
+
+    cold_findings, cold_notes = _run()
+    warm_findings, warm_notes = _run()
+
+    assert warm_findings == cold_findings
+    assert "Artifact cache: 0 cached extraction(s) reused, 2 recomputed." in cold_notes
+    assert "Artifact cache: 2 cached extraction(s) reused, 0 recomputed." in warm_notes
 
 
 def test_pipeline_reports_broken_invariant_on_unguarded_transition(tmp_path: Path, write_file) -> None:
@@ -2312,3 +2426,27 @@ def test_pipeline_tolerates_unexpected_severity_in_findings(tmp_path: Path, writ
     assert result is not None
     pr_summary = (tmp_path / ".riskmap" / "pr_summary.md").read_text(encoding="utf-8")
     assert "Unexpected severity from AI" in pr_summary
+
+
+def test_pipeline_notes_files_skipped_by_size_cap(tmp_path: Path, write_file, monkeypatch) -> None:
+    monkeypatch.setenv("AIRISK_MAX_FILE_BYTES", "512")
+    write_file(
+        tmp_path / "app" / "api.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return {'ok': True}\n",
+    )
+    write_file(tmp_path / "app" / "generated.py", "TABLE = [\n" + "    0,\n" * 200 + "]\n")
+    write_file(tmp_path / "tests" / "test_orders.py", "import pytest\n\ndef test_smoke():\n    assert True\n")
+
+    ctx = RunContext(
+        repo_path=tmp_path,
+        mode="full",
+        base=None,
+        output_dir=tmp_path / ".riskmap",
+        provider="auto",
+        no_llm=True,
+    )
+    result, code, notes = run_pipeline(ctx)
+
+    assert result is not None
+    assert code == 0
+    assert "Skipped 1 file(s) during collection (too_large: app/generated.py)." in notes
@@ -47,5 +47,5 @@ def test_render_plugin_scaffold_outputs_expected_class_signature() -> None:
     assert "class FlaskPytestCollectorPlugin(CapabilitySignalPluginMixin):" in rendered
     assert 'stack_id: Literal["flask_pytest"] = "flask_pytest"' in rendered
     assert 'target_support_level = "l1"' in rendered
-    assert "def collect(self, repo_path: Path) -> ArtifactBundle:" in rendered
+    assert "def collect(self, repo_path: Path, *, snapshot: RepoSnapshot | None = None) -> ArtifactBundle:" in rendered
 
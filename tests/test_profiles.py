@@ -275,3 +275,47 @@ def test_ui_flow_labels_nuxt_pages_and_components_without_extension_tokens(tmp_p
     assert assessment.changed_journeys == ["product/[slug]", "cartmodal"]
     assert "Review changed UI journeys: `product/[slug]`." in assessment.review_focus
     assert "Review shared UI components affecting: `cartmodal`." in assessment.review_focus
+
+
+def test_code_risk_multi_stack_collects_every_passing_stack(tmp_path: Path, write_file) -> None:
+    write_file(
+        tmp_path / "api" / "orders.py",
+        "from fastapi import APIRouter\n"
+        "router = APIRouter()\n"
+        "@router.post('/orders')\n"
+        "def create_order():\n"
+        "    return {'ok': True}\n",
+    )
+    write_file(tmp_path / "tests" / "test_orders.py", "import pytest\n\ndef test_create_order():\n    assert True\n")
+    write_file(
+        tmp_path / "web" / "server.js",
+        "const express = require('express');\n"
+        "const app = express();\n"
+        "app.post('/api/notes', (_req, res) => res.json({ ok: true }));\n",
+    )
+    detection = detect_stack(tmp_path)
+    assert [probe.stack_id for probe in detection.probes][:2] == ["fastapi_pytest", "express_node"]
+
+    profile = get_profile("code_risk")
+    assert profile is not None
+    ctx = RunContext(
+        repo_path=tmp_path,
+        mode="full",
+        base=None,
+        output_dir=tmp_path / ".riskmap",
+        provider="auto",
+        no_llm=True,
+        multi_stack=True,
+    )
+    notes: list[str] = []
+    prepared, exit_code = profile.prepare(ctx, notes, detection=detection)
+
+    assert exit_code is None
+    assert prepared is not None
+    assert [plugin.stack_id for plugin in prepared.extra_plugins] == ["express_node"]
+    assert any(note.startswith("Additional stack collected: express_node") for note in notes)
+
+    artifacts, signals = profile.collect(prepared, tmp_path)
+    assert {row[3] for row in artifacts.write_endpoints} >= {"/orders", "/api/notes"}
+    assert len(artifacts.all_files) == len({str(path) for path in artifacts.all_files})
+    assert signals.signals
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import ast
+
+from ai_risk_manager.collectors.python_ast_index import PythonModuleIndex
+
+_SOURCE = """
+class Service:
+    def handle(self, order):
+        if order.status == "new":
+            order.status = "paid"
+        def nested():
+            x = 1
+        return lambda: order
+
+
+def top(value):
+    y = [item for item in value]
+    z = value + 1
+    return z
+"""
+
+
+def test_module_index_lookups_follow_ast_walk_order() -> None:
+    tree = ast.parse(_SOURCE)
+    index = PythonModuleIndex(tree)
+    types = (ast.FunctionDef, ast.Assign, ast.Name)
+
+    assert index.nodes(*types) == [node for node in ast.walk(tree) if isinstance(node, types)]
+    handle = next(node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and node.name == "handle")
+    assert index.nodes(*types, within=handle) == [node for node in ast.walk(handle) if isinstance(node, types)]
+    assert index.nodes(ast.Try) == []
+    assert all(
+        index.parents[child] is node
+        for node in ast.walk(tree)
+        for child in ast.iter_child_nodes(node)
+        if not isinstance(child, ast.expr_context)
+    )
+
+
+def test_module_index_runtime_nodes_skip_nested_scopes_and_handle_deep_trees() -> None:
+    tree = ast.parse(_SOURCE)
+    index = PythonModuleIndex(tree)
+    handle = next(node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and node.name == "handle")
+
+    runtime = list(index.runtime_nodes(handle))[1:]
+    assert any(isinstance(node, ast.If) for node in runtime)
+    assert any(isinstance(node, ast.Return) for node in runtime)
+    assert not any(isinstance(node, (ast.FunctionDef, ast.Lambda)) for node in runtime)
+    assert not any(isinstance(node, ast.Constant) and node.value == 1 for node in runtime)
+
+    deep = ast.parse("total = " + " + ".join(["x"] * 900))
+    assert len(PythonModuleIndex(deep).nodes(ast.BinOp)) == 899
+
+
+def test_nodes_by_subtree_matches_per_root_lookups_including_nested_roots() -> None:
+    tree = ast.parse(_SOURCE)
+    index = PythonModuleIndex(tree)
+    roots = [node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.ClassDef))]
+    types = (ast.Assign, ast.Name, ast.Constant)
+
+    assert index.nodes_by_subtree(roots, *types) == [index.nodes(*types, within=root) for root in roots]
+    assert index.nodes_by_subtree(list(reversed(roots)), ast.Try) == [[] for _ in roots]
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
+import ai_risk_manager.rules.engine as engine
 from ai_risk_manager.collectors.plugins.base import ArtifactBundle
-from ai_risk_manager.graph.builder import build_graph
+from ai_risk_manager.graph.builder import GraphBuilder, build_graph
 from ai_risk_manager.rules.engine import run_rules
 from ai_risk_manager.schemas.types import to_dict
 from ai_risk_manager.signals.adapters import artifact_bundle_to_signal_bundle
+from ai_risk_manager.signals.merge import merge_signal_bundles
 from ai_risk_manager.signals.types import CapabilitySignal, SignalBundle
 
 
@@ -57,6 +61,124 @@ def test_rule_engine_accepts_signal_bundle_with_equivalent_output() -> None:
     assert to_dict(findings_from_graph) == to_dict(findings_from_signals)
 
 
+def test_graph_builder_merges_signal_deltas_like_a_rebuild() -> None:
+    signals = artifact_bundle_to_signal_bundle(_fixture_artifacts())
+    signals = SignalBundle(signals=[*signals.signals, signals.signals[0]], supported_kinds=signals.supported_kinds)
+    pr_delta = SignalBundle(
+        signals=[
+            CapabilitySignal(
+                id="pr:1",
+                kind="pr_change_risk",
+                source_ref="app/api.py:10",
+                confidence="medium",
+                evidence_refs=["app/api.py:10"],
+                attributes={"change_kind": "endpoint"},
+            )
+        ]
+    )
+    semantic_delta = SignalBundle(
+        signals=[
+            CapabilitySignal(
+                id="semantic:1",
+                kind="test_to_endpoint_coverage",
+                source_ref="tests/test_refund.py:4",
+                confidence="medium",
+                evidence_refs=["tests/test_refund.py:4"],
+                attributes={"test_name": "test_refund_order", "coverage_mode": "name_fallback_candidate"},
+                origin="ai",
+            )
+        ]
+    )
+
+    builder = GraphBuilder(signals)
+    assert to_dict(builder.graph()) == to_dict(build_graph(signals))
+
+    builder.merge(pr_delta)
+    merged = merge_signal_bundles(signals, pr_delta)
+    assert to_dict(builder.graph()) == to_dict(build_graph(merged))
+    assert to_dict(run_rules(builder.graph(), signals=merged)) == to_dict(run_rules(merged))
+
+    graph = builder.graph()
+    builder.merge(pr_delta)
+    assert builder.graph() is graph
+    builder.merge(semantic_delta)
+    assert to_dict(builder.graph()) == to_dict(build_graph(merge_signal_bundles(merged, semantic_delta)))
+
+
+def test_graph_builder_matches_test_calls_through_route_parameters_and_name_tokens() -> None:
+    graph = build_graph(
+        ArtifactBundle(
+            write_endpoints=[
+                ("app/api.py", "pay_order", "post", "/orders/{order_id}/pay", 1, ""),
+                ("app/api.py", "pay_invoice", "post", "/invoices/:id/pay", 2, ""),
+                ("app/api.py", "pay_latest", "post", "/orders/latest/pay", 3, ""),
+                ("app/api.py", "refund_order", "put", "/orders/{order_id}", 4, ""),
+            ],
+            test_cases=[
+                ("tests/test_pay.py", "test_pay_by_id", 1, ""),
+                ("tests/test_pay.py", "test_pay_latest", 2, ""),
+                ("tests/test_pay.py", "test_any_pay", 3, ""),
+                ("tests/test_refund.py", "test_refund_order_twice", 4, ""),
+            ],
+            test_http_calls=[
+                ("tests/test_pay.py", "test_pay_by_id", "POST", "/orders/42/pay/", 1, ""),
+                ("tests/test_pay.py", "test_pay_by_id", "POST", "/invoices/7/pay", 1, ""),
+                ("tests/test_pay.py", "test_pay_latest", "POST", "/orders/latest/pay", 2, ""),
+                ("tests/test_pay.py", "test_any_pay", "POST", "/{kind}/{id}/pay", 3, ""),
+                ("tests/test_refund.py", "test_refund_order_twice", "POST", "/orders/42", 4, ""),
+            ],
+        )
+    )
+
+    coverage = sorted(
+        (edge.source_node_id.rsplit(":", 1)[1], edge.target_node_id.rsplit(":", 1)[1], edge.confidence)
+        for edge in graph.edges
+        if edge.type == "covered_by"
+    )
+    assert coverage == [
+        ("test_any_pay", "pay_invoice", "high"),
+        ("test_any_pay", "pay_latest", "high"),
+        ("test_any_pay", "pay_order", "high"),
+        ("test_pay_by_id", "pay_invoice", "high"),
+        ("test_pay_by_id", "pay_order", "high"),
+        ("test_pay_latest", "pay_latest", "high"),
+        ("test_refund_order_twice", "refund_order", "medium"),
+    ]
+
+
+def test_signal_rules_receive_only_their_kinds_and_report_timings(monkeypatch) -> None:
+    signals = artifact_bundle_to_signal_bundle(_fixture_artifacts())
+    workflow_signal = CapabilitySignal(
+        id="sig-workflow",
+        kind="workflow_automation_risk",
+        source_ref=".github/workflows/ci.yml:4",
+        confidence="medium",
+        evidence_refs=[".github/workflows/ci.yml:4"],
+        attributes={"issue_type": "external_action_not_pinned", "owner_name": "checkout"},
+    )
+    signals.signals.append(workflow_signal)
+    received: dict[str, list[str]] = {}
+
+    def recording(name: str):
+        def run(bundle: SignalBundle) -> list:
+            received[name] = [signal.kind for signal in bundle.signals]
+            return []
+
+        return run
+
+    rules = tuple(replace(rule, run=recording(rule.name)) for rule in engine.SIGNAL_RULES)
+    monkeypatch.setattr(engine, "SIGNAL_RULES", rules)
+
+    timings: dict[str, float] = {}
+    run_rules(build_graph(signals), signals=signals, timings=timings)
+
+    assert received == {
+        "critical_write_missing_authz": ["http_write_surface"],
+        "workflow_automation_risk": ["workflow_automation_risk"],
+    }
+    assert set(timings) == {"graph", "critical_write_missing_authz", "workflow_automation_risk"}
+
+
 def test_critical_path_rule_uses_route_label_in_human_text() -> None:
     artifacts = ArtifactBundle(
         write_endpoints=[
@@ -36,3 +36,68 @@ def test_detect_stack_express_node_high_confidence(tmp_path: Path, write_file) -
     detected = detect_stack(tmp_path)
     assert detected.stack_id == "express_node"
     assert detected.confidence == "high"
+
+
+def test_stack_probes_parse_only_prefiltered_files_and_stop_when_saturated(
+    tmp_path: Path, write_file, monkeypatch
+) -> None:
+    from ai_risk_manager.collectors.plugins.django_artifacts import scan_django_signals
+    from ai_risk_manager.collectors.plugins.fastapi_artifacts import scan_fastapi_signals
+    from ai_risk_manager.collectors.snapshot import RepoSnapshot, build_repo_snapshot
+
+    write_file(tmp_path / "requirements.txt", "Django==5.0.1\nfastapi-users==13.0.0\n")
+    write_file(tmp_path / "a_settings.py", "from django.conf import settings\nfrom rest_framework import viewsets\n")
+    write_file(tmp_path / "b_helpers.py", "def add(a, b):\n    return a + b\n")
+    write_file(tmp_path / "c_tests.py", "def test_add():\n    assert True\n")
+    write_file(tmp_path / "shop" / "urls.py", "from django.urls import path\nurlpatterns = [path('orders/', view)]\n")
+    write_file(tmp_path / "z_late.py", "import pytest\n")
+
+    parsed: list[str] = []
+    original_parse = RepoSnapshot.parse_python
+
+    def recording_parse(self: RepoSnapshot, path: Path):
+        parsed.append(path.name)
+        return original_parse(self, path)
+
+    monkeypatch.setattr(RepoSnapshot, "parse_python", recording_parse)
+    snapshot = build_repo_snapshot(tmp_path)
+
+    django_signals = scan_django_signals(tmp_path, snapshot=snapshot)
+    assert (django_signals.has_django_import, django_signals.has_drf_import) == (True, True)
+    assert (django_signals.has_urlpatterns, django_signals.has_pytest) == (True, True)
+    assert django_signals.declared_in == "requirements.txt"
+    assert "b_helpers.py" not in parsed
+    assert "z_late.py" not in parsed
+
+    parsed.clear()
+    fastapi_signals = scan_fastapi_signals(tmp_path, snapshot=snapshot)
+    assert fastapi_signals.declared_in == ""
+    assert not fastapi_signals.has_fastapi_import
+    assert parsed == ["z_late.py"]
+
+
+def test_detect_stack_feeds_all_plugins_from_one_file_pass(tmp_path: Path, write_file, monkeypatch) -> None:
+    from ai_risk_manager.collectors import probe_prefilter
+
+    write_file(
+        tmp_path / "api" / "app.py",
+        "from fastapi import APIRouter\nrouter = APIRouter()\n@router.post('/orders')\ndef create_order():\n    return {}\n",
+    )
+    write_file(tmp_path / "api" / "helpers.py", "def add(a, b):\n    return a + b\n")
+    write_file(
+        tmp_path / "bff" / "server.js",
+        "const express = require('express');\nconst app = express();\napp.post('/api/notes', handler);\n",
+    )
+
+    opened: list[str] = []
+    original_open = probe_prefilter.open_source_bytes
+
+    def recording_open(path: Path):
+        opened.append(path.name)
+        return original_open(path)
+
+    monkeypatch.setattr(probe_prefilter, "open_source_bytes", recording_open)
+    detected = detect_stack(tmp_path)
+
+    assert detected.stack_id == "fastapi_pytest"
+    assert sorted(opened) == ["app.py", "helpers.py", "server.js"]